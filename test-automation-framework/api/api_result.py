@@ -0,0 +1,151 @@
+"""
+Parsed API result returned by API client methods
+"""
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple, Union
+from api.response_logging import parse_json
+
+_PATH_TOKEN = re.compile(r"\.?([^.\[\]]+)|\[(\*|-?\d+)\]|\['([^']*)'\]")
+_WILDCARD = object()
+
+@lru_cache(maxsize=256)
+def compile_path(path: str) -> Tuple[Union[str, int, object], ...]:
+    """
+    Split a JSONPath-style expression into keys, indexes and wildcards
+    
+    Supported: $.users[0].email, users[*].id, items[-1], $['odd key'].value
+    
+    Raises:
+        ValueError: If the expression cannot be parsed
+    """
+    expression = path.strip()
+    if expression.startswith('$'):
+        expression = expression[1:]
+    tokens = []
+    position = 0
+    while position < len(expression):
+        match = _PATH_TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Invalid path expression: {path}")
+        name, index, quoted = match.groups()
+        if index == '*':
+            tokens.append(_WILDCARD)
+        elif index is not None:
+            tokens.append(int(index))
+        else:
+            tokens.append(quoted if quoted is not None else name)
+        position = match.end()
+    return tuple(tokens)
+
+def _walk(value: Any, tokens: Tuple, default: Any) -> Any:
+    """Follow path tokens through parsed JSON, fanning out on wildcards"""
+    for position, token in enumerate(tokens):
+        if token is _WILDCARD:
+            if isinstance(value, dict):
+                items = list(value.values())
+            elif isinstance(value, list):
+                items = value
+            else:
+                return default
+            return [_walk(item, tokens[position + 1:], default) for item in items]
+        try:
+            value = value[token]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return value
+
+class APIResult(Mapping):
+    """
+    Result of an API call with a lazily decoded body
+    
+    The body is decoded at most once (with orjson when installed) and shared
+    with the client's logging and verify helpers. For compatibility with the
+    dictionaries the clients used to return, it also reads like one:
+    result['status_code'], result['data'], result.get('token').
+    
+    Attributes:
+        response: The underlying HTTP response
+        success_status: Status code for which data is populated
+    """
+    
+    def __init__(self, response, success_status: int = 200, include_data: bool = True):
+        """
+        Wrap an HTTP response
+        
+        Args:
+            response: requests or httpx response
+            success_status: Status code for which data holds the parsed body
+            include_data: False for calls whose data is always None (e.g. delete)
+        """
+        self.response = response
+        self.success_status = success_status
+        self.include_data = include_data
+        self._extras: Dict[str, Any] = {}
+    
+    @property
+    def status_code(self) -> int:
+        """HTTP status code"""
+        return self.response.status_code
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is the expected success status"""
+        return self.status_code == self.success_status
+    
+    @property
+    def body(self) -> Any:
+        """Parsed JSON body regardless of status (None if the body is not JSON)"""
+        try:
+            return parse_json(self.response)
+        except ValueError:
+            return None
+    
+    @property
+    def data(self) -> Any:
+        """Parsed JSON body for a successful call, None otherwise"""
+        if not self.include_data or not self.ok:
+            return None
+        return parse_json(self.response)
+    
+    def extract(self, path: str, default: Any = None) -> Any:
+        """
+        Get a value from the body with a JSONPath-style expression
+        
+        Args:
+            path: Expression such as '$.users[0].email' or 'users[*].id'
+            default: Value returned when the path does not exist
+        
+        Returns:
+            The value at path (a list for wildcard paths)
+        """
+        return _walk(self.body, compile_path(path), default)
+    
+    def extract_all(self, paths: List[str]) -> Dict[str, Any]:
+        """Get several values at once, keyed by path"""
+        return {path: self.extract(path) for path in paths}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'response':
+            return self.response
+        if key == 'status_code':
+            return self.status_code
+        if key == 'data':
+            return self.data
+        return self._extras[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in ('response', 'status_code', 'data'):
+            raise KeyError(f"'{key}' is read-only")
+        self._extras[key] = value
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from ('response', 'status_code', 'data')
+        yield from self._extras
+    
+    def __len__(self) -> int:
+        return 3 + len(self._extras)
+    
+    def __repr__(self) -> str:
+        return f"APIResult(status_code={self.status_code}, url={str(self.response.url)!r})"
@@ -0,0 +1,202 @@
+"""
+Async API client with the BaseAPI surface for high-concurrency API operations
+"""
+import asyncio
+import time
+import httpx
+import logging
+from typing import Dict, Any, Optional, Awaitable, Iterable, List
+from utility.common.logger import Logger
+from utility.common.config_reader import ConfigReader
+from api.base_api import notify_request_listeners
+from api.request_timing import AsyncRequestTrace
+from api.response_logging import parse_json, should_log_body, LazyHeaders, LazyResponseBody
+
+class AsyncBaseAPI:
+    """
+    Asyncio-based API client mirroring BaseAPI
+    
+    Requests share one httpx.AsyncClient whose connection pool is capped at
+    max_connections, so hundreds of requests can be awaited together without
+    opening hundreds of sockets. Unlike BaseAPI, per-request headers are sent
+    with that request only instead of being added to the shared client.
+    
+    Async requests do not go through the requests transport, so the http.retries
+    policy and http.cassette recording/replay do not apply to them: failed
+    requests are not retried, and scenarios replaying a cassette must not use
+    the async clients. Request listeners (API timings, load statistics) do see
+    async requests.
+    
+    Usage:
+        async with AsyncUserAPI() as api:
+            results = await api.gather(api.get_user(user_id) for user_id in user_ids)
+    """
+    
+    def __init__(self, max_connections: int = None):
+        """
+        Initialize async API client
+        
+        Args:
+            max_connections: Concurrent connections (config http.async_max_connections if None)
+        """
+        self.config = ConfigReader()
+        self.logger = Logger().get_logger()
+        self.base_url = self.config.get_api_base_url()
+        self.timeout = self.config.get_timeout()
+        self.max_connections = max_connections or self.config.get_config_value('http.async_max_connections', 100)
+        self.log_body_max_chars = self.config.get_config_value('http.log_body_max_chars', 2000)
+        self.log_body_sample_rate = self.config.get_config_value('http.log_body_sample_rate', 1.0)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections)
+        )
+        self._setup_default_headers()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the client and its connections"""
+        await self.client.aclose()
+    
+    def _setup_default_headers(self) -> None:
+        """Setup default headers for API requests"""
+        self.client.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': 'TestFramework/1.0'
+        })
+    
+    def set_auth_token(self, token: str) -> None:
+        """Set authentication token"""
+        self.client.headers.update({'Authorization': f'Bearer {token}'})
+        self.logger.info("Authentication token set")
+    
+    def set_api_key(self, api_key: str, header_name: str = 'X-API-Key') -> None:
+        """Set API key"""
+        self.client.headers.update({header_name: api_key})
+        self.logger.info(f"API key set in header: {header_name}")
+    
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request, log its response and report it to BaseAPI request listeners"""
+        self.logger.info(f"Making {method} request to: {self.base_url}{endpoint}")
+        trace = AsyncRequestTrace()
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, endpoint, extensions={'trace': trace}, **kwargs)
+        except httpx.HTTPError as e:
+            notify_request_listeners(method, endpoint, None, started, e)
+            raise
+        notify_request_listeners(method, endpoint, response.status_code, started, **trace.details(response))
+        self._log_response(response)
+        return response
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> httpx.Response:
+        """Make GET request"""
+        return await self._request('GET', endpoint, params=params, headers=headers)
+    
+    async def post(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
+                   headers: Optional[Dict] = None) -> httpx.Response:
+        """Make POST request"""
+        return await self._request('POST', endpoint, data=data, json=json_data, headers=headers)
+    
+    async def put(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
+                  headers: Optional[Dict] = None) -> httpx.Response:
+        """Make PUT request"""
+        return await self._request('PUT', endpoint, data=data, json=json_data, headers=headers)
+    
+    async def patch(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
+                    headers: Optional[Dict] = None) -> httpx.Response:
+        """Make PATCH request"""
+        return await self._request('PATCH', endpoint, data=data, json=json_data, headers=headers)
+    
+    async def delete(self, endpoint: str, headers: Optional[Dict] = None,
+                     json_data: Optional[Any] = None) -> httpx.Response:
+        """Make DELETE request"""
+        return await self._request('DELETE', endpoint, json=json_data, headers=headers)
+    
+    async def gather(self, requests: Iterable[Awaitable], return_exceptions: bool = False) -> List[Any]:
+        """
+        Await many requests concurrently, keeping their order
+        
+        Args:
+            requests: Coroutines such as api.get_user(...) calls
+            return_exceptions: Return exceptions in the result list instead of raising the first
+        
+        Returns:
+            Results in the same order as the requests
+        """
+        return await asyncio.gather(*requests, return_exceptions=return_exceptions)
+    
+    def _log_response(self, response: httpx.Response) -> None:
+        """Log response details"""
+        self.logger.info(f"Response Status: {response.status_code}")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        # Headers and body are only formatted if a handler writes the record
+        self.logger.debug("Response Headers: %s", LazyHeaders(response))
+        if should_log_body(response, self.log_body_sample_rate):
+            self.logger.debug("Response Body: %s", LazyResponseBody(response, self.log_body_max_chars))
+    
+    def verify_status_code(self, response: httpx.Response, expected_status: int) -> bool:
+        """Verify response status code"""
+        actual_status = response.status_code
+        if actual_status == expected_status:
+            self.logger.info(f"Status code verification passed: {actual_status}")
+            return True
+        else:
+            self.logger.error(f"Status code verification failed. Expected: {expected_status}, Actual: {actual_status}")
+            return False
+    
+    def verify_status_codes(self, responses: Iterable[httpx.Response], expected_status: int) -> List[httpx.Response]:
+        """
+        Verify the status code of many responses at once
+        
+        Returns:
+            Responses with a different status code (empty if all passed)
+        """
+        failed = [response for response in responses if response.status_code != expected_status]
+        if failed:
+            self.logger.error(f"Status code verification failed for {len(failed)} responses. "
+                              f"Expected: {expected_status}, Actual: {sorted({r.status_code for r in failed})}")
+        else:
+            self.logger.info(f"Status code verification passed for all responses: {expected_status}")
+        return failed
+    
+    def verify_response_contains(self, response: httpx.Response, key: str, expected_value: Any = None) -> bool:
+        """Verify response contains specific key and optionally value"""
+        try:
+            response_json = parse_json(response)
+            if key in response_json:
+                if expected_value is not None:
+                    actual_value = response_json[key]
+                    if actual_value == expected_value:
+                        self.logger.info(f"Response verification passed: {key} = {expected_value}")
+                        return True
+                    else:
+                        self.logger.error(f"Response verification failed: {key} = {actual_value}, expected: {expected_value}")
+                        return False
+                else:
+                    self.logger.info(f"Response contains key: {key}")
+                    return True
+            else:
+                self.logger.error(f"Response does not contain key: {key}")
+                return False
+        except ValueError:
+            self.logger.error("Response is not valid JSON")
+            return False
+    
+    def get_response_value(self, response: httpx.Response, key: str) -> Any:
+        """Get specific value from response"""
+        try:
+            response_json = parse_json(response)
+            return response_json.get(key)
+        except ValueError:
+            self.logger.error("Response is not valid JSON")
+            return None
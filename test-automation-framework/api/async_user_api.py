@@ -0,0 +1,89 @@
+"""
+Async User API client for concurrent user management operations
+"""
+from typing import Dict, Any, List
+from api.async_base_api import AsyncBaseAPI
+from api.api_result import APIResult
+
+class AsyncUserAPI(AsyncBaseAPI):
+    """Async User API client with the same operations as UserAPI"""
+    
+    def __init__(self, max_connections: int = None):
+        super().__init__(max_connections)
+        self.users_endpoint = "/api/v1/users"
+        self.auth_endpoint = "/api/v1/auth"
+    
+    async def create_user(self, user_data: Dict[str, Any]) -> APIResult:
+        """Create a new user"""
+        self.logger.info(f"Creating user: {user_data.get('email', 'N/A')}")
+        response = await self.post(self.users_endpoint, json_data=user_data)
+        return APIResult(response, 201)
+    
+    async def create_users(self, users: List[Dict[str, Any]]) -> List[APIResult]:
+        """Create many users concurrently, returning results in input order"""
+        return await self.gather(self.create_user(user_data) for user_data in users)
+    
+    async def get_user(self, user_id: str) -> APIResult:
+        """Get user by ID"""
+        self.logger.info(f"Getting user: {user_id}")
+        response = await self.get(f"{self.users_endpoint}/{user_id}")
+        return APIResult(response)
+    
+    async def get_users(self, user_ids: List[str]) -> List[APIResult]:
+        """Get many users concurrently, returning results in input order"""
+        return await self.gather(self.get_user(user_id) for user_id in user_ids)
+    
+    async def update_user(self, user_id: str, user_data: Dict[str, Any]) -> APIResult:
+        """Update user"""
+        self.logger.info(f"Updating user: {user_id}")
+        response = await self.put(f"{self.users_endpoint}/{user_id}", json_data=user_data)
+        return APIResult(response)
+    
+    async def delete_user(self, user_id: str) -> APIResult:
+        """Delete user"""
+        self.logger.info(f"Deleting user: {user_id}")
+        response = await self.delete(f"{self.users_endpoint}/{user_id}")
+        return APIResult(response, include_data=False)
+    
+    async def get_all_users(self, page: int = 1, limit: int = 10) -> APIResult:
+        """Get all users with pagination"""
+        self.logger.info(f"Getting all users - Page: {page}, Limit: {limit}")
+        response = await self.get(self.users_endpoint, params={'page': page, 'limit': limit})
+        return APIResult(response)
+    
+    async def login_user(self, email: str, password: str) -> APIResult:
+        """Login user and get authentication token"""
+        self.logger.info(f"Logging in user: {email}")
+        response = await self.post(f"{self.auth_endpoint}/login", json_data={'email': email, 'password': password})
+        result = APIResult(response)
+        
+        # Set auth token if login successful
+        if response.status_code == 200:
+            token = result['data'].get('token')
+            if token:
+                self.set_auth_token(token)
+                result['token'] = token
+        
+        return result
+    
+    async def logout_user(self) -> APIResult:
+        """Logout user"""
+        self.logger.info("Logging out user")
+        response = await self.post(f"{self.auth_endpoint}/logout")
+        return APIResult(response, include_data=False)
+    
+    async def search_users(self, search_term: str) -> APIResult:
+        """Search users by name or email"""
+        self.logger.info(f"Searching users: {search_term}")
+        response = await self.get(f"{self.users_endpoint}/search", params={'search': search_term})
+        return APIResult(response)
+    
+    async def change_password(self, user_id: str, old_password: str, new_password: str) -> APIResult:
+        """Change user password"""
+        self.logger.info(f"Changing password for user: {user_id}")
+        password_data = {
+            'old_password': old_password,
+            'new_password': new_password
+        }
+        response = await self.patch(f"{self.users_endpoint}/{user_id}/password", json_data=password_data)
+        return APIResult(response)
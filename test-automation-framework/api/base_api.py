@@ -1,23 +1,105 @@
 """
 Base API client with common functionality for all API operations
 """
+import copy
+import re
+import time
 import requests
-import json
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any, Callable, List, Optional
 from utility.common.logger import Logger
 from utility.common.config_reader import ConfigReader
+from api.response_logging import parse_json, should_log_body, LazyHeaders, LazyResponseBody
+from api.http_transport import create_session, get_http_settings
+from api.request_timing import request_details, start_request
+
+# Path segments that identify one resource (numbers, UUIDs, long hex such as ObjectIds, and
+# long base64-ish tokens with at least one digit, so readable slugs stay part of the template)
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+                         r'|[0-9a-fA-F]{16,}|(?=[A-Za-z_-]*\d)[A-Za-z0-9_-]{24,})$')
+
+def endpoint_template(endpoint: str) -> str:
+    """Group concrete endpoints for reporting: /api/v1/users/123?x=1 -> /api/v1/users/{id}"""
+    path = endpoint.split('?', 1)[0]
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+# Callables receiving a timing event after every request (see BaseAPI.add_request_listener)
+_request_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+def notify_request_listeners(method: str, endpoint: str, status_code: Optional[int], started: float,
+                             error: Exception = None, **details) -> None:
+    """
+    Pass a request timing event to every request listener
+    
+    Args:
+        method: HTTP method
+        endpoint: Endpoint as requested (reported with its template too)
+        status_code: Response status, None if the request failed
+        started: time.perf_counter() value when the request was sent
+        error: Exception the request failed with
+        **details: Phases and sizes (ttfb_ms, connect_ms, tls_ms, bytes_sent, bytes_received)
+    
+    A listener raising an exception is logged and skipped, so it cannot fail
+    the request or keep the other listeners from seeing the event.
+    """
+    if not _request_listeners:
+        return
+    event = {
+        'method': method,
+        'endpoint': endpoint,
+        'template': endpoint_template(endpoint),
+        'status_code': status_code,
+        'elapsed_ms': (time.perf_counter() - started) * 1000,
+        'error': f"{type(error).__name__}: {error}" if error else None,
+        **details,
+    }
+    for listener in list(_request_listeners):
+        try:
+            listener(event)
+        except Exception as e:
+            Logger().get_logger().error(f"Request listener {getattr(listener, '__qualname__', listener)} "
+                                        f"failed: {type(e).__name__}: {e}")
 
 class BaseAPI:
-    """Base API client containing common API operations"""
+    """
+    Base API client containing common API operations
+    
+    Each client has its own session (and headers), but all sessions share one
+    connection pool per host with retry and backoff for idempotent requests,
+    configured in the http section of config.yaml.
+    
+    Request listeners (add_request_listener) are called after every request
+    with its method, endpoint template, status code, duration and, where
+    available, connect/TLS/first-byte times and transferred bytes, e.g. to
+    collect load test statistics or the API timing report.
+    """
     
     def __init__(self):
         self.config = ConfigReader()
         self.logger = Logger().get_logger()
         self.base_url = self.config.get_api_base_url()
-        self.timeout = self.config.get_timeout()
-        self.session = requests.Session()
+        self.timeout = (get_http_settings(self.config)['connect_timeout'],
+                        self.config.get_config_value('timeouts.api_request', self.config.get_timeout()))
+        self.session = create_session(self.config)
+        self.log_body_max_chars = self.config.get_config_value('http.log_body_max_chars', 2000)
+        self.log_body_sample_rate = self.config.get_config_value('http.log_body_sample_rate', 1.0)
         self._setup_default_headers()
     
+    def thread_client(self) -> 'BaseAPI':
+        """
+        Copy of this client with its own session, for use by one worker thread
+        
+        requests.Session is not thread-safe, so worker threads (bulk calls,
+        paginator prefetch) do not share self.session. The copy starts with
+        this session's headers and cookies and still sends through the shared
+        connection pools.
+        """
+        client = copy.copy(self)
+        client.session = create_session(self.config)
+        client.session.headers.update(self.session.headers)
+        client.session.cookies.update(self.session.cookies)
+        return client
+    
     def _setup_default_headers(self) -> None:
         """Setup default headers for API requests"""
         self.session.headers.update({
@@ -44,9 +126,7 @@ class BaseAPI:
         if headers:
             self.session.headers.update(headers)
         
-        response = self.session.get(url, params=params, timeout=self.timeout)
-        self._log_response(response)
-        return response
+        return self._send('GET', endpoint, params=params)
     
     def post(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None, 
              headers: Optional[Dict] = None) -> requests.Response:
@@ -57,9 +137,7 @@ class BaseAPI:
         if headers:
             self.session.headers.update(headers)
         
-        response = self.session.post(url, data=data, json=json_data, timeout=self.timeout)
-        self._log_response(response)
-        return response
+        return self._send('POST', endpoint, data=data, json=json_data)
     
     def put(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
             headers: Optional[Dict] = None) -> requests.Response:
@@ -70,9 +148,7 @@ class BaseAPI:
         if headers:
             self.session.headers.update(headers)
         
-        response = self.session.put(url, data=data, json=json_data, timeout=self.timeout)
-        self._log_response(response)
-        return response
+        return self._send('PUT', endpoint, data=data, json=json_data)
     
     def patch(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
               headers: Optional[Dict] = None) -> requests.Response:
@@ -83,11 +159,10 @@ class BaseAPI:
         if headers:
             self.session.headers.update(headers)
         
-        response = self.session.patch(url, data=data, json=json_data, timeout=self.timeout)
-        self._log_response(response)
-        return response
+        return self._send('PATCH', endpoint, data=data, json=json_data)
     
-    def delete(self, endpoint: str, headers: Optional[Dict] = None) -> requests.Response:
+    def delete(self, endpoint: str, headers: Optional[Dict] = None,
+               json_data: Optional[Any] = None) -> requests.Response:
         """Make DELETE request"""
         url = f"{self.base_url}{endpoint}"
         self.logger.info(f"Making DELETE request to: {url}")
@@ -95,20 +170,44 @@ class BaseAPI:
         if headers:
             self.session.headers.update(headers)
         
-        response = self.session.delete(url, timeout=self.timeout)
+        return self._send('DELETE', endpoint, json=json_data)
+    
+    @classmethod
+    def add_request_listener(cls, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call listener with a timing event after every request of every client"""
+        global _request_listeners
+        _request_listeners = _request_listeners + [listener]
+    
+    @classmethod
+    def remove_request_listener(cls, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Stop calling a listener added with add_request_listener"""
+        global _request_listeners
+        _request_listeners = [item for item in _request_listeners if item is not listener]
+    
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request, log its response and report it to request listeners"""
+        start_request()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{endpoint}", timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            notify_request_listeners(method, endpoint, None, started, e)
+            raise
+        if _request_listeners:
+            notify_request_listeners(method, endpoint, response.status_code, started, **request_details(response))
         self._log_response(response)
         return response
     
     def _log_response(self, response: requests.Response) -> None:
         """Log response details"""
         self.logger.info(f"Response Status: {response.status_code}")
-        self.logger.debug(f"Response Headers: {dict(response.headers)}")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         
-        try:
-            response_json = response.json()
-            self.logger.debug(f"Response Body: {json.dumps(response_json, indent=2)}")
-        except ValueError:
-            self.logger.debug(f"Response Body (text): {response.text}")
+        # Headers and body are only formatted if a handler writes the record
+        self.logger.debug("Response Headers: %s", LazyHeaders(response))
+        if should_log_body(response, self.log_body_sample_rate):
+            self.logger.debug("Response Body: %s", LazyResponseBody(response, self.log_body_max_chars))
     
     def verify_status_code(self, response: requests.Response, expected_status: int) -> bool:
         """Verify response status code"""
@@ -123,7 +222,7 @@ class BaseAPI:
     def verify_response_contains(self, response: requests.Response, key: str, expected_value: Any = None) -> bool:
         """Verify response contains specific key and optionally value"""
         try:
-            response_json = response.json()
+            response_json = parse_json(response)
             if key in response_json:
                 if expected_value is not None:
                     actual_value = response_json[key]
@@ -146,7 +245,7 @@ class BaseAPI:
     def get_response_value(self, response: requests.Response, key: str) -> Any:
         """Get specific value from response"""
         try:
-            response_json = response.json()
+            response_json = parse_json(response)
             return response_json.get(key)
         except ValueError:
             self.logger.error("Response is not valid JSON")
@@ -0,0 +1,236 @@
+"""
+Record/replay of API traffic in an on-disk cassette store
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODES = ('passthrough', 'record', 'replay')
+DEFAULT_MATCH_HEADERS = ('Accept', 'Authorization', 'X-API-Key')
+
+# Dropped from recorded responses: the stored body is already decoded and complete
+_SKIPPED_RESPONSE_HEADERS = ('content-encoding', 'transfer-encoding', 'connection', 'keep-alive')
+
+_stores: Dict[str, 'CassetteStore'] = {}
+_stores_lock = threading.Lock()
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no recorded response"""
+
+def normalize_url(url: str) -> str:
+    """Sort query parameters so equivalent URLs share a key"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ''))
+
+def normalize_body(body) -> bytes:
+    """Serialize JSON bodies canonically; other bodies are used as sent"""
+    if body is None:
+        return b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        return body
+
+def request_key(method: str, url: str, body, headers, match_headers: Iterable[str]) -> str:
+    """
+    Build the lookup key of a request
+    
+    Args:
+        method: HTTP method
+        url: Full request URL
+        body: Request body (bytes, str or None)
+        headers: Request headers
+        match_headers: Header names that distinguish otherwise equal requests
+    
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode('utf-8'))
+    digest.update(normalize_url(url).encode('utf-8'))
+    digest.update(normalize_body(body))
+    for name in sorted(name.lower() for name in match_headers):
+        digest.update(f"{name}:{headers.get(name, '')}".encode('utf-8'))
+    return digest.hexdigest()
+
+class CassetteStore:
+    """
+    SQLite store of recorded responses with zlib-compressed bodies
+    
+    Recordings are grouped into cassettes (one per scenario), and a request
+    made several times within a cassette keeps one recording per occurrence,
+    so a GET before and after an update replays both answers in order.
+    
+    Parallel workers record into the same file: the database runs in WAL mode
+    so readers do not block the writer, and a busy database is waited on for
+    up to busy_timeout seconds instead of failing with "database is locked".
+    """
+    
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        """
+        Open (or create) a cassette store
+        
+        Args:
+            path: SQLite database file path
+            busy_timeout: Seconds to wait for another process's write to finish
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS recordings (
+                cassette TEXT NOT NULL,
+                request_key TEXT NOT NULL,
+                occurrence INTEGER NOT NULL,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                reason TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                recorded_at TEXT,
+                PRIMARY KEY (cassette, request_key, occurrence)
+            )
+        """)
+        self.lock = threading.Lock()
+        self.cassette = 'default'
+        self._occurrences: Dict[str, int] = {}
+    
+    def use_cassette(self, name: str) -> None:
+        """Switch to a cassette and restart its occurrence counting"""
+        with self.lock:
+            self.cassette = name
+            self._occurrences = {}
+    
+    def next_occurrence(self, key: str) -> Tuple[str, int]:
+        """Get the current cassette and how many times this request was seen in it"""
+        with self.lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            return self.cassette, occurrence
+    
+    def save(self, cassette: str, key: str, occurrence: int, response: requests.Response) -> None:
+        """Store a live response"""
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in _SKIPPED_RESPONSE_HEADERS}
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (cassette, key, occurrence, response.request.method, response.url, response.status_code,
+                 response.reason, json.dumps(headers), zlib.compress(response.content),
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+    
+    def load(self, cassette: str, key: str, occurrence: int) -> Optional[tuple]:
+        """
+        Find a recording, falling back to the last one of a request seen fewer times
+        
+        Returns:
+            (status, reason, headers, body) or None if the request was never recorded
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT status, reason, headers, body FROM recordings "
+                "WHERE cassette = ? AND request_key = ? AND occurrence <= ? "
+                "ORDER BY occurrence DESC LIMIT 1",
+                (cassette, key, occurrence)
+            ).fetchone()
+        if row is None:
+            return None
+        status, reason, headers, body = row
+        return status, reason, json.loads(headers), zlib.decompress(body)
+    
+    def clear(self, cassette: str = None) -> None:
+        """Delete the recordings of one cassette, or all of them"""
+        with self.lock, self.connection:
+            if cassette is None:
+                self.connection.execute("DELETE FROM recordings")
+            else:
+                self.connection.execute("DELETE FROM recordings WHERE cassette = ?", (cassette,))
+
+def get_cassette_store(path: str) -> CassetteStore:
+    """Get the process-wide store for a database file"""
+    path = os.path.abspath(path)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = CassetteStore(path)
+        return _stores[path]
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter that records or replays the traffic of another adapter
+    
+    Modes:
+        passthrough: Send every request live
+        record: Send live and store the response (replacing older recordings)
+        replay: Answer from the store only; unknown requests raise CassetteMissError
+    """
+    
+    def __init__(self, adapter: BaseAdapter, store: CassetteStore, mode: str = 'replay',
+                 match_headers: Iterable[str] = DEFAULT_MATCH_HEADERS):
+        """
+        Wrap a transport adapter
+        
+        Args:
+            adapter: Adapter that sends live requests (the shared pooled adapter)
+            store: Cassette store to record into or replay from
+            mode: passthrough, record or replay
+            match_headers: Request headers that are part of the lookup key
+        """
+        super().__init__()
+        if mode not in MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode} (expected one of {', '.join(MODES)})")
+        self.adapter = adapter
+        self.store = store
+        self.mode = mode
+        self.match_headers = tuple(match_headers)
+    
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.mode == 'passthrough':
+            return self.adapter.send(request, **kwargs)
+        
+        key = request_key(request.method, request.url, request.body, request.headers, self.match_headers)
+        cassette, occurrence = self.store.next_occurrence(key)
+        if self.mode == 'record':
+            response = self.adapter.send(request, **kwargs)
+            self.store.save(cassette, key, occurrence, response)
+            return response
+        
+        recording = self.store.load(cassette, key, occurrence)
+        if recording is None:
+            raise CassetteMissError(f"No recording of {request.method} {request.url} in cassette '{cassette}'",
+                                    request=request)
+        return self._build_response(request, *recording)
+    
+    def _build_response(self, request: requests.PreparedRequest, status: int, reason: str,
+                        headers: Dict[str, str], body: bytes) -> requests.Response:
+        """Turn a recording into a response as requests would have returned it"""
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(0)
+        return response
+    
+    def close(self) -> None:
+        # The wrapped adapter is shared between sessions and closed with them (close_shared_adapters)
+        pass
@@ -0,0 +1,167 @@
+"""
+Shared HTTP transport for API clients: pooled connections with retry and backoff
+"""
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, Tuple
+from utility.common.config_reader import ConfigReader
+from api.cassette import CassetteAdapter, DEFAULT_MATCH_HEADERS, get_cassette_store
+from api.request_timing import TimedHTTPAdapter
+
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+DEFAULT_RETRY_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+_adapters: Dict[Tuple, HTTPAdapter] = {}
+_lock = threading.Lock()
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with jittered exponential backoff and a bounded Retry-After
+    
+    Backoff doubles with every failed attempt (backoff_factor * 2 ** n), is
+    capped at max_backoff and then spread by +/- jitter so clients retrying
+    the same outage do not hit the server in lockstep. A Retry-After header
+    sent with 429/503 is honoured instead of the backoff, up to
+    max_retry_after seconds.
+    """
+    
+    def __init__(self, *args, jitter: float = 0.5, max_backoff: float = 30.0,
+                 max_retry_after: float = 60.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+    
+    def new(self, **kwargs) -> 'JitteredRetry':
+        retry = super().new(**kwargs)
+        retry.jitter = self.jitter
+        retry.max_backoff = self.max_backoff
+        retry.max_retry_after = self.max_retry_after
+        return retry
+    
+    def get_backoff_time(self) -> float:
+        backoff = min(self.max_backoff, super().get_backoff_time())
+        if backoff <= 0:
+            return 0
+        return backoff * random.uniform(1 - self.jitter, 1 + self.jitter)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+def get_http_settings(config: ConfigReader = None) -> Dict[str, Any]:
+    """
+    Read the http section of the configuration with defaults filled in
+    
+    Args:
+        config: Configuration reader (the current one if None)
+    
+    Returns:
+        Dictionary of pool, keep-alive and retry settings
+    """
+    config = config or ConfigReader()
+    value = config.get_config_value
+    return {
+        'pool_connections': value('http.pool_connections', 10),
+        'pool_maxsize': value('http.pool_maxsize', 20),
+        'pool_block': value('http.pool_block', False),
+        'keep_alive': value('http.keep_alive', True),
+        'connect_timeout': value('http.connect_timeout', 10),
+        'retries': value('http.retries.total', 3),
+        'backoff_factor': value('http.retries.backoff_factor', 0.5),
+        'max_backoff': value('http.retries.max_backoff', 30),
+        'jitter': value('http.retries.jitter', 0.5),
+        'max_retry_after': value('http.retries.max_retry_after', 60),
+        'status_forcelist': tuple(value('http.retries.status_forcelist', DEFAULT_RETRY_STATUSES)),
+        'allowed_methods': tuple(method.upper() for method in
+                                 value('http.retries.allowed_methods', DEFAULT_RETRY_METHODS)),
+        'cassette_mode': value('http.cassette.mode', 'passthrough'),
+        'cassette_path': value('http.cassette.path', 'reports/cassettes/api_cassettes.db'),
+        'cassette_match_headers': tuple(value('http.cassette.match_headers', DEFAULT_MATCH_HEADERS)),
+    }
+
+def build_retry(settings: Dict[str, Any]) -> JitteredRetry:
+    """Create the retry policy described by http settings"""
+    return JitteredRetry(
+        total=settings['retries'],
+        connect=settings['retries'],
+        read=settings['retries'],
+        status=settings['retries'],
+        backoff_factor=settings['backoff_factor'],
+        status_forcelist=settings['status_forcelist'],
+        allowed_methods=frozenset(settings['allowed_methods']),
+        respect_retry_after_header=True,
+        # Hand the last response back instead of raising, so status code checks still report it
+        raise_on_status=False,
+        jitter=settings['jitter'],
+        max_backoff=settings['max_backoff'],
+        max_retry_after=settings['max_retry_after'],
+    )
+
+def get_shared_adapter(settings: Dict[str, Any]) -> HTTPAdapter:
+    """
+    Get the process-wide adapter for these settings
+    
+    The adapter owns the connection pools, so every session mounting it
+    reuses the same keep-alive sockets. Headers stay on each session, so
+    one client's auth token is never sent by another. New connections
+    record their connect and TLS times (see api.request_timing).
+    """
+    key = tuple(sorted((name, value) for name, value in settings.items() if not name.startswith('cassette_')))
+    with _lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = TimedHTTPAdapter(
+                pool_connections=settings['pool_connections'],
+                pool_maxsize=settings['pool_maxsize'],
+                pool_block=settings['pool_block'],
+                max_retries=build_retry(settings)
+            )
+            _adapters[key] = adapter
+        return adapter
+
+def create_session(config: ConfigReader = None) -> requests.Session:
+    """
+    Create a session that sends its requests through the shared adapter
+    
+    Args:
+        config: Configuration reader (the current one if None)
+    
+    Returns:
+        New requests session with its own headers and the shared connection pools,
+        recording or replaying its traffic when http.cassette.mode asks for it
+    """
+    settings = get_http_settings(config)
+    adapter = get_shared_adapter(settings)
+    if settings['cassette_mode'] != 'passthrough':
+        adapter = CassetteAdapter(adapter, get_cassette_store(settings['cassette_path']),
+                                  settings['cassette_mode'], settings['cassette_match_headers'])
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not settings['keep_alive']:
+        session.headers['Connection'] = 'close'
+    return session
+
+def use_cassette(name: str, config: ConfigReader = None) -> None:
+    """
+    Record into / replay from the named cassette (e.g. one per scenario)
+    
+    Does nothing in passthrough mode.
+    """
+    settings = get_http_settings(config)
+    if settings['cassette_mode'] != 'passthrough':
+        get_cassette_store(settings['cassette_path']).use_cassette(name)
+
+def close_shared_adapters() -> None:
+    """Close every shared connection pool (e.g. at the end of a run)"""
+    with _lock:
+        for adapter in _adapters.values():
+            adapter.close()
+        _adapters.clear()
+
@@ -0,0 +1,159 @@
+"""
+Lazy paginator that streams items from list endpoints
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from api.api_result import APIResult
+
+ITEM_KEYS = ('items', 'data', 'results')
+CURSOR_KEYS = ('next_cursor', 'cursor', 'next')
+
+class Paginator:
+    """
+    Iterates over every item of a paginated list endpoint, one page at a time
+    
+    The next page is found from, in order of preference:
+        1. A Link header with rel="next"
+        2. A cursor in the body (next_cursor, cursor or next), sent back as ?cursor=
+        3. page/limit parameters, stopping at a short or empty page
+    
+    While the caller works through one page, the next one is already being
+    fetched in the background, on a copy of the client with its own session
+    (api.thread_client()), so the caller may keep using the client meanwhile.
+    The page size grows when pages come back faster than target_seconds and
+    shrinks when they are slower, within min/max_page_size.
+    
+    Usage:
+        for user in UserAPI().iter_users():
+            assert user['email']
+    """
+    
+    def __init__(self, api, endpoint: str, items_key: str = None, params: Optional[Dict[str, Any]] = None,
+                 page_size: int = None, min_page_size: int = 10, max_page_size: int = None,
+                 target_seconds: float = None, prefetch: bool = True, max_items: int = None):
+        """
+        Initialize paginator
+        
+        Args:
+            api: BaseAPI client used for the requests
+            endpoint: List endpoint, e.g. /api/v1/users
+            items_key: Body key holding the items (list bodies are used as is)
+            params: Extra query parameters sent with every page
+            page_size: First page size (config http.page_size if None)
+            min_page_size: Smallest page size adaptation may pick
+            max_page_size: Largest page size adaptation may pick (config http.max_page_size if None)
+            target_seconds: Response time to aim for (config http.target_page_seconds if None)
+            prefetch: Fetch the next page in the background
+            max_items: Stop after this many items
+        """
+        config = api.config
+        self.api = api
+        self.endpoint = endpoint
+        self.items_key = items_key
+        self.params = dict(params or {})
+        self.page_size = page_size or config.get_config_value('http.page_size', 50)
+        self.min_page_size = min(min_page_size, self.page_size)
+        self.max_page_size = max(max_page_size or config.get_config_value('http.max_page_size', 500), self.page_size)
+        self.target_seconds = target_seconds or config.get_config_value('http.target_page_seconds', 0.5)
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self.pages_fetched = 0
+        self.items_seen = 0
+    
+    def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]], api=None) -> Tuple[APIResult, float]:
+        """Get one page and how long it took"""
+        started = time.perf_counter()
+        result = APIResult((api or self.api).get(endpoint, params=params))
+        elapsed = time.perf_counter() - started
+        if not result.ok:
+            raise RuntimeError(f"Page request to {endpoint} failed with status {result.status_code}")
+        return result, elapsed
+    
+    def _items(self, body: Any) -> List[Any]:
+        """Get the items of a page body"""
+        if isinstance(body, list):
+            return body
+        if not isinstance(body, dict):
+            return []
+        for key in ((self.items_key,) if self.items_key else ()) + ITEM_KEYS:
+            if isinstance(body.get(key), list):
+                return body[key]
+        return []
+    
+    def _adapt(self, size: int, elapsed: float, offset: int) -> int:
+        """Pick the next page size from the last response time"""
+        if elapsed < self.target_seconds / 2:
+            candidate = min(size * 2, self.max_page_size)
+        elif elapsed > self.target_seconds * 2:
+            candidate = max(size // 2, self.min_page_size)
+        else:
+            return size
+        # page/limit addressing needs the items seen so far to be a whole number of pages
+        return candidate if offset % candidate == 0 else size
+    
+    def _relative(self, url: str) -> str:
+        """Turn a Link header URL into an endpoint for the API client"""
+        if url.startswith(self.api.base_url):
+            return url[len(self.api.base_url):]
+        parts = urlsplit(url)
+        return f"{parts.path}?{parts.query}" if parts.query else parts.path
+    
+    def _next_request(self, result: APIResult, items: List[Any], size: int, elapsed: float,
+                      page: int, offset: int) -> Optional[Tuple[str, Optional[Dict[str, Any]], int, int]]:
+        """Work out the request for the page after this one (None at the end)"""
+        link = getattr(result.response, 'links', {}).get('next')
+        if link:
+            return self._relative(link['url']), None, page + 1, size
+        
+        body = result.body
+        if isinstance(body, dict):
+            cursor = next((body[key] for key in CURSOR_KEYS if isinstance(body.get(key), (str, int))), None)
+            if cursor not in (None, ''):
+                size = self._adapt(size, elapsed, 0)
+                return self.endpoint, {**self.params, 'cursor': cursor, 'limit': size}, page + 1, size
+            if any(key in body for key in CURSOR_KEYS):
+                return None
+            total_pages = body.get('total_pages')
+            if total_pages is not None and page >= total_pages:
+                return None
+        
+        if len(items) < size:
+            return None
+        size = self._adapt(size, elapsed, offset)
+        next_page = offset // size + 1
+        return self.endpoint, {**self.params, 'page': next_page, 'limit': size}, next_page, size
+    
+    def pages(self) -> Iterator[APIResult]:
+        """Yield each page result in order"""
+        size = self.page_size
+        request = (self.endpoint, {**self.params, 'page': 1, 'limit': size}, 1, size)
+        offset = 0
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        # The prefetch thread must not share the caller's (non thread-safe) session
+        prefetch_api = self.api.thread_client() if executor else None
+        pending = executor.submit(self._fetch, *request[:2], prefetch_api) if executor else None
+        try:
+            while request:
+                result, elapsed = pending.result() if executor else self._fetch(*request[:2])
+                _, _, page, size = request
+                items = self._items(result.body)
+                offset += len(items)
+                self.pages_fetched += 1
+                request = self._next_request(result, items, size, elapsed, page, offset) if items else None
+                if request and executor:
+                    pending = executor.submit(self._fetch, *request[:2], prefetch_api)
+                yield result
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Yield every item across all pages"""
+        for result in self.pages():
+            for item in self._items(result.body):
+                if self.max_items is not None and self.items_seen >= self.max_items:
+                    return
+                self.items_seen += 1
+                yield item
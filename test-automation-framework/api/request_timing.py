@@ -0,0 +1,140 @@
+"""
+Per-request timing phases (connect, TLS, time to first byte) and transferred bytes
+"""
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from typing import Dict, Any, Optional
+
+# Connection phases of the request the current thread is sending
+_phases = threading.local()
+
+def start_request() -> None:
+    """Forget the connection phases of the thread's previous request"""
+    _phases.connect_ms = None
+    _phases.tls_ms = None
+
+def _add_phase(name: str, elapsed_ms: float) -> None:
+    """Add to a phase (a request retried on new connections connects more than once)"""
+    current = getattr(_phases, name, None)
+    setattr(_phases, name, elapsed_ms if current is None else current + elapsed_ms)
+
+class _TimedConnectMixin:
+    """Records how long opening the socket took (name resolution included)"""
+    
+    _connect_ms = 0.0
+    
+    def _new_conn(self):
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._connect_ms = (time.perf_counter() - started) * 1000
+            _add_phase('connect_ms', self._connect_ms)
+
+class TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    """HTTP connection recording its connect time"""
+
+class TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    """HTTPS connection recording its connect and TLS handshake times"""
+    
+    def connect(self) -> None:
+        started = time.perf_counter()
+        self._connect_ms = 0.0
+        super().connect()
+        _add_phase('tls_ms', (time.perf_counter() - started) * 1000 - self._connect_ms)
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose new connections record their connect and TLS times
+    
+    Requests sent on a reused keep-alive connection have no connect or TLS
+    phase, which is how pool reuse shows up in the timings.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+def _body_size(body) -> int:
+    """Length of a request body (0 for streamed or missing bodies)"""
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(body) if isinstance(body, (bytes, bytearray)) else 0
+
+def request_details(response: requests.Response) -> Dict[str, Any]:
+    """
+    Collect the timing phases and sizes of a response sent by the current thread
+    
+    Args:
+        response: Response of a request sent after start_request()
+    
+    Returns:
+        Dictionary with ttfb_ms, connect_ms and tls_ms (None when not measured,
+        e.g. on a reused connection or a replayed recording), bytes_sent and
+        bytes_received (body bytes as transferred, before decompression)
+    """
+    raw = response.raw
+    return {
+        # requests stops its clock once the headers are read, before the body is downloaded
+        'ttfb_ms': response.elapsed.total_seconds() * 1000 if raw is not None else None,
+        'connect_ms': getattr(_phases, 'connect_ms', None),
+        'tls_ms': getattr(_phases, 'tls_ms', None),
+        'bytes_sent': _body_size(response.request.body),
+        'bytes_received': raw.tell() if raw is not None else len(response.content),
+    }
+
+class AsyncRequestTrace:
+    """
+    httpx trace extension recording the phases of one async request
+    
+    Pass an instance as extensions={'trace': trace} and read details() once
+    the response was received.
+    """
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.connect_ms: Optional[float] = None
+        self.tls_ms: Optional[float] = None
+        self.ttfb_ms: Optional[float] = None
+        self._marks: Dict[str, float] = {}
+    
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        step, _, state = event_name.rpartition('.')
+        if state == 'started':
+            self._marks[step] = now
+            return
+        if state != 'complete' or step not in self._marks:
+            return
+        
+        elapsed_ms = (now - self._marks.pop(step)) * 1000
+        if step.endswith('.connect_tcp'):
+            self.connect_ms = (self.connect_ms or 0) + elapsed_ms
+        elif step.endswith('.start_tls'):
+            self.tls_ms = (self.tls_ms or 0) + elapsed_ms
+        elif step.endswith('.receive_response_headers') and self.ttfb_ms is None:
+            self.ttfb_ms = (now - self.started) * 1000
+    
+    def details(self, response) -> Dict[str, Any]:
+        """Timing phases and sizes of the traced request, like request_details()"""
+        content = response.request.content if hasattr(response.request, '_content') else b''
+        return {
+            'ttfb_ms': self.ttfb_ms,
+            'connect_ms': self.connect_ms,
+            'tls_ms': self.tls_ms,
+            'bytes_sent': len(content),
+            'bytes_received': response.num_bytes_downloaded,
+        }
@@ -0,0 +1,78 @@
+"""
+Scenario-scoped registry of created test resources and their teardown
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+from utility.common.logger import Logger
+
+class ResourceRegistry:
+    """
+    Tracks resources created during a scenario so they can be removed afterwards
+    
+    Resources are grouped by their bulk cleanup callable (e.g. a client's
+    delete_users), so teardown issues one bulk call per group, with all
+    groups running in parallel.
+    
+    Usage:
+        context.resource_registry.add(context.user_api.delete_users, user_id)
+        ...
+        context.resource_registry.teardown()   # in after_scenario
+    """
+    
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize an empty registry
+        
+        Args:
+            max_workers: Cleanup groups torn down at the same time
+        """
+        self.logger = Logger().get_logger()
+        self.max_workers = max_workers
+        self._resources: Dict[Callable[[List[Any]], Any], List[Any]] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, bulk_cleanup: Callable[[List[Any]], Any], *resource_ids: Any) -> None:
+        """
+        Register resources for teardown
+        
+        Args:
+            bulk_cleanup: Callable removing a list of resources by ID
+            resource_ids: IDs of the created resources
+        """
+        with self._lock:
+            self._resources.setdefault(bulk_cleanup, []).extend(resource_ids)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(ids) for ids in self._resources.values())
+    
+    def _cleanup(self, bulk_cleanup: Callable[[List[Any]], Any], resource_ids: List[Any]) -> bool:
+        try:
+            bulk_cleanup(resource_ids)
+            return True
+        except Exception as e:
+            self.logger.error(f"Teardown of {len(resource_ids)} resources failed: {str(e)}")
+            return False
+    
+    def teardown(self) -> int:
+        """
+        Remove every registered resource and empty the registry
+        
+        Failures are logged rather than raised, so one broken cleanup does not
+        hide the scenario result or block the other groups.
+        
+        Returns:
+            Number of resources whose cleanup call completed
+        """
+        with self._lock:
+            groups = list(self._resources.items())
+            self._resources.clear()
+        if not groups:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+            outcomes = list(executor.map(lambda group: self._cleanup(*group), groups))
+        removed = sum(len(ids) for (_, ids), done in zip(groups, outcomes) if done)
+        self.logger.info(f"Teardown removed {removed} of {sum(len(ids) for _, ids in groups)} resources")
+        return removed
@@ -0,0 +1,72 @@
+"""
+Response body helpers: cached JSON parsing and deferred, size-bounded log formatting
+"""
+import json
+import random
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_PARSED_ATTR = '_parsed_json'
+_UNPARSED = object()
+_NOT_JSON = object()
+
+def parse_json(response) -> Any:
+    """
+    Parse a response body as JSON once and cache it on the response
+    
+    Works for requests and httpx responses. Later calls (logging, step
+    assertions, value lookups) reuse the parsed body. Uses orjson when it
+    is installed.
+    
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    parsed = getattr(response, _PARSED_ATTR, _UNPARSED)
+    if parsed is _UNPARSED:
+        try:
+            parsed = orjson.loads(response.content) if orjson else response.json()
+        except ValueError:
+            parsed = _NOT_JSON
+        setattr(response, _PARSED_ATTR, parsed)
+    if parsed is _NOT_JSON:
+        raise ValueError("Response is not valid JSON")
+    return parsed
+
+class LazyResponseBody:
+    """
+    Log argument that formats a response body only when a handler writes it
+    
+    Pass it as a %s argument (logger.debug("Response Body: %s", body)); if no
+    handler takes the record, the body is never parsed or pretty-printed.
+    Output longer than max_chars is cut off with a note of what was dropped.
+    """
+    
+    def __init__(self, response, max_chars: int = 2000):
+        self.response = response
+        self.max_chars = max_chars
+    
+    def __str__(self) -> str:
+        try:
+            body = json.dumps(parse_json(self.response), indent=2)
+        except ValueError:
+            body = f"(text) {self.response.text}"
+        if self.max_chars and len(body) > self.max_chars:
+            return f"{body[:self.max_chars]}... ({len(body) - self.max_chars} more characters)"
+        return body
+
+class LazyHeaders:
+    """Log argument that copies response headers into a dict only when written"""
+    
+    def __init__(self, response):
+        self.response = response
+    
+    def __str__(self) -> str:
+        return str(dict(self.response.headers))
+
+def should_log_body(response, sample_rate: float) -> bool:
+    """Log every error body, and a sample_rate share of the successful ones"""
+    return response.status_code >= 400 or sample_rate >= 1 or random.random() < sample_rate
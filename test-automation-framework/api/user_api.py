@@ -1,72 +1,86 @@
 """
 User API client for user-related operations
 """
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from api.base_api import BaseAPI
+from api.api_result import APIResult
+from api.resource_registry import ResourceRegistry
+from api.paginator import Paginator
+
+# Statuses meaning the server has no batch endpoint
+BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
 
 class UserAPI(BaseAPI):
     """User API client with user-specific operations"""
     
+    # Whether each API base URL has a batch endpoint, learned on first use (see reset_batch_support)
+    _batch_support: Dict[str, bool] = {}
+    
     def __init__(self):
         super().__init__()
         self.users_endpoint = "/api/v1/users"
         self.auth_endpoint = "/api/v1/auth"
+        self.batch_endpoint = f"{self.users_endpoint}/batch"
+        self.bulk_batch_size = self.config.get_config_value('http.bulk_batch_size', 100)
+        self.bulk_workers = self.config.get_config_value('http.bulk_workers', 10)
     
-    def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_user(self, user_data: Dict[str, Any]) -> APIResult:
         """Create a new user"""
         self.logger.info(f"Creating user: {user_data.get('email', 'N/A')}")
         response = self.post(self.users_endpoint, json_data=user_data)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 201 else None
-        }
+        return APIResult(response, 201)
     
-    def get_user(self, user_id: str) -> Dict[str, Any]:
+    def get_user(self, user_id: str) -> APIResult:
         """Get user by ID"""
         self.logger.info(f"Getting user: {user_id}")
         endpoint = f"{self.users_endpoint}/{user_id}"
         response = self.get(endpoint)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
+        return APIResult(response)
     
-    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> APIResult:
         """Update user"""
         self.logger.info(f"Updating user: {user_id}")
         endpoint = f"{self.users_endpoint}/{user_id}"
         response = self.put(endpoint, json_data=user_data)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
+        return APIResult(response)
     
-    def delete_user(self, user_id: str) -> Dict[str, Any]:
+    def delete_user(self, user_id: str) -> APIResult:
         """Delete user"""
         self.logger.info(f"Deleting user: {user_id}")
         endpoint = f"{self.users_endpoint}/{user_id}"
         response = self.delete(endpoint)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': None
-        }
+        return APIResult(response, include_data=False)
     
-    def get_all_users(self, page: int = 1, limit: int = 10) -> Dict[str, Any]:
+    def get_all_users(self, page: int = 1, limit: int = 10) -> APIResult:
         """Get all users with pagination"""
         self.logger.info(f"Getting all users - Page: {page}, Limit: {limit}")
         params = {'page': page, 'limit': limit}
         response = self.get(self.users_endpoint, params=params)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
+        return APIResult(response)
     
-    def login_user(self, email: str, password: str) -> Dict[str, Any]:
+    def iter_users(self, page_size: int = None, search_term: str = None, max_items: int = None) -> Paginator:
+        """
+        Iterate over all users without loading them at once
+        
+        Pages are requested lazily, with the next one prefetched and the page
+        size adapted to response time (see Paginator).
+        
+        Args:
+            page_size: First page size (config http.page_size if None)
+            search_term: Only users matching this name or email
+            max_items: Stop after this many users
+        
+        Returns:
+            Paginator yielding user records
+        """
+        self.logger.info(f"Iterating users{f' matching: {search_term}' if search_term else ''}")
+        endpoint = f"{self.users_endpoint}/search" if search_term else self.users_endpoint
+        params = {'search': search_term} if search_term else None
+        return Paginator(self, endpoint, items_key='users', params=params, page_size=page_size, max_items=max_items)
+    
+    def login_user(self, email: str, password: str) -> APIResult:
         """Login user and get authentication token"""
         self.logger.info(f"Logging in user: {email}")
         login_data = {
@@ -76,45 +90,33 @@ class UserAPI(BaseAPI):
         endpoint = f"{self.auth_endpoint}/login"
         response = self.post(endpoint, json_data=login_data)
         
-        result = {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
+        result = APIResult(response)
         
         # Set auth token if login successful
         if response.status_code == 200:
-            token = response.json().get('token')
+            token = result.data.get('token')
             if token:
                 self.set_auth_token(token)
                 result['token'] = token
         
         return result
     
-    def logout_user(self) -> Dict[str, Any]:
+    def logout_user(self) -> APIResult:
         """Logout user"""
         self.logger.info("Logging out user")
         endpoint = f"{self.auth_endpoint}/logout"
         response = self.post(endpoint)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': None
-        }
+        return APIResult(response, include_data=False)
     
-    def search_users(self, search_term: str) -> Dict[str, Any]:
+    def search_users(self, search_term: str) -> APIResult:
         """Search users by name or email"""
         self.logger.info(f"Searching users: {search_term}")
         params = {'search': search_term}
         endpoint = f"{self.users_endpoint}/search"
         response = self.get(endpoint, params=params)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
+        return APIResult(response)
     
-    def change_password(self, user_id: str, old_password: str, new_password: str) -> Dict[str, Any]:
+    def change_password(self, user_id: str, old_password: str, new_password: str) -> APIResult:
         """Change user password"""
         self.logger.info(f"Changing password for user: {user_id}")
         password_data = {
@@ -123,8 +125,119 @@ class UserAPI(BaseAPI):
         }
         endpoint = f"{self.users_endpoint}/{user_id}/password"
         response = self.patch(endpoint, json_data=password_data)
-        return {
-            'response': response,
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None
-        }
\ No newline at end of file
+        return APIResult(response)
+    
+    @classmethod
+    def reset_batch_support(cls) -> None:
+        """Forget which servers have a batch endpoint, so the next batch call probes again"""
+        cls._batch_support.clear()
+    
+    def _batch_supported(self, result: APIResult) -> bool:
+        """
+        Record whether a batch request reached a batch endpoint
+        
+        Until a batch call has succeeded against this server, only a 2xx
+        answer counts as support: a server without a batch route may match
+        /users/batch as /users/{id} and answer 400 or 422 (invalid id).
+        """
+        known = UserAPI._batch_support.get(self.base_url)
+        if known:
+            supported = result.status_code not in BATCH_UNSUPPORTED_STATUSES
+        else:
+            supported = 200 <= result.status_code < 300
+        if not supported and known is not False:
+            self.logger.info(f"No batch endpoint (status {result.status_code}), falling back to concurrent requests")
+        UserAPI._batch_support[self.base_url] = supported
+        return supported
+    
+    def _run_concurrently(self, method_name: str, items: List[Any]) -> List[APIResult]:
+        """Call the named method for every item, one client per worker thread, keeping order"""
+        clients = threading.local()
+        
+        def call(item: Any) -> APIResult:
+            if not hasattr(clients, 'client'):
+                clients.client = self.thread_client()
+            return getattr(clients.client, method_name)(item)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.bulk_workers, len(items)))) as executor:
+            return list(executor.map(call, items))
+    
+    def create_users(self, users: List[Dict[str, Any]],
+                     registry: Optional[ResourceRegistry] = None) -> Dict[str, Any]:
+        """
+        Create many users, in batches when the server has a batch endpoint
+        
+        Batches of http.bulk_batch_size users are posted to the batch endpoint.
+        If the server does not have one, the users are created with concurrent
+        single requests instead (http.bulk_workers at a time).
+        
+        Args:
+            users: User data for each user to create
+            registry: Scenario resource registry to register created users with for teardown
+        
+        Returns:
+            Dictionary with created user records, failed user data and the underlying results
+        """
+        self.logger.info(f"Creating {len(users)} users")
+        created, failed, results = [], [], []
+        pending = list(users)
+        
+        while pending and UserAPI._batch_support.get(self.base_url, True):
+            chunk = pending[:self.bulk_batch_size]
+            result = APIResult(self.post(self.batch_endpoint, json_data={'users': chunk}), 201)
+            if not self._batch_supported(result):
+                break
+            results.append(result)
+            pending = pending[len(chunk):]
+            if result.status_code in (200, 201):
+                records = result.body
+                created.extend(records.get('users', []) if isinstance(records, dict) else records or [])
+            else:
+                failed.extend(chunk)
+        
+        if pending:
+            single_results = self._run_concurrently('create_user', pending)
+            results.extend(single_results)
+            for user_data, result in zip(pending, single_results):
+                if result.ok:
+                    created.append(result.data)
+                else:
+                    failed.append(user_data)
+        
+        if registry is not None:
+            registry.add(self.delete_users, *[user['id'] for user in created if 'id' in user])
+        self.logger.info(f"Created {len(created)} users, {len(failed)} failed")
+        return {'created': created, 'failed': failed, 'results': results}
+    
+    def delete_users(self, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        Delete many users, in batches when the server has a batch endpoint
+        
+        Args:
+            user_ids: IDs of the users to delete
+        
+        Returns:
+            Dictionary with deleted IDs, failed IDs and the underlying results
+        """
+        self.logger.info(f"Deleting {len(user_ids)} users")
+        deleted, failed, results = [], [], []
+        pending = list(user_ids)
+        
+        while pending and UserAPI._batch_support.get(self.base_url, True):
+            chunk = pending[:self.bulk_batch_size]
+            result = APIResult(self.delete(self.batch_endpoint, json_data={'ids': chunk}), include_data=False)
+            if not self._batch_supported(result):
+                break
+            results.append(result)
+            pending = pending[len(chunk):]
+            (deleted if result.status_code in (200, 204) else failed).extend(chunk)
+        
+        if pending:
+            single_results = self._run_concurrently('delete_user', pending)
+            results.extend(single_results)
+            for user_id, result in zip(pending, single_results):
+                (deleted if result.status_code in (200, 204) else failed).append(user_id)
+        
+        if failed:
+            self.logger.warning(f"Failed to delete {len(failed)} users: {failed}")
+        return {'deleted': deleted, 'failed': failed, 'results': results}
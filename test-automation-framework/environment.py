@@ -8,6 +8,70 @@ from playwright.sync_api import sync_playwright
 from utility.common.logger import Logger
 from utility.common.config_reader import ConfigReader
 from utility.common.screenshot_helper import ScreenshotHelper
+from utility.common.browser_pool import BrowserContextPool
+from utility.common.auth_session_cache import AuthSessionCache
+from api.http_transport import close_shared_adapters, use_cassette
+from api.resource_registry import ResourceRegistry
+from api.base_api import BaseAPI
+from api.user_api import UserAPI
+from utility.execution.api_timing_report import APITimingReport, DEFAULT_BUCKETS_MS, attach_to_report
+from pages.ui.login_page import LoginPage
+from pages.ui.dashboard_page import DashboardPage
+
+def _login_via_ui(page, credentials):
+    """Log in through the login page and wait for the dashboard"""
+    login_page = LoginPage(page)
+    login_page.navigate_to(f"{ConfigReader().get_base_url()}/login")
+    login_page.login(credentials['username'], credentials['password'])
+    page.wait_for_load_state('networkidle')
+    if not DashboardPage(page).is_dashboard_loaded():
+        raise RuntimeError(f"Login failed for {credentials.get('username')}: dashboard not loaded")
+
+def _authenticated_credential_type(scenario):
+    """Get the credential type a scenario asks to start logged in with, if any"""
+    for tag in scenario.effective_tags:
+        if tag == 'authenticated':
+            return 'standard_user'
+        if tag.startswith('authenticated:'):
+            return tag.split(':', 1)[1]
+    return None
+
+def _open_authenticated_page(context, credential_type):
+    """Open a context logged in from the session cache and go to the dashboard"""
+    for attempt in range(2):
+        storage_state = context.auth_cache.get_storage_state(credential_type)
+        if hasattr(context, 'context_pool'):
+            context.browser_context, context.page = context.context_pool.acquire(storage_state=storage_state)
+        else:
+            context.browser_context = context.browser.new_context(viewport=context.viewport, storage_state=storage_state)
+            context.page = context.browser_context.new_page()
+        
+        context.dashboard_page = DashboardPage(context.page)
+        context.dashboard_page.navigate_to(f"{context.config.get_base_url()}/dashboard")
+        if context.dashboard_page.is_dashboard_loaded() or attempt:
+            return
+        
+        # The server no longer accepts the cached session; log in again
+        context.logger.warning(f"Cached session for {credential_type} was rejected, logging in again")
+        context.auth_cache.invalidate(credential_type)
+        _close_browser_context(context, discard=True)
+
+def _close_browser_context(context, discard=False):
+    """Return the scenario's context to the pool, or close it"""
+    if hasattr(context, 'context_pool'):
+        context.context_pool.release(context.browser_context, discard=discard)
+    else:
+        context.browser_context.close()
+
+def _write_api_timings(context):
+    """Write the run's API timings as a Prometheus text file (one per parallel worker)"""
+    path = context.config.get_config_value('reporting.api_timings.prometheus_file', 'reports/metrics/api_timings.prom')
+    worker_id = os.getenv('TEST_WORKER_ID')
+    if worker_id:
+        root, extension = os.path.splitext(path)
+        path = f"{root}_worker{worker_id}{extension}"
+    buckets_ms = context.config.get_config_value('reporting.api_timings.buckets_ms', DEFAULT_BUCKETS_MS)
+    context.logger.info(f"API timings written to {context.api_timings.write_prometheus(path, buckets_ms)}")
 
 def before_all(context):
     """Setup before all tests"""
@@ -15,10 +79,16 @@ def before_all(context):
     context.logger = Logger().get_logger()
     context.logger.info("Starting test execution")
     
-    # Load configuration
+    # Load configuration, with behave -D userdata (e.g. -D browser=firefox) overriding the file
+    ConfigReader.set_overrides(context.config.userdata)
     context.config = ConfigReader()
     context.env = context.config.get_environment()
     
+    # Time every API request, per scenario and per endpoint
+    if context.config.get_config_value('reporting.api_timings.enabled', True):
+        context.api_timings = APITimingReport()
+        BaseAPI.add_request_listener(context.api_timings.on_request)
+    
     # Initialize screenshot helper
     context.screenshot_helper = ScreenshotHelper()
     
@@ -39,23 +109,62 @@ def before_all(context):
         context.browser = context.playwright.chromium.launch(headless=headless)
     
     context.logger.info(f"Browser {browser_name} initialized in {'headless' if headless else 'headed'} mode")
+    
+    # Warm browser contexts reused across scenarios
+    window_size = context.config.get_config_value('browser.window_size', {})
+    context.viewport = {"width": window_size.get('width', 1920), "height": window_size.get('height', 1080)}
+    if context.config.get_config_value('browser.context_pool.enabled', False):
+        context.context_pool = BrowserContextPool(
+            context.browser,
+            size=context.config.get_config_value('browser.context_pool.size', 2),
+            max_uses=context.config.get_config_value('browser.context_pool.max_uses', 20),
+            context_options={"viewport": context.viewport}
+        )
+    
+    # Logged-in sessions for @authenticated scenarios, saved once per credential set
+    if context.config.get_config_value('auth_cache.enabled', False):
+        context.auth_cache = AuthSessionCache(
+            context.browser,
+            login=_login_via_ui,
+            ttl_seconds=context.config.get_config_value('auth_cache.ttl_minutes', 30) * 60,
+            context_options={"viewport": context.viewport}
+        )
 
 def after_all(context):
     """Cleanup after all tests"""
+    if hasattr(context, 'context_pool'):
+        context.context_pool.close()
     if hasattr(context, 'browser'):
         context.browser.close()
     if hasattr(context, 'playwright'):
         context.playwright.stop()
+    close_shared_adapters()
+    if hasattr(context, 'api_timings'):
+        BaseAPI.remove_request_listener(context.api_timings.on_request)
+        _write_api_timings(context)
     context.logger.info("Test execution completed")
 
 def before_scenario(context, scenario):
     """Setup before each scenario"""
     context.logger.info(f"Starting scenario: {scenario.name}")
     
-    # Create new page for each scenario
-    if hasattr(context, 'browser'):
+    # Resources created through the APIs are registered here and removed after the scenario
+    context.resource_registry = ResourceRegistry()
+    
+    # Each scenario records into / replays from its own cassette (http.cassette.mode)
+    use_cassette(f"{scenario.feature.filename}::{scenario.name}")
+    if hasattr(context, 'api_timings'):
+        context.api_timings.start_scenario()
+    
+    # Check out a clean context and page for each scenario
+    credential_type = _authenticated_credential_type(scenario)
+    if credential_type and hasattr(context, 'auth_cache'):
+        _open_authenticated_page(context, credential_type)
+    elif hasattr(context, 'context_pool'):
+        context.browser_context, context.page = context.context_pool.acquire()
+    elif hasattr(context, 'browser'):
         context.page = context.browser.new_page()
-        context.page.set_viewport_size({"width": 1920, "height": 1080})
+        context.page.set_viewport_size(context.viewport)
 
 def after_scenario(context, scenario):
     """Cleanup after each scenario"""
@@ -66,9 +175,25 @@ def after_scenario(context, scenario):
             f"failed_{scenario.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
         context.logger.error(f"Scenario failed. Screenshot saved: {screenshot_path}")
+        ScreenshotHelper.attach_to_report(context._runner.formatters, screenshot_path)
+    
+    # Remove users and other resources the scenario created
+    if hasattr(context, 'resource_registry'):
+        context.resource_registry.teardown()
+    # Probe for the batch endpoint again in the next scenario (the server may have been redeployed)
+    UserAPI.reset_batch_support()
+    
+    # Add the scenario's API timings (teardown included) to the JSON/HTML reports
+    if hasattr(context, 'api_timings'):
+        timings = context.api_timings.finish_scenario(scenario.name)
+        if timings['requests']:
+            attach_to_report(context._runner.formatters, timings)
+            context.logger.info(f"API timings:\n{APITimingReport.format_summary(timings)}")
     
-    # Close page
-    if hasattr(context, 'page'):
+    # Return the context to the pool (replacing it after a failure), or close the page
+    if hasattr(context, 'browser_context'):
+        _close_browser_context(context, discard=scenario.status == "failed")
+    elif hasattr(context, 'page'):
         context.page.close()
     
     context.logger.info(f"Completed scenario: {scenario.name} - Status: {scenario.status}")
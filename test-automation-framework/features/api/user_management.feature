@@ -80,6 +80,11 @@ Feature: User Management API
     Then the response status code should be 200
     And the response should contain a list of users
 
+  @api @user @functionality
+  Scenario: Iterate over all users page by page
+    When I iterate over all users
+    Then every listed user should have an id and email
+
   @api @user @security
   Scenario: Change user password
     Given I am authenticated as an admin user
@@ -87,6 +92,16 @@ Feature: User Management API
     When I send a PATCH request to change password for user "123"
     Then the response status code should be 200
 
+  @api @user @concurrency
+  Scenario: Create many users concurrently
+    When I create 50 users concurrently
+    Then every response status code should be 201
+
+  @api @user @bulk
+  Scenario: Seed many users in bulk
+    Given 200 users exist
+    Then all seeded users should be created
+
   @api @user @authorization @negative
   Scenario: Unauthorized access to protected endpoint
     Given I have a User API client
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Odoo Inventory Benchmark
+Measures OdooInventoryFetcher throughput, call latency, memory and round-trips against the fake Odoo server
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+import requests
+
+from odoo_fake_server import FakeOdooDataset, FakeOdooServer
+from odoo_inventory_fetcher import OdooInventoryFetcher
+
+# Bumped when a change to the harness or fake server makes earlier result files incomparable
+# (2: the fake server stopped stalling keep-alive calls on Nagle/delayed ACK, ~40 ms per call)
+HARNESS_VERSION = 2
+
+
+def _serve(products: int, seed: int, latency_ms: float, max_concurrency: int, port_queue) -> None:
+    """Run a fake Odoo server in its own process and report its port"""
+    server = FakeOdooServer(dataset=FakeOdooDataset(products, seed), latency_ms=latency_ms,
+                            max_concurrency=max_concurrency)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Get a percentile of a list of values (None if empty)"""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[int(percent) - 1]
+
+
+def _peak_rss_mb() -> float:
+    """
+    Peak resident set size in MiB of the current process or its largest finished child
+
+    Process executors fetch in child processes, so their peak counts too
+    (the largest single child, not the sum of all of them).
+    """
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_case(url: str, database: str, case: Dict[str, Any], result_queue) -> None:
+    """Run one benchmark case in a fresh process so peak RSS belongs to this case alone"""
+    fetcher = OdooInventoryFetcher(url, 'benchmark', database, pool_size=max(case['workers'], 1))
+    with contextlib.redirect_stdout(io.StringIO()):
+        fetcher.authenticate()
+    fetcher.transport.call_durations = []
+    calls_before = requests.get(f"{url}/fake/stats").json()['calls']
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        products = fetcher.fetch_products(limit=None, batch_size=case['batch_size'],
+                                          workers=case['workers'], executor=case['executor'])
+        quants = fetcher.fetch_stock_quants(limit=None, batch_size=case['batch_size'],
+                                            workers=case['workers'], executor=case['executor'])
+    elapsed = time.perf_counter() - started
+    calls_after_fetch = requests.get(f"{url}/fake/stats").json()['calls']
+
+    summary_started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fetcher.get_inventory_summary(refresh=True)
+    summary_elapsed = time.perf_counter() - summary_started
+
+    summary_calls = requests.get(f"{url}/fake/stats").json()['calls'] - calls_after_fetch
+    records = len(products) + len(quants)
+    # Process workers call Odoo from child processes, so only thread runs have per-call timings
+    durations = sorted(fetcher.transport.call_durations) if case['executor'] == 'thread' else []
+    result_queue.put({
+        **case,
+        'records': records,
+        'seconds': round(elapsed, 4),
+        'records_per_sec': round(records / elapsed, 1) if elapsed > 0 else 0.0,
+        'summary_seconds': round(summary_elapsed, 4),
+        'p50_call_ms': round(_percentile(durations, 50) * 1000, 2) if durations else None,
+        'p95_call_ms': round(_percentile(durations, 95) * 1000, 2) if durations else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'round_trips': calls_after_fetch - calls_before,
+        'summary_round_trips': summary_calls,
+    })
+
+
+def _git_commit() -> Optional[str]:
+    """Current git commit, if the benchmark runs inside a checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: List[int], batch_sizes: List[int], workers: List[int], executor: str,
+                   latency_ms: float, max_concurrency: int, repeat: int = 1, seed: int = 42) -> Dict[str, Any]:
+    """
+    Run every combination of catalog size, batch size and worker count
+
+    Each catalog size gets its own fake server process and each case runs in
+    a fresh process, so server work and earlier cases do not skew RSS or CPU.
+    With repeat > 1 the fastest run of each case is kept to damp noise.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    for size in sizes:
+        port_queue = context.Queue()
+        server = context.Process(target=_serve, args=(size, seed, latency_ms, max_concurrency, port_queue),
+                                 daemon=True)
+        server.start()
+        url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+        try:
+            for batch_size, worker_count in itertools.product(batch_sizes, workers):
+                case = {'products': size, 'batch_size': batch_size, 'workers': worker_count,
+                        'executor': executor, 'latency_ms': latency_ms}
+                runs = []
+                for _ in range(repeat):
+                    result_queue = context.Queue()
+                    runner = context.Process(target=_run_case, args=(url, 'fake_odoo', case, result_queue))
+                    runner.start()
+                    runs.append(result_queue.get())
+                    runner.join()
+                result = max(runs, key=lambda run: run['records_per_sec'] or 0)
+                results.append(result)
+                print(f"📊 {size:>8} products | batch {batch_size:>5} | {worker_count:>2} {executor} workers | "
+                      f"{result['records_per_sec']:>10} rec/s | p95 {result['p95_call_ms']} ms | "
+                      f"{result['peak_rss_mb']} MiB | {result['round_trips']} calls")
+        finally:
+            server.terminate()
+            server.join()
+
+    return {
+        'meta': {
+            'harness_version': HARNESS_VERSION,
+            'commit': _git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'max_concurrency': max_concurrency,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def _case_key(result: Dict[str, Any]) -> tuple:
+    return result['products'], result['batch_size'], result['workers'], result['executor'], result['latency_ms']
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    List regressions between two benchmark result files
+
+    A case regresses when throughput drops or peak RSS grows by more than the
+    tolerance (a fraction), or when it needs more round-trips than before.
+
+    Raises:
+        ValueError: If the baseline was produced by a different harness version
+    """
+    baseline_version = baseline.get('meta', {}).get('harness_version', 1)
+    if baseline_version != HARNESS_VERSION:
+        raise ValueError(f"Baseline was recorded with benchmark harness version {baseline_version}, "
+                         f"this is version {HARNESS_VERSION}; record a new baseline")
+    previous = {_case_key(result): result for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        old = previous.get(_case_key(result))
+        if old is None:
+            continue
+        label = "{} products, batch {}, {} {} workers".format(*_case_key(result)[:4])
+        if old['records_per_sec'] and (result['records_per_sec'] or 0) < old['records_per_sec'] * (1 - tolerance):
+            regressions.append(f"{label}: {old['records_per_sec']} -> {result['records_per_sec']} rec/s")
+        if result['peak_rss_mb'] > old['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{label}: peak RSS {old['peak_rss_mb']} -> {result['peak_rss_mb']} MiB")
+        if result['round_trips'] > old['round_trips']:
+            regressions.append(f"{label}: round-trips {old['round_trips']} -> {result['round_trips']}")
+
+    return regressions
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(',') if item]
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark OdooInventoryFetcher against a local fake Odoo")
+    parser.add_argument('--sizes', type=_int_list, default=[1000, 10000], help="Comma-separated catalog sizes")
+    parser.add_argument('--batch-sizes', type=_int_list, default=[500, 2000], help="Comma-separated batch sizes")
+    parser.add_argument('--workers', type=_int_list, default=[1, 4], help="Comma-separated worker counts")
+    parser.add_argument('--executor', choices=['thread', 'process'], default='thread')
+    parser.add_argument('--latency-ms', type=float, default=2, help="Latency the fake server adds per call")
+    parser.add_argument('--max-concurrency', type=int, default=8, help="Calls the fake server serves at once")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per case; the fastest is kept")
+    parser.add_argument('--output', default=os.path.join('reports', 'benchmarks', 'odoo_benchmark.json'))
+    parser.add_argument('--compare', metavar='BASELINE', help="Earlier result file to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.1, help="Allowed relative slowdown (0.1 = 10%%)")
+    args = parser.parse_args()
+
+    print("🚀 Starting Odoo fetcher benchmark...")
+    results = run_benchmarks(args.sizes, args.batch_sizes, args.workers, args.executor,
+                             args.latency_ms, args.max_concurrency, args.repeat)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Benchmark results saved to '{args.output}'")
+
+    if args.compare:
+        with open(args.compare) as f:
+            try:
+                regressions = compare_results(json.load(f), results, args.tolerance)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+        if regressions:
+            print("❌ Regressions against baseline:")
+            for regression in regressions:
+                print(f"• {regression}")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Odoo Columnar Records
+pandas-backed representation of fetched Odoo records with vectorized inventory statistics
+"""
+
+import sys
+from typing import List, Dict, Any, Iterable, Optional, Set
+
+import pandas as pd
+
+
+def _flatten_page(page: List[Dict[str, Any]], many2one: Set[str]) -> Dict[str, list]:
+    """
+    Turn a page of Odoo records into plain columns
+
+    Many-to-one [id, name] pairs become an id column and a <field>_name column,
+    and their field is added to many2one. Names are interned, so a location or
+    category name repeated across thousands of rows is stored once.
+    """
+    columns: Dict[str, list] = {}
+    for row, record in enumerate(page):
+        for field, value in record.items():
+            if isinstance(value, list):
+                many2one.add(field)
+                name = value[1] if len(value) > 1 else None
+                columns.setdefault(field, [None] * row).append(value[0] if value else None)
+                columns.setdefault(f"{field}_name", [None] * row).append(
+                    sys.intern(name) if isinstance(name, str) else name
+                )
+            else:
+                columns.setdefault(field, [None] * row).append(value)
+        # Pad columns this record did not have
+        for values in columns.values():
+            if len(values) <= row:
+                values.append(None)
+    return columns
+
+
+def _normalize_many2one(frame: pd.DataFrame, many2one: Set[str]) -> None:
+    """
+    Give a page frame both columns of every many-to-one field
+
+    Odoo's False placeholder for an empty many-to-one value becomes None, also
+    on pages flattened before the field was recognized as many-to-one (for
+    example a page where categ_id is always False), so it ends up as NA rather
+    than 0 in the Int64 id column.
+    """
+    for field in many2one:
+        if field in frame.columns:
+            frame[field] = pd.Series([None if value is False else value for value in frame[field]],
+                                     index=frame.index, dtype=object)
+        else:
+            frame[field] = pd.Series(None, index=frame.index, dtype=object)
+        if f"{field}_name" not in frame.columns:
+            frame[f"{field}_name"] = pd.Series(None, index=frame.index, dtype=object)
+
+
+def pages_to_frame(pages: Iterable[List[Dict[str, Any]]], many2one_fields: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    Build one DataFrame from a stream of record pages
+
+    Every many-to-one field, whether named in many2one_fields (e.g. from
+    OdooInventoryFetcher.get_field_types) or recognized from its [id, name]
+    values on any page, gets an Int64 id column and a <field>_name column.
+    Name columns become pandas categoricals, so each distinct category, unit
+    of measure or location name is held once.
+    """
+    many2one: Set[str] = set(many2one_fields)
+    frames = [pd.DataFrame(_flatten_page(page, many2one)) for page in pages if page]
+    if not frames:
+        return pd.DataFrame()
+
+    # A field may only be recognized on a later page, so earlier pages are fixed up afterwards
+    for frame in frames:
+        _normalize_many2one(frame, many2one)
+    frame = pd.concat(frames, ignore_index=True)
+    for field in sorted(many2one):
+        frame[field] = frame[field].astype('Int64')
+        frame[f"{field}_name"] = frame[f"{field}_name"].astype('category')
+    return frame
+
+
+def records_to_frame(records: List[Dict[str, Any]], many2one_fields: Iterable[str] = ()) -> pd.DataFrame:
+    """Build a DataFrame from a list of Odoo record dictionaries"""
+    return pages_to_frame([records], many2one_fields)
+
+
+def find_low_stock(products: pd.DataFrame, threshold: float = 0) -> pd.DataFrame:
+    """Get products whose on-hand quantity is at or below the threshold"""
+    if products.empty or 'qty_available' not in products:
+        return products
+    return products[products['qty_available'].fillna(0) <= threshold]
+
+
+def summarize_frames(products: pd.DataFrame, stock_quants: pd.DataFrame,
+                     low_stock_threshold: float = 0) -> Dict[str, Any]:
+    """
+    Compute inventory statistics with vectorized pandas operations
+
+    Returns the same keys as OdooInventoryFetcher.get_inventory_summary;
+    low_stock_products counts products at or below low_stock_threshold.
+    """
+    summary = {
+        'total_products': len(products),
+        'products_with_stock': 0,
+        'total_stock_locations': 0,
+        'stock_by_location': [],
+        'products_by_category': [],
+        'low_stock_products': len(find_low_stock(products, low_stock_threshold)),
+    }
+
+    if not products.empty and 'qty_available' in products:
+        summary['products_with_stock'] = int((products['qty_available'].fillna(0) > 0).sum())
+
+    if not products.empty and 'categ_id' in products:
+        categories = products.groupby('categ_id', dropna=False).size()
+        names = _many2one_names(products, 'categ_id')
+        summary['products_by_category'] = [
+            {'categ_id': _many2one_value(categ_id, names), 'product_count': int(count)}
+            for categ_id, count in categories.items()
+        ]
+
+    if not stock_quants.empty and 'location_id' in stock_quants:
+        locations = stock_quants.groupby('location_id', dropna=False)['quantity'].agg(['sum', 'size'])
+        names = _many2one_names(stock_quants, 'location_id')
+        summary['total_stock_locations'] = len(locations)
+        summary['stock_by_location'] = [
+            {'location_id': _many2one_value(location_id, names), 'quantity': float(row['sum']),
+             'quant_count': int(row['size'])}
+            for location_id, row in locations.iterrows()
+        ]
+
+    return summary
+
+
+def _many2one_names(frame: pd.DataFrame, field: str) -> Dict[int, Any]:
+    """Map many-to-one ids to their names (empty if the frame has no <field>_name column)"""
+    name_column = f"{field}_name"
+    if name_column not in frame:
+        return {}
+    pairs = frame[[field, name_column]].dropna(subset=[field]).drop_duplicates(field)
+    return dict(zip(pairs[field].astype(int), pairs[name_column]))
+
+
+def _many2one_value(field_id: Any, names: Dict[int, Any]) -> list:
+    """Rebuild Odoo's [id, name] pair of a group ([False, ''] for records without a value)"""
+    if pd.isna(field_id):
+        return [False, '']
+    name = names.get(int(field_id))
+    return [int(field_id), None if pd.isna(name) else name]
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Fake Odoo Server
+Local stand-in speaking Odoo's XML-RPC and JSON-RPC endpoints for offline load and BDD testing
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import xmlrpc.client
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+FIELD_TYPES = {
+    'product.product': {
+        'id': 'integer', 'name': 'char', 'default_code': 'char', 'barcode': 'char',
+        'list_price': 'float', 'standard_price': 'float', 'qty_available': 'float',
+        'virtual_available': 'float', 'categ_id': 'many2one', 'uom_id': 'many2one',
+        'active': 'boolean', 'type': 'selection', 'sale_ok': 'boolean', 'write_date': 'datetime',
+    },
+    'stock.quant': {
+        'id': 'integer', 'product_id': 'many2one', 'location_id': 'many2one', 'quantity': 'float',
+        'reserved_quantity': 'float', 'available_quantity': 'float', 'write_date': 'datetime',
+    },
+}
+
+UOM_NAMES = ['Units', 'kg', 'm', 'L', 'Box', 'Dozen']
+BASE_WRITE_DATE = datetime(2024, 1, 1)
+
+
+class OdooError(Exception):
+    """Error raised for calls the fake server cannot answer, reported like an Odoo fault"""
+
+
+class FakeOdooDataset:
+    """
+    Deterministic, lazily generated product and stock quant tables
+
+    Records are derived from (seed, id) on demand rather than held in memory, so
+    catalogs of a million products cost no more RAM than small ones. Updates and
+    deletions are kept in overlays so incremental sync can be exercised.
+    """
+
+    QUANTS_PER_PRODUCT = 2
+
+    def __init__(self, products: int = 1000, seed: int = 42, locations: int = 20, categories: int = 50,
+                 cache_size: int = 100000):
+        """
+        Initialize dataset
+
+        Args:
+            products: Number of product.product records
+            seed: Random seed; equal seeds produce identical datasets
+            locations: Number of distinct stock locations
+            categories: Number of distinct product categories
+            cache_size: Generated records of each model kept for reuse by this dataset
+        """
+        self.size = {'product.product': products, 'stock.quant': products * self.QUANTS_PER_PRODUCT}
+        self.seed = seed
+        self.locations = locations
+        self.categories = categories
+        self._updates: Dict[str, Dict[int, Dict[str, Any]]] = {model: {} for model in self.size}
+        self._deleted: Dict[str, set] = {model: set() for model in self.size}
+        self._search_cache: 'OrderedDict[Tuple[str, str], List[int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Per-dataset caches, released with the dataset (a class-level lru_cache would keep every dataset alive)
+        self._quant = lru_cache(maxsize=cache_size)(self._generate_quant)
+        self._product = lru_cache(maxsize=cache_size)(self._generate_product)
+
+    def _generate_quant(self, quant_id: int) -> Dict[str, Any]:
+        """Generate the base version of one stock quant"""
+        rng = random.Random(self.seed * 1000003 + quant_id * 2 + 1)
+        product_id = (quant_id - 1) // self.QUANTS_PER_PRODUCT + 1
+        location = rng.randint(1, self.locations)
+        quantity = float(rng.choice([0, 0, rng.randint(1, 500)]))
+        reserved = float(min(quantity, rng.randint(0, 20)))
+        return {
+            'id': quant_id,
+            'product_id': [product_id, f"Product {product_id:07d}"],
+            'location_id': [location, f"WH/Stock/Shelf {location}"],
+            'quantity': quantity,
+            'reserved_quantity': reserved,
+            'available_quantity': quantity - reserved,
+            'write_date': (BASE_WRITE_DATE + timedelta(minutes=rng.randint(0, 525600))).strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+    def _generate_product(self, product_id: int) -> Dict[str, Any]:
+        """Generate the base version of one product"""
+        rng = random.Random(self.seed * 1000003 + product_id * 2)
+        category = rng.randint(1, self.categories)
+        uom = rng.randrange(len(UOM_NAMES))
+        list_price = round(rng.uniform(1, 1000), 2)
+        return {
+            'id': product_id,
+            'name': f"Product {product_id:07d}",
+            'default_code': f"SKU{product_id:07d}" if rng.random() < 0.9 else False,
+            'barcode': f"{rng.randrange(10 ** 12, 10 ** 13)}" if rng.random() < 0.7 else False,
+            'list_price': list_price,
+            'standard_price': round(list_price * rng.uniform(0.4, 0.9), 2),
+            'incoming_qty': float(rng.randint(-10, 50)),
+            'categ_id': [category, f"All / Category {category}"],
+            'uom_id': [uom + 1, UOM_NAMES[uom]],
+            'active': True,
+            'type': rng.choice(['product', 'product', 'consu', 'service']),
+            'sale_ok': rng.random() < 0.8,
+            'write_date': (BASE_WRITE_DATE + timedelta(minutes=rng.randint(0, 525600))).strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+    def get(self, model: str, record_id: int) -> Optional[Dict[str, Any]]:
+        """Get one record with overlays applied (None if missing or deleted)"""
+        if model not in self.size:
+            raise OdooError(f"Object {model} doesn't exist")
+        if not 1 <= record_id <= self.size[model] or record_id in self._deleted[model]:
+            return None
+        if model == 'stock.quant':
+            record = self._quant(record_id)
+        else:
+            # On-hand quantity is computed from the product's quants, as in Odoo
+            quant_ids = range((record_id - 1) * self.QUANTS_PER_PRODUCT + 1, record_id * self.QUANTS_PER_PRODUCT + 1)
+            qty_available = sum(quant['quantity'] for quant in (self.get('stock.quant', quant_id)
+                                                                for quant_id in quant_ids) if quant)
+            record = self._product(record_id)
+            record = {**record, 'qty_available': qty_available,
+                      'virtual_available': qty_available + record['incoming_qty']}
+        updates = self._updates[model].get(record_id)
+        return {**record, **updates} if updates else record
+
+    def update(self, model: str, record_id: int, values: Dict[str, Any]) -> None:
+        """Change fields of a record and bump its write_date"""
+        with self._lock:
+            stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._updates[model].setdefault(record_id, {}).update(values, write_date=stamp)
+            self._search_cache.clear()
+
+    def unlink(self, model: str, record_ids: List[int]) -> None:
+        """Delete records"""
+        with self._lock:
+            self._deleted[model].update(record_ids)
+            self._search_cache.clear()
+
+    def search(self, model: str, domain: list) -> Sequence[int]:
+        """Get ids of records matching a domain, in id order (a range when every record matches)"""
+        if model not in self.size:
+            raise OdooError(f"Object {model} doesn't exist")
+        if not domain and not self._deleted[model]:
+            return range(1, self.size[model] + 1)
+
+        key = (model, json.dumps(domain))
+        with self._lock:
+            if key in self._search_cache:
+                self._search_cache.move_to_end(key)
+                return self._search_cache[key]
+
+        ids = [record_id for record_id in range(1, self.size[model] + 1)
+               if (record := self.get(model, record_id)) is not None and matches(record, domain)]
+        with self._lock:
+            self._search_cache[key] = ids
+            if len(self._search_cache) > 64:
+                self._search_cache.popitem(last=False)
+        return ids
+
+
+def _compare(value: Any, operator: str, operand: Any) -> bool:
+    """Evaluate one domain leaf against a field value"""
+    if isinstance(value, list):
+        # Many-to-one fields compare on their id
+        value = value[0] if value else False
+    if operator == '=':
+        return value == operand
+    if operator == '!=':
+        return value != operand
+    if operator == 'in':
+        return value in operand
+    if operator == 'not in':
+        return value not in operand
+    if operator in ('ilike', 'like'):
+        needle, haystack = str(operand), str(value or '')
+        return needle.lower() in haystack.lower() if operator == 'ilike' else needle in haystack
+    if value is False or value is None:
+        return False
+    if operator == '>':
+        return value > operand
+    if operator == '>=':
+        return value >= operand
+    if operator == '<':
+        return value < operand
+    if operator == '<=':
+        return value <= operand
+    raise OdooError(f"Invalid domain operator {operator!r}")
+
+
+def matches(record: Dict[str, Any], domain: list) -> bool:
+    """Evaluate a prefix-notation Odoo domain ('&', '|', '!' and leaves) against a record"""
+    stack = []
+    for term in reversed(domain):
+        if term == '&':
+            stack.append(stack.pop() & stack.pop())
+        elif term == '|':
+            stack.append(stack.pop() | stack.pop())
+        elif term == '!':
+            stack.append(not stack.pop())
+        else:
+            field, operator, operand = term
+            stack.append(_compare(record.get(field, False), operator, operand))
+    # Remaining terms are implicitly and-ed
+    return all(stack)
+
+
+class FakeOdoo:
+    """Dispatches Odoo model methods against a FakeOdooDataset"""
+
+    UID = 2
+
+    def __init__(self, dataset: FakeOdooDataset, database: str = 'fake_odoo', api_key: str = None):
+        """
+        Initialize fake Odoo
+
+        Args:
+            dataset: Records served by the fake
+            database: Database name reported and accepted
+            api_key: Accepted API key (any key is accepted if None)
+        """
+        self.dataset = dataset
+        self.database = database
+        self.api_key = api_key
+
+    def authenticate(self, database: str, login: str, api_key: str, user_agent_env: dict = None):
+        """Return the fake user id, or False for a wrong database or key"""
+        if database != self.database or (self.api_key is not None and api_key != self.api_key):
+            return False
+        return self.UID
+
+    def execute_kw(self, database: str, uid: int, api_key: str, model: str, method: str,
+                   args: list = None, kwargs: dict = None):
+        """Run a model method the way Odoo's object service does"""
+        if not self.authenticate(database, '', api_key) or uid != self.UID:
+            raise OdooError("Access Denied")
+        return self.call_kw(model, method, args or [], kwargs or {})
+
+    def call_kw(self, model: str, method: str, args: list, kwargs: dict):
+        """Dispatch a model method call"""
+        handler = getattr(self, f"_{method}", None)
+        if handler is None:
+            raise OdooError(f"The method '{method}' does not exist on the model '{model}'")
+        return handler(model, *args, **kwargs)
+
+    def _read_records(self, model: str, ids, fields: List[str] = None) -> List[Dict[str, Any]]:
+        """Read the requested fields of existing records"""
+        fields = fields or list(FIELD_TYPES[model])
+        records = []
+        for record_id in ids:
+            record = self.dataset.get(model, record_id)
+            if record is not None:
+                records.append({'id': record_id, **{field: record.get(field, False) for field in fields}})
+        return records
+
+    def _search(self, model: str, domain: list, offset: int = 0, limit: int = None, order: str = None,
+                count: bool = False):
+        ids = self.dataset.search(model, domain)
+        if count:
+            return len(ids)
+        ids = ids[offset:offset + limit if limit else None]
+        return list(ids)
+
+    def _search_count(self, model: str, domain: list, limit: int = None):
+        return len(self.dataset.search(model, domain))
+
+    def _read(self, model: str, ids: List[int], fields: List[str] = None, load: str = None):
+        return self._read_records(model, ids, fields)
+
+    def _search_read(self, model: str, domain: list = None, fields: List[str] = None, offset: int = 0,
+                     limit: int = None, order: str = None):
+        return self._read_records(model, self._search(model, domain or [], offset, limit), fields)
+
+    def _fields_get(self, model: str, allfields: List[str] = None, attributes: List[str] = None):
+        types = FIELD_TYPES.get(model)
+        if types is None:
+            raise OdooError(f"Object {model} doesn't exist")
+        return {name: {'type': field_type, 'string': name.replace('_', ' ').title()}
+                for name, field_type in types.items() if not allfields or name in allfields}
+
+    def _read_group(self, model: str, domain: list, fields: List[str], groupby: List[str],
+                    offset: int = 0, limit: int = None, orderby: str = None, lazy: bool = True):
+        group_field = groupby[0] if isinstance(groupby, list) else groupby
+        sums = [spec.split(':')[0] for spec in fields
+                if spec.split(':')[0] != group_field and FIELD_TYPES[model].get(spec.split(':')[0]) == 'float']
+
+        groups: Dict[Any, Dict[str, Any]] = {}
+        for record_id in self.dataset.search(model, domain):
+            record = self.dataset.get(model, record_id)
+            value = record.get(group_field, False)
+            key = value[0] if isinstance(value, list) else value
+            group = groups.setdefault(key, {group_field: value, '__count': 0, **{field: 0.0 for field in sums}})
+            group['__count'] += 1
+            for field in sums:
+                group[field] += record.get(field) or 0.0
+
+        result = sorted(groups.values(), key=lambda group: str(group[group_field]))
+        if lazy:
+            for group in result:
+                group[f"{group_field}_count"] = group.pop('__count')
+        return result[offset:offset + limit if limit else None]
+
+
+class FakeOdooRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler for the XML-RPC and JSON-RPC endpoints"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; with Nagle on, every keep-alive call
+    # would wait out the client's delayed ACK (~40 ms) and hide client-side pooling gains
+    disable_nagle_algorithm = True
+    server: 'FakeOdooServer'
+
+    def log_message(self, format, *args):
+        """Keep request logging quiet"""
+
+    def _read_body(self) -> bytes:
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return body
+
+    def _respond(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        if 'gzip' in self.headers.get('Accept-Encoding', '') and len(body) > 1400:
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        """Serve /fake/stats with the number of RPC calls handled so far"""
+        if self.path == '/fake/stats':
+            self._respond(json.dumps({'calls': self.server.call_count}).encode('utf-8'), 'application/json')
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        """Serve /xmlrpc/2/common, /xmlrpc/2/object, /web/dataset/call_kw and /web/database/list"""
+        body = self._read_body()
+        with self.server.call_slots:
+            self.server.simulate_latency()
+            self.server.count_call()
+            if self.path.startswith('/xmlrpc/2/'):
+                self._respond(self._handle_xmlrpc(body), 'text/xml')
+            elif self.path in ('/web/dataset/call_kw', '/web/database/list') or self.path.startswith('/web/dataset/call_kw/'):
+                self._respond(self._handle_jsonrpc(body), 'application/json')
+            else:
+                self.send_error(404)
+
+    def _handle_xmlrpc(self, body: bytes) -> bytes:
+        params, method = xmlrpc.client.loads(body, use_builtin_types=True)
+        odoo = self.server.odoo
+        try:
+            if self.path.endswith('/common') and method == 'authenticate':
+                result = odoo.authenticate(*params)
+            elif self.path.endswith('/common') and method == 'version':
+                result = {'server_version': '17.0', 'server_serie': '17.0', 'protocol_version': 1}
+            elif self.path.endswith('/object') and method == 'execute_kw':
+                result = odoo.execute_kw(*params)
+            else:
+                raise OdooError(f"Method {method} not supported on {self.path}")
+            return xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True).encode('utf-8')
+        except Exception as e:
+            return xmlrpc.client.dumps(xmlrpc.client.Fault(1, str(e)), allow_none=True).encode('utf-8')
+
+    def _handle_jsonrpc(self, body: bytes) -> bytes:
+        request = json.loads(body or b'{}')
+        try:
+            if self.path == '/web/database/list':
+                result = [self.server.odoo.database]
+            else:
+                params = request.get('params', {})
+                result = self.server.odoo.call_kw(params['model'], params['method'],
+                                                  params.get('args', []), params.get('kwargs', {}))
+            response = {'jsonrpc': '2.0', 'id': request.get('id'), 'result': result}
+        except Exception as e:
+            response = {'jsonrpc': '2.0', 'id': request.get('id'),
+                        'error': {'code': 200, 'message': 'Odoo Server Error', 'data': {'message': str(e)}}}
+        return json.dumps(response).encode('utf-8')
+
+
+class FakeOdooServer(ThreadingHTTPServer):
+    """
+    Threaded fake Odoo HTTP server with injectable latency and a concurrency limit
+
+    Latency is added to every call; max_concurrency bounds how many calls are
+    served at once, like the number of Odoo HTTP workers on a real instance.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, dataset: FakeOdooDataset = None,
+                 database: str = 'fake_odoo', api_key: str = None, latency_ms: float = 0,
+                 jitter_ms: float = 0, max_concurrency: int = 8):
+        """
+        Initialize server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            dataset: Records to serve (a 1000-product dataset if None)
+            database: Database name reported and accepted
+            api_key: Accepted API key (any key is accepted if None)
+            latency_ms: Latency added to every call
+            jitter_ms: Random extra latency of up to this many milliseconds
+            max_concurrency: Calls served concurrently; further calls queue
+        """
+        super().__init__((host, port), FakeOdooRequestHandler)
+        self.odoo = FakeOdoo(dataset or FakeOdooDataset(), database, api_key)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.call_slots = threading.BoundedSemaphore(max_concurrency)
+        self.call_count = 0
+        self._count_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def simulate_latency(self) -> None:
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+    def count_call(self) -> None:
+        with self._count_lock:
+            self.call_count += 1
+
+    def start(self) -> 'FakeOdooServer':
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    """Run the fake Odoo server in the foreground"""
+    parser = argparse.ArgumentParser(description="Local fake Odoo server for offline testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8069)
+    parser.add_argument('--products', type=int, default=1000, help="Number of products (1k to 1M)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--database', default='fake_odoo')
+    parser.add_argument('--latency-ms', type=float, default=0, help="Latency added to every call")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra latency per call")
+    parser.add_argument('--max-concurrency', type=int, default=8, help="Calls served at once")
+    args = parser.parse_args()
+
+    server = FakeOdooServer(args.host, args.port, FakeOdooDataset(args.products, args.seed), args.database,
+                            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                            max_concurrency=args.max_concurrency)
+    print(f"🧪 Fake Odoo serving {args.products} products on {server.url} (database: {args.database})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Odoo Inventory Exporter
+Streams inventory snapshots to disk as NDJSON or Parquet without holding them in memory
+"""
+
+import gzip
+import io
+import json
+import os
+from typing import List, Dict, Any, Iterator, Optional
+
+from odoo_inventory_fetcher import OdooInventoryFetcher
+from odoo_snapshot_store import OdooSnapshotStore
+
+# Arrow type names for Odoo field types; unknown types are exported as strings
+ARROW_TYPES = {
+    'integer': 'int64',
+    'float': 'float64',
+    'monetary': 'float64',
+    'boolean': 'bool',
+    'many2one': 'int64',
+}
+
+
+class InventoryExporter:
+    """Writes products and stock quants page by page to NDJSON or Parquet files"""
+
+    TABLES = {
+        'products': ('product.product', OdooInventoryFetcher.PRODUCT_FIELDS),
+        'stock_quants': ('stock.quant', OdooInventoryFetcher.QUANT_FIELDS),
+    }
+
+    def __init__(self, fetcher: OdooInventoryFetcher, store: OdooSnapshotStore = None,
+                 batch_size: int = OdooInventoryFetcher.DEFAULT_BATCH_SIZE):
+        """
+        Initialize exporter
+
+        Args:
+            fetcher: Authenticated inventory fetcher
+            store: Snapshot store to export from (records are fetched from Odoo if None)
+            batch_size: Number of records read and written per page
+        """
+        self.fetcher = fetcher
+        self.store = store
+        self.batch_size = batch_size
+
+    def _iter_pages(self, table: str) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the pages of one table from the snapshot store or from Odoo"""
+        if self.store is not None:
+            model, _ = self.TABLES[table]
+            yield from self.store.iter_records(model, self.batch_size)
+        elif table == 'products':
+            yield from self.fetcher.iter_products(self.batch_size)
+        else:
+            yield from self.fetcher.iter_stock_quants(self.batch_size)
+
+    def _write_summary(self, directory: str) -> str:
+        """Write the aggregate inventory summary next to the exported tables"""
+        summary = self.fetcher.get_inventory_summary(self.store)
+        path = os.path.join(directory, 'summary.json')
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({key: value for key, value in summary.items()
+                       if key not in ('products', 'stock_quants')}, file, default=str)
+        return path
+
+    @staticmethod
+    def _open_text(path: str, compression: Optional[str]):
+        """Open a text file for writing with optional gzip or zstd compression"""
+        if compression == 'gzip':
+            return gzip.open(path, 'wt', encoding='utf-8')
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd compression requires the 'zstandard' package: pip install zstandard")
+            raw = open(path, 'wb')
+            return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding='utf-8')
+        return open(path, 'w', encoding='utf-8')
+
+    def export_ndjson(self, directory: str, compression: Optional[str] = None) -> Dict[str, str]:
+        """
+        Stream products and stock quants to one NDJSON file per table
+
+        Args:
+            directory: Output directory (created if missing)
+            compression: None, 'gzip' or 'zstd'
+
+        Returns:
+            Mapping of table name to written file path
+        """
+        if compression not in (None, 'gzip', 'zstd'):
+            raise ValueError(f"Unsupported compression: {compression}. Use 'gzip' or 'zstd'.")
+
+        os.makedirs(directory, exist_ok=True)
+        extension = {None: '', 'gzip': '.gz', 'zstd': '.zst'}[compression]
+        paths = {'summary': self._write_summary(directory)}
+
+        for table in self.TABLES:
+            path = os.path.join(directory, f"{table}.ndjson{extension}")
+            count = 0
+            with self._open_text(path, compression) as file:
+                for page in self._iter_pages(table):
+                    file.writelines(json.dumps(record, default=str) + '\n' for record in page)
+                    count += len(page)
+            print(f"💾 {count} {table} written to '{path}'")
+            paths[table] = path
+
+        return paths
+
+    def _arrow_schema(self, table: str):
+        """Build the Parquet schema of a table from Odoo field types"""
+        import pyarrow
+
+        model, fields = self.TABLES[table]
+        field_types = self.fetcher.get_field_types(model, fields)
+        columns = [pyarrow.field('id', pyarrow.int64())]
+        for field in fields:
+            field_type = field_types.get(field, 'char')
+            columns.append(pyarrow.field(field, pyarrow.type_for_alias(ARROW_TYPES.get(field_type, 'string'))))
+            if field_type == 'many2one':
+                columns.append(pyarrow.field(f"{field}_name", pyarrow.string()))
+        return pyarrow.schema(columns)
+
+    @staticmethod
+    def _to_columns(page: List[Dict[str, Any]], schema) -> Dict[str, list]:
+        """
+        Turn a page of Odoo records into typed columns
+
+        Many-to-one [id, name] pairs become an id column and a name column, and
+        Odoo's False placeholder for empty non-boolean values becomes null.
+        """
+        import pyarrow
+
+        columns = {name: [] for name in schema.names}
+        for record in page:
+            for field in schema:
+                if field.name.endswith('_name') and field.name[:-5] in columns:
+                    value = record.get(field.name[:-5])
+                    columns[field.name].append(value[1] if value else None)
+                    continue
+
+                value = record.get(field.name)
+                if isinstance(value, list):
+                    value = value[0] if value else None
+                elif value is False and field.type != pyarrow.bool_():
+                    value = None
+                elif value is not None and pyarrow.types.is_string(field.type):
+                    value = str(value)
+                columns[field.name].append(value)
+        return columns
+
+    def export_parquet(self, directory: str) -> Dict[str, str]:
+        """
+        Stream products and stock quants to one Parquet file per table
+
+        Requires pyarrow. Rows are written as one row group per page, so memory
+        stays bounded by the batch size.
+
+        Args:
+            directory: Output directory (created if missing)
+
+        Returns:
+            Mapping of table name to written file path
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export requires the 'pyarrow' package: pip install pyarrow")
+
+        os.makedirs(directory, exist_ok=True)
+        paths = {'summary': self._write_summary(directory)}
+
+        for table in self.TABLES:
+            path = os.path.join(directory, f"{table}.parquet")
+            schema = self._arrow_schema(table)
+            count = 0
+            with pyarrow.parquet.ParquetWriter(path, schema, compression='snappy') as writer:
+                for page in self._iter_pages(table):
+                    writer.write_table(pyarrow.Table.from_pydict(self._to_columns(page, schema), schema=schema))
+                    count += len(page)
+            print(f"💾 {count} {table} written to '{path}'")
+            paths[table] = path
+
+        return paths
@@ -4,13 +4,117 @@ Odoo Inventory Fetcher
 Fetches current products in inventory from Odoo using REST API
 """
 
+import argparse
+import gzip
 import requests
 import json
 import os
-from typing import List, Dict, Any
+import time
+import xmlrpc.client
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from odoo_snapshot_store import OdooSnapshotStore
+
+# XML-RPC proxy owned by the current worker process (process pool mode)
+_process_models = None
+
+
+class PooledTransport(xmlrpc.client.Transport):
+    """
+    XML-RPC transport sending calls through a pooled keep-alive requests.Session
+    
+    The stock transport holds a single connection and is not safe to share
+    between threads. Routing calls through a requests session reuses its
+    urllib3 connection pool, so TCP/TLS handshakes are paid once per pooled
+    connection instead of once per call, and one proxy can serve many threads.
+    """
+    
+    def __init__(self, session: requests.Session, scheme: str = 'https', timeout: float = 60,
+                 use_gzip: bool = True):
+        super().__init__()
+        self.session = session
+        self.scheme = scheme
+        self.timeout = timeout
+        self.use_gzip = use_gzip
+        # Only compress request bodies large enough to benefit
+        self.encode_threshold = 1400
+        # Set to a list to record the duration in seconds of every call
+        self.call_durations: Optional[List[float]] = None
+    
+    def request(self, host, handler, request_body, verbose=False):
+        """Send one XML-RPC call and unmarshal the response"""
+        url = f"{self.scheme}://{host}{handler}"
+        headers = {
+            'Content-Type': 'text/xml',
+            'Accept-Encoding': 'gzip' if self.use_gzip else 'identity'
+        }
+        
+        if self.use_gzip and len(request_body) > self.encode_threshold:
+            request_body = gzip.compress(request_body)
+            headers['Content-Encoding'] = 'gzip'
+        
+        started = time.perf_counter()
+        response = self.session.post(url, data=request_body, headers=headers, timeout=self.timeout)
+        if self.call_durations is not None:
+            self.call_durations.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(url, response.status_code, response.reason, dict(response.headers))
+        
+        parser, unmarshaller = self.getparser()
+        parser.feed(response.content)
+        parser.close()
+        return unmarshaller.close()
+
+
+def create_pooled_session(pool_size: int = 10) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool of the given size"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def create_xmlrpc_proxy(url: str, transport: PooledTransport) -> xmlrpc.client.ServerProxy:
+    """Create an XML-RPC proxy that sends its calls through a pooled transport"""
+    return xmlrpc.client.ServerProxy(url, transport=transport, allow_none=True)
+
+
+def _read_page_in_process(base_url: str, database: str, uid: int, api_key: str, timeout: float,
+                          use_gzip: bool, model: str, domain: list, fields: List[str],
+                          offset: int, limit: int) -> List[Dict[str, Any]]:
+    """Read one page of records from a process pool worker using its own XML-RPC proxy"""
+    global _process_models
+    if _process_models is None:
+        transport = PooledTransport(create_pooled_session(pool_size=1), urlsplit(base_url).scheme,
+                                    timeout, use_gzip)
+        _process_models = create_xmlrpc_proxy(f"{base_url}/xmlrpc/2/object", transport)
+    
+    return _process_models.execute_kw(
+        database, uid, api_key, model, 'search_read', [domain],
+        {'fields': fields, 'offset': offset, 'limit': limit, 'order': 'id'}
+    )
+
 
 class OdooInventoryFetcher:
-    def __init__(self, url: str, api_key: str, database: str = None):
+    PRODUCT_FIELDS = [
+        'name', 'default_code', 'barcode', 'list_price',
+        'standard_price', 'qty_available', 'virtual_available',
+        'categ_id', 'uom_id', 'active', 'type'
+    ]
+    QUANT_FIELDS = [
+        'product_id', 'location_id', 'quantity',
+        'reserved_quantity', 'available_quantity'
+    ]
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, url: str, api_key: str, database: str = None, pool_size: int = 10,
+                 timeout: float = 60, use_gzip: bool = True, summary_ttl: Optional[float] = 300,
+                 low_stock_threshold: float = 0):
         """
         Initialize Odoo connection
         
@@ -18,6 +122,11 @@ class OdooInventoryFetcher:
             url: Odoo instance URL
             api_key: API key for authentication
             database: Database name (auto-detected if None)
+            pool_size: Keep-alive connections kept open to the Odoo host
+            timeout: Timeout in seconds for each HTTP call
+            use_gzip: Gzip-encode large XML-RPC requests and accept gzip responses
+            summary_ttl: Seconds an inventory summary is reused (None never expires, 0 disables)
+            low_stock_threshold: On-hand quantity at or below which a product counts as low stock
         """
         # Extract base URL from POS URL
         if '/odoo/point-of-sale' in url:
@@ -30,27 +139,34 @@ class OdooInventoryFetcher:
         self.api_key = api_key
         self.database = database
         self.session_id = None
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.use_gzip = use_gzip
+        
+        # Memoized inventory summaries keyed by (snapshot path, detail): (created at, summary)
+        self.summary_ttl = summary_ttl
+        self.low_stock_threshold = low_stock_threshold
+        self._summary_cache: Dict[Tuple[Optional[str], bool], Tuple[float, Dict[str, Any]]] = {}
         
-        # Session for requests
-        self.session = requests.Session()
+        # Pooled keep-alive session shared by JSON-RPC and XML-RPC calls
+        self.session = create_pooled_session(pool_size)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'Odoo-Inventory-Fetcher/1.0'
         })
+        self.transport = PooledTransport(self.session, urlsplit(self.base_url).scheme, timeout, use_gzip)
     
     def authenticate_with_api_key(self):
         """Authenticate using API key with XML-RPC"""
         username = os.getenv('ODOO_USERNAME', 'your_username@example.com')
         
         try:
-            import xmlrpc.client
-            
             # XML-RPC endpoints
             common_url = f"{self.base_url}/xmlrpc/2/common"
             object_url = f"{self.base_url}/xmlrpc/2/object"
             
-            common = xmlrpc.client.ServerProxy(common_url)
-            models = xmlrpc.client.ServerProxy(object_url)
+            common = create_xmlrpc_proxy(common_url, self.transport)
+            models = create_xmlrpc_proxy(object_url, self.transport)
             
             # Authenticate with API key
             uid = common.authenticate(self.database, username, self.api_key, {})
@@ -129,13 +245,177 @@ class OdooInventoryFetcher:
             
         return result.get('result', [])
     
-    def fetch_products(self, limit: int = 100) -> List[Dict[str, Any]]:
+    def _ensure_authenticated(self) -> bool:
+        """Authenticate lazily if no user ID has been obtained yet"""
+        if not getattr(self, 'uid', None):
+            return self.authenticate()
+        return True
+    
+    def _execute_kw(self, model: str, method: str, args: list, kwargs: dict = None):
+        """Run a single execute_kw call on the XML-RPC object endpoint"""
+        return self.models.execute_kw(
+            self.database, self.uid, self.api_key,
+            model, method, args, kwargs or {}
+        )
+    
+    def _iter_search_read(self, model: str, domain: list, fields: List[str],
+                          batch_size: int, limit: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through a model with search_read, yielding each page as it arrives
+        
+        Pages are ordered by id so that offsets stay stable between calls.
+        Progress and throughput are printed after every page.
+        """
+        total = self._execute_kw(model, 'search_count', [domain])
+        if limit is not None:
+            total = min(total, limit)
+        
+        fetched = 0
+        started = time.perf_counter()
+        while fetched < total:
+            page_size = min(batch_size, total - fetched)
+            page = self._execute_kw(
+                model, 'search_read', [domain],
+                {'fields': fields, 'offset': fetched, 'limit': page_size, 'order': 'id'}
+            )
+            if not page:
+                break
+            
+            fetched += len(page)
+            elapsed = time.perf_counter() - started
+            rate = fetched / elapsed if elapsed > 0 else 0.0
+            print(f"📄 {model}: {fetched}/{total} records ({fetched * 100 // total}%) - {rate:.0f} records/s")
+            yield page
+    
+    def _read_page(self, model: str, domain: list, fields: List[str], offset: int,
+                   limit: int) -> List[Dict[str, Any]]:
+        """Read one page of records from a thread pool worker"""
+        return self._execute_kw(
+            model, 'search_read', [domain],
+            {'fields': fields, 'offset': offset, 'limit': limit, 'order': 'id'}
+        )
+    
+    def _fetch_pages_parallel(self, model: str, domain: list, fields: List[str], batch_size: int,
+                              limit: Optional[int], workers: int, executor: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages of a model concurrently through a bounded worker pool
+        
+        search_count runs once to size the result set, which is then split into
+        id-ordered offset pages. Threads share the pooled keep-alive transport,
+        process workers each open their own, and pages are merged back in offset
+        order, so the result is deterministic.
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unsupported executor: {executor}. Use 'thread' or 'process'.")
+        
+        total = self._execute_kw(model, 'search_count', [domain])
+        if limit is not None:
+            total = min(total, limit)
+        
+        pages = [(offset, min(batch_size, total - offset)) for offset in range(0, total, batch_size)]
+        if not pages:
+            return []
+        
+        print(f"⚡ {model}: fetching {total} records in {len(pages)} pages with {workers} {executor} workers")
+        if executor == 'thread' and workers > self.pool_size:
+            print(f"⚠️ {workers} workers share a pool of {self.pool_size} connections; raise pool_size to avoid reconnects")
+        records = []
+        started = time.perf_counter()
+        
+        offsets, sizes = zip(*pages)
+        pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        
+        with pool_class(max_workers=workers) as pool:
+            if executor == 'thread':
+                read_page = partial(self._read_page, model, domain, fields)
+            else:
+                read_page = partial(_read_page_in_process, self.base_url, self.database, self.uid,
+                                    self.api_key, self.timeout, self.use_gzip, model, domain, fields)
+            
+            for page in pool.map(read_page, offsets, sizes):
+                records.extend(page)
+                elapsed = time.perf_counter() - started
+                rate = len(records) / elapsed if elapsed > 0 else 0.0
+                print(f"📄 {model}: {len(records)}/{total} records ({len(records) * 100 // total}%) - {rate:.0f} records/s")
+        
+        return records
+    
+    def _read_all(self, model: str, domain: list, fields: List[str], batch_size: int,
+                  limit: Optional[int], workers: int, executor: str) -> List[Dict[str, Any]]:
+        """Read every matching record, serially or through a worker pool"""
+        if workers > 1:
+            return self._fetch_pages_parallel(model, domain, fields, batch_size, limit, workers, executor)
+        
+        records = []
+        for page in self._iter_search_read(model, domain, fields, batch_size, limit):
+            records.extend(page)
+        return records
+    
+    def iter_products(self, batch_size: int = DEFAULT_BATCH_SIZE, domain: list = None,
+                      fields: List[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream products page by page using search_read with offset batching
+        
+        Args:
+            batch_size: Number of products requested per XML-RPC call
+            domain: Odoo search domain (all products if None)
+            fields: Fields to read (PRODUCT_FIELDS if None)
+            
+        Yields:
+            Lists of product dictionaries, one list per page
+        """
+        if not self._ensure_authenticated():
+            return
+        
+        yield from self._iter_search_read(
+            'product.product', domain or [], fields or self.PRODUCT_FIELDS, batch_size
+        )
+    
+    def iter_stock_quants(self, batch_size: int = DEFAULT_BATCH_SIZE, domain: list = None,
+                          fields: List[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream stock quants page by page using search_read with offset batching
+        
+        Args:
+            batch_size: Number of stock records requested per XML-RPC call
+            domain: Odoo search domain (quants with positive quantity if None)
+            fields: Fields to read (QUANT_FIELDS if None)
+            
+        Yields:
+            Lists of stock quant dictionaries, one list per page
+        """
+        if not self._ensure_authenticated():
+            return
+        
+        yield from self._iter_search_read(
+            'stock.quant', domain or [['quantity', '>', 0]], fields or self.QUANT_FIELDS, batch_size
+        )
+    
+    def get_field_types(self, model: str, fields: List[str]) -> Dict[str, str]:
+        """Get the Odoo field type (char, float, many2one, ...) of each requested field"""
+        if not self._ensure_authenticated():
+            return {}
+        
+        definitions = self._execute_kw(model, 'fields_get', [fields], {'attributes': ['type']})
+        return {name: definition['type'] for name, definition in definitions.items()}
+    
+    def get_many2one_fields(self, model: str, fields: List[str]) -> List[str]:
+        """Get the requested fields that are many-to-one relations"""
+        return [name for name, field_type in self.get_field_types(model, fields).items() if field_type == 'many2one']
+    
+    def fetch_products(self, limit: Optional[int] = 100, batch_size: int = DEFAULT_BATCH_SIZE,
+                       workers: int = 1, executor: str = 'thread') -> List[Dict[str, Any]]:
         """
         Fetch products from inventory using XML-RPC
+        
+        Args:
+            limit: Maximum number of products to fetch (None fetches the whole catalog)
+            batch_size: Number of products requested per XML-RPC call
+            workers: Number of pages fetched concurrently (1 fetches serially)
+            executor: Worker pool type, 'thread' or 'process'
         """
-        if not hasattr(self, 'uid') or not self.uid:
-            if not self.authenticate():
-                return []
+        if not self._ensure_authenticated():
+            return []
         
         try:
             # Try different search criteria
@@ -149,29 +429,11 @@ class OdooInventoryFetcher:
             for i, search_filter in enumerate(search_filters):
                 print(f"🔍 Searching with filter {i+1}: {search_filter or 'All products'}")
                 
-                # Search for products using XML-RPC
-                product_ids = self.models.execute_kw(
-                    self.database, self.uid, self.api_key,
-                    'product.product', 'search',
-                    [search_filter],
-                    {'limit': limit}
-                )
+                products = self._read_all('product.product', search_filter, self.PRODUCT_FIELDS,
+                                          batch_size, limit, workers, executor)
                 
-                if product_ids:
-                    print(f"✅ Found {len(product_ids)} products")
-                    
-                    # Read product details
-                    products = self.models.execute_kw(
-                        self.database, self.uid, self.api_key,
-                        'product.product', 'read',
-                        [product_ids],
-                        {'fields': [
-                            'name', 'default_code', 'barcode', 'list_price', 
-                            'standard_price', 'qty_available', 'virtual_available',
-                            'categ_id', 'uom_id', 'active', 'type'
-                        ]}
-                    )
-                    
+                if products:
+                    print(f"✅ Found {len(products)} products")
                     return products
                 else:
                     print(f"❌ No products found with filter {i+1}")
@@ -183,43 +445,30 @@ class OdooInventoryFetcher:
             print(f"❌ Error fetching products: {e}")
             return []
     
-    def fetch_stock_quants(self, limit: int = 100) -> List[Dict[str, Any]]:
+    def fetch_stock_quants(self, limit: Optional[int] = 100, batch_size: int = DEFAULT_BATCH_SIZE,
+                           workers: int = 1, executor: str = 'thread') -> List[Dict[str, Any]]:
         """
         Fetch stock quantities from stock.quant model using XML-RPC
         
         Args:
-            limit: Maximum number of stock records to fetch
+            limit: Maximum number of stock records to fetch (None fetches all of them)
+            batch_size: Number of stock records requested per XML-RPC call
+            workers: Number of pages fetched concurrently (1 fetches serially)
+            executor: Worker pool type, 'thread' or 'process'
             
         Returns:
             List of stock quantity dictionaries
         """
-        if not hasattr(self, 'uid') or not self.uid:
-            if not self.authenticate():
-                return []
+        if not self._ensure_authenticated():
+            return []
         
         try:
-            # Search for stock quants with positive quantities using XML-RPC
-            quant_ids = self.models.execute_kw(
-                self.database, self.uid, self.api_key,
-                'stock.quant', 'search',
-                [[['quantity', '>', 0]]],
-                {'limit': limit}
-            )
+            # Read stock quants with positive quantities using XML-RPC
+            quants = self._read_all('stock.quant', [['quantity', '>', 0]], self.QUANT_FIELDS,
+                                    batch_size, limit, workers, executor)
             
-            if not quant_ids:
+            if not quants:
                 print("No stock quantities found")
-                return []
-            
-            # Read stock quant details using XML-RPC
-            quants = self.models.execute_kw(
-                self.database, self.uid, self.api_key,
-                'stock.quant', 'read',
-                [quant_ids],
-                {'fields': [
-                    'product_id', 'location_id', 'quantity', 
-                    'reserved_quantity', 'available_quantity'
-                ]}
-            )
             
             return quants
             
@@ -227,37 +476,265 @@ class OdooInventoryFetcher:
             print(f"❌ Error fetching stock quants: {e}")
             return []
     
-    def get_inventory_summary(self) -> Dict[str, Any]:
-        """Get comprehensive inventory summary"""
-        products = self.fetch_products()
-        stock_quants = self.fetch_stock_quants()
+    def _sync_model(self, store: OdooSnapshotStore, model: str, domain: list, fields: List[str],
+                    batch_size: int, extra_ids: List[int] = None) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """
+        Bring the stored snapshot of one model up to date
+        
+        The first sync copies every matching record. Later syncs only read records
+        whose write_date is at or after the stored watermark (plus any extra_ids),
+        then diff the current ID set against the store to drop deleted records.
+        
+        Returns:
+            Tuple of (changed record IDs, removed records as they were stored)
+        """
+        watermark = store.get_watermark(model)
+        fields = list(fields) + ['write_date']
+        
+        if watermark is None:
+            print(f"🆕 {model}: no snapshot yet, running full sync")
+            changed_domain = domain
+        else:
+            print(f"🔁 {model}: syncing changes since {watermark}")
+            changed_domain = [['write_date', '>=', watermark]]
+            if extra_ids:
+                changed_domain = ['|'] + changed_domain + [['id', 'in', list(extra_ids)]]
+            changed_domain = domain + changed_domain
+        
+        changed_ids = []
+        max_write_date = watermark or ''
+        for page in self._iter_search_read(model, changed_domain, fields, batch_size):
+            store.upsert(model, page)
+            changed_ids.extend(record['id'] for record in page)
+            max_write_date = max([max_write_date] + [record['write_date'] or '' for record in page])
+        
+        removed = []
+        if watermark is not None:
+            current_ids = set(self._execute_kw(model, 'search', [domain]))
+            removed_ids = store.ids(model) - current_ids
+            removed = store.records(model, removed_ids)
+            store.delete(model, removed_ids)
+        
+        store.set_watermark(model, max_write_date)
+        print(f"✅ {model}: {len(changed_ids)} changed, {len(removed)} removed")
+        return changed_ids, removed
+    
+    def sync_inventory(self, store: OdooSnapshotStore,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Incrementally sync products and stock quants into a local snapshot store
+        
+        Stock moves do not touch product.product write_date, so products whose
+        quants changed or disappeared are re-read as well to keep qty fields fresh.
+        
+        Args:
+            store: Snapshot store holding the previous sync
+            batch_size: Number of records requested per XML-RPC call
+            
+        Returns:
+            Tuple of (products, stock quants) as currently stored
+        """
+        if not self._ensure_authenticated():
+            return [], []
         
-        summary = {
+        quant_ids, removed_quants = self._sync_model(
+            store, 'stock.quant', [['quantity', '>', 0]], self.QUANT_FIELDS, batch_size
+        )
+        touched_products = {
+            quant['product_id'][0]
+            for quant in store.records('stock.quant', quant_ids) + removed_quants
+            if quant.get('product_id')
+        }
+        self._sync_model(store, 'product.product', [], self.PRODUCT_FIELDS, batch_size,
+                         extra_ids=sorted(touched_products))
+        
+        return store.records('product.product'), store.records('stock.quant')
+    
+    def invalidate_summary(self) -> None:
+        """Drop memoized inventory summaries so the next call fetches fresh data"""
+        self._summary_cache.clear()
+    
+    def get_inventory_frames(self, store: OdooSnapshotStore = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Load products and stock quants into columnar pandas DataFrames
+        
+        Records are streamed page by page (from the snapshot store when given) and
+        many-to-one fields, as reported by Odoo's field metadata, are split into
+        Int64 id columns and categorical name columns. Pass the frames to odoo_columnar.summarize_frames for vectorized
+        stock counts, per-location totals and low-stock detection.
+        
+        Returns:
+            Tuple of (products DataFrame, stock quants DataFrame)
+        """
+        from odoo_columnar import pages_to_frame
+        
+        product_many2one = self.get_many2one_fields('product.product', self.PRODUCT_FIELDS)
+        quant_many2one = self.get_many2one_fields('stock.quant', self.QUANT_FIELDS)
+        if store is not None:
+            return (pages_to_frame(store.iter_records('product.product', batch_size), product_many2one),
+                    pages_to_frame(store.iter_records('stock.quant', batch_size), quant_many2one))
+        
+        return (pages_to_frame(self.iter_products(batch_size), product_many2one),
+                pages_to_frame(self.iter_stock_quants(batch_size), quant_many2one))
+    
+    def _aggregate_summary(self) -> Dict[str, Any]:
+        """
+        Ask Odoo for the headline inventory numbers with search_count and read_group
+        
+        A handful of small responses replaces transferring the product and quant
+        tables just to count them client-side.
+        """
+        stock_domain = [['quantity', '>', 0]]
+        stock_by_location = self._execute_kw(
+            'stock.quant', 'read_group', [stock_domain, ['location_id', 'quantity:sum'], ['location_id']],
+            {'lazy': False}
+        )
+        products_by_category = self._execute_kw(
+            'product.product', 'read_group', [[], ['categ_id'], ['categ_id']], {'lazy': False}
+        )
+        
+        return {
+            'total_products': self._execute_kw('product.product', 'search_count', [[]]),
+            'products_with_stock': self._execute_kw('product.product', 'search_count',
+                                                    [[['qty_available', '>', 0]]]),
+            'low_stock_products': self._execute_kw('product.product', 'search_count',
+                                                   [[['qty_available', '<=', self.low_stock_threshold]]]),
+            'total_stock_locations': len(stock_by_location),
+            'stock_by_location': [
+                {'location_id': group['location_id'], 'quantity': group['quantity'],
+                 'quant_count': group['__count']}
+                for group in stock_by_location
+            ],
+            'products_by_category': [
+                {'categ_id': group['categ_id'], 'product_count': group['__count']}
+                for group in products_by_category
+            ]
+        }
+    
+    def _summarize_records(self, products: List[Dict[str, Any]],
+                           stock_quants: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute the same aggregates as _aggregate_summary from already fetched records
+        
+        Counts, per-location totals and low-stock detection run vectorized with
+        odoo_columnar when pandas is installed, and in plain Python otherwise.
+        """
+        if products or stock_quants:
+            try:
+                from odoo_columnar import records_to_frame, summarize_frames
+            except ImportError:
+                pass
+            else:
+                return summarize_frames(
+                    records_to_frame(products, self.get_many2one_fields('product.product', self.PRODUCT_FIELDS)),
+                    records_to_frame(stock_quants, self.get_many2one_fields('stock.quant', self.QUANT_FIELDS)),
+                    self.low_stock_threshold
+                )
+        
+        locations = {}
+        for quant in stock_quants:
+            location = quant.get('location_id') or [False, '']
+            group = locations.setdefault(location[0], {'location_id': location, 'quantity': 0, 'quant_count': 0})
+            group['quantity'] += quant.get('quantity', 0)
+            group['quant_count'] += 1
+        
+        categories = {}
+        for product in products:
+            category = product.get('categ_id') or [False, '']
+            group = categories.setdefault(category[0], {'categ_id': category, 'product_count': 0})
+            group['product_count'] += 1
+        
+        return {
             'total_products': len(products),
             'products_with_stock': len([p for p in products if p.get('qty_available', 0) > 0]),
-            'total_stock_locations': len(set(q.get('location_id', [0])[0] for q in stock_quants)),
-            'products': products,
-            'stock_quants': stock_quants
+            'low_stock_products': len([p for p in products
+                                       if (p.get('qty_available') or 0) <= self.low_stock_threshold]),
+            'total_stock_locations': len(locations),
+            'stock_by_location': list(locations.values()),
+            'products_by_category': list(categories.values())
         }
+    
+    def get_inventory_summary(self, store: OdooSnapshotStore = None, refresh: bool = False,
+                              detail: bool = False) -> Dict[str, Any]:
+        """
+        Get comprehensive inventory summary
+        
+        By default only aggregates are returned: totals, per-location stock sums and
+        per-category product counts, computed server-side. With detail=True the full
+        product and stock quant lists are fetched and included as well.
         
+        Summaries are memoized for summary_ttl seconds, so callers such as the
+        report and the JSON export share one snapshot. The returned dict is the
+        cached object and should be treated as read-only.
+        
+        Args:
+            store: Snapshot store for incremental sync (fetches fresh data if None)
+            refresh: Ignore any memoized summary and fetch again
+            detail: Include every product and stock quant record in the summary
+        """
+        store_key = store.path if store is not None else None
+        cached = self._summary_cache.get((store_key, detail))
+        if cached and not refresh and self.summary_ttl != 0:
+            created_at, summary = cached
+            if self.summary_ttl is None or time.monotonic() - created_at < self.summary_ttl:
+                return summary
+        
+        if not self._ensure_authenticated():
+            return self._summarize_records([], [])
+        
+        if store is not None:
+            # The snapshot holds every record, so aggregate locally
+            products, stock_quants = self.sync_inventory(store)
+            summary = self._summarize_records(products, stock_quants)
+        else:
+            try:
+                summary = self._aggregate_summary()
+            except Exception as e:
+                print(f"❌ Error aggregating inventory: {e}")
+                return self._summarize_records([], [])
+            
+            if detail:
+                products = self.fetch_products(limit=None)
+                stock_quants = self.fetch_stock_quants(limit=None)
+        
+        if detail:
+            summary['products'] = products
+            summary['stock_quants'] = stock_quants
+        
+        self._summary_cache[(store_key, detail)] = (time.monotonic(), summary)
+        if detail:
+            # A detailed summary also answers aggregate-only requests
+            self._summary_cache[(store_key, False)] = self._summary_cache[(store_key, True)]
         return summary
     
-    def print_inventory_report(self):
+    def print_inventory_report(self, store: OdooSnapshotStore = None):
         """Print formatted inventory report"""
         print("\n" + "="*60)
         print("📦 ODOO INVENTORY REPORT")
         print("="*60)
         
-        summary = self.get_inventory_summary()
+        summary = self.get_inventory_summary(store)
         
         print(f"Total Products: {summary['total_products']}")
         print(f"Products with Stock: {summary['products_with_stock']}")
         print(f"Stock Locations: {summary['total_stock_locations']}")
         
+        print("\n📍 STOCK BY LOCATION:")
+        print("-" * 60)
+        
+        for group in summary['stock_by_location'][:10]:  # Show first 10 locations
+            location = group['location_id'][1] if group['location_id'] else 'Unknown'
+            print(f"• {location[:40]:<40} | Qty: {group['quantity']:<10} | Quants: {group['quant_count']}")
+        
         print("\n📋 PRODUCT DETAILS:")
         print("-" * 60)
         
-        for product in summary['products'][:10]:  # Show first 10 products
+        # Aggregate-only summaries carry no records, so read just the preview
+        products = summary.get('products')
+        if products is None:
+            products = self.fetch_products(limit=10)
+        
+        for product in products[:10]:  # Show first 10 products
             name = product.get('name', 'Unknown')
             code = product.get('default_code', 'N/A')
             qty = product.get('qty_available', 0)
@@ -265,11 +742,26 @@ class OdooInventoryFetcher:
             
             print(f"• {name[:30]:<30} | Code: {code:<10} | Qty: {qty:<8} | Price: ${price:.2f}")
         
-        if len(summary['products']) > 10:
-            print(f"... and {len(summary['products']) - 10} more products")
+        if summary['total_products'] > 10:
+            print(f"... and {summary['total_products'] - 10} more products")
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Fetch current inventory from Odoo")
+    parser.add_argument('--snapshot', metavar='PATH',
+                        help="SQLite snapshot file enabling incremental sync keyed on write_date")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Ignore cached data and fetch everything again (resets the snapshot)")
+    parser.add_argument('--detail', action='store_true',
+                        help="Include every product and stock quant in the JSON output, not just aggregates")
+    parser.add_argument('--format', choices=['json', 'ndjson', 'parquet'], default='json',
+                        help="json writes one summary file; ndjson and parquet stream one file per table")
+    parser.add_argument('--compression', choices=['gzip', 'zstd'],
+                        help="Compression for ndjson output")
+    parser.add_argument('--output', metavar='PATH',
+                        help="Output file (json) or directory (ndjson, parquet)")
+    args = parser.parse_args()
+    
     # Configuration from environment variables
     ODOO_URL = os.getenv('ODOO_URL', 'https://your-instance.odoo.com')
     API_KEY = os.getenv('ODOO_API_KEY', 'your_api_key_here')
@@ -282,19 +774,42 @@ def main():
     # Initialize fetcher
     fetcher = OdooInventoryFetcher(ODOO_URL, API_KEY, DATABASE_NAME)
     
+    store = OdooSnapshotStore(args.snapshot) if args.snapshot else None
+    if store is not None and args.refresh:
+        store.reset()
+    
     # Authenticate and fetch data
     if fetcher.authenticate():
-        # Print inventory report
-        fetcher.print_inventory_report()
+        # Fetch once; the report and the JSON export share the memoized summary
+        summary = fetcher.get_inventory_summary(store, refresh=args.refresh, detail=args.detail)
         
-        # Save to JSON file
-        summary = fetcher.get_inventory_summary()
-        with open('odoo_inventory.json', 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        # Print inventory report
+        fetcher.print_inventory_report(store)
         
-        print(f"\n💾 Inventory data saved to 'odoo_inventory.json'")
+        if args.format == 'json':
+            # Save to JSON file
+            output = args.output or 'odoo_inventory.json'
+            with open(output, 'w') as f:
+                json.dump(summary, f, indent=2, default=str)
+            
+            print(f"\n💾 Inventory data saved to '{output}'")
+        else:
+            # Stream records table by table instead of building one document
+            from odoo_inventory_exporter import InventoryExporter
+            
+            output = args.output or 'odoo_inventory'
+            exporter = InventoryExporter(fetcher, store)
+            if args.format == 'ndjson':
+                exporter.export_ndjson(output, args.compression)
+            else:
+                exporter.export_parquet(output)
+            
+            print(f"\n💾 Inventory data saved to '{output}/'")
     else:
         print("❌ Failed to authenticate with Odoo")
+    
+    if store is not None:
+        store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Odoo Snapshot Store
+Local SQLite copy of fetched Odoo records used for incremental inventory syncs
+"""
+
+import json
+import sqlite3
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set
+
+
+class OdooSnapshotStore:
+    """SQLite-backed snapshot of Odoo records with a write_date watermark per model"""
+
+    def __init__(self, path: str = 'odoo_inventory_snapshot.db'):
+        """
+        Open (or create) a snapshot database
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                model TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                write_date TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (model, id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                model TEXT PRIMARY KEY,
+                max_write_date TEXT
+            );
+        """)
+
+    def get_watermark(self, model: str) -> Optional[str]:
+        """Get the highest write_date synced for a model (None if never synced)"""
+        row = self.connection.execute(
+            "SELECT max_write_date FROM sync_state WHERE model = ?", (model,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, model: str, write_date: Optional[str]) -> None:
+        """Record the highest write_date synced for a model"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state (model, max_write_date) VALUES (?, ?)",
+                (model, write_date or '')
+            )
+
+    def upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        """Insert or replace records of a model"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO records (model, id, write_date, data) VALUES (?, ?, ?, ?)",
+                [(model, record['id'], record.get('write_date'), json.dumps(record, default=str))
+                 for record in records]
+            )
+
+    def delete(self, model: str, ids: Iterable[int]) -> None:
+        """Remove records of a model by ID"""
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM records WHERE model = ? AND id = ?",
+                [(model, record_id) for record_id in ids]
+            )
+
+    def ids(self, model: str) -> Set[int]:
+        """Get the set of record IDs stored for a model"""
+        rows = self.connection.execute("SELECT id FROM records WHERE model = ?", (model,))
+        return {row[0] for row in rows}
+
+    def records(self, model: str, ids: Iterable[int] = None) -> List[Dict[str, Any]]:
+        """Get stored records of a model ordered by ID, optionally restricted to some IDs"""
+        if ids is None:
+            rows = self.connection.execute(
+                "SELECT data FROM records WHERE model = ? ORDER BY id", (model,)
+            )
+            return [json.loads(row[0]) for row in rows]
+
+        ids = sorted(ids)
+        records = []
+        # Stay below SQLite's bound parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT data FROM records WHERE model = ? AND id IN ({','.join('?' * len(chunk))}) ORDER BY id",
+                (model, *chunk)
+            )
+            records.extend(json.loads(row[0]) for row in rows)
+        return records
+
+    def iter_records(self, model: str, batch_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """Stream stored records of a model ordered by ID, one page at a time"""
+        last_id = 0
+        while True:
+            rows = self.connection.execute(
+                "SELECT id, data FROM records WHERE model = ? AND id > ? ORDER BY id LIMIT ?",
+                (model, last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [json.loads(row[1]) for row in rows]
+
+    def reset(self, model: str = None) -> None:
+        """Drop stored records and watermarks for one model, or for all models"""
+        with self.connection:
+            if model is None:
+                self.connection.execute("DELETE FROM records")
+                self.connection.execute("DELETE FROM sync_state")
+            else:
+                self.connection.execute("DELETE FROM records WHERE model = ?", (model,))
+                self.connection.execute("DELETE FROM sync_state WHERE model = ?", (model,))
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()
@@ -9,7 +9,6 @@ if "%TEST_ENV%"=="" set TEST_ENV=dev
 if "%BROWSER%"=="" set BROWSER=chrome
 if "%HEADLESS%"=="" set HEADLESS=false
 if "%PARALLEL%"=="" set PARALLEL=false
-if "%WORKERS%"=="" set WORKERS=4
 set TAGS=
 
 REM Colors (limited support in Windows CMD)
@@ -58,7 +57,7 @@ echo   --env=ENV       Set test environment (dev^|qa^|stage) [default: dev]
 echo   --browser=BR    Set browser (chrome^|firefox^|safari) [default: chrome]
 echo   --headless      Run in headless mode
 echo   --parallel      Run tests in parallel
-echo   --workers=N     Number of parallel workers [default: 4]
+echo   --workers=N     Number of parallel workers [default: parallel.max_workers]
 echo   --tags=TAGS     Run tests with specific tags
 echo.
 echo %YELLOW%Examples:%NC%
@@ -160,18 +159,23 @@ set TEST_ENV=%TEST_ENV%
 set BROWSER=%BROWSER%
 set HEADLESS=%HEADLESS%
 
-REM Build behave command
+REM Build behave command (the parallel runner takes the same paths and tags)
 set behave_cmd=behave %feature_path%
+if "%PARALLEL%"=="true" set behave_cmd=python -m utility.execution.parallel_runner %feature_path%
 
 REM Add tags if specified
 if not "%TAGS%"=="" set behave_cmd=%behave_cmd% --tags="%TAGS%"
 
-REM Add output formats
-set behave_cmd=%behave_cmd% --format=html --outfile=reports/html/%report_name%.html
-set behave_cmd=%behave_cmd% --format=json --outfile=reports/json/%report_name%.json
-
-REM Add parallel execution if enabled
-if "%PARALLEL%"=="true" set behave_cmd=%behave_cmd% --processes=%WORKERS%
+REM Add output formats; parallel runs merge worker results into JSON and JUnit reports
+REM and render the HTML report from the merged JSON
+if "%PARALLEL%"=="true" (
+    if not "%WORKERS%"=="" set behave_cmd=!behave_cmd! --workers=%WORKERS%
+    set behave_cmd=!behave_cmd! --json-output=reports/json/%report_name%.json
+    set behave_cmd=!behave_cmd! --html-output=reports/html/%report_name%.html
+) else (
+    set behave_cmd=!behave_cmd! --format=html --outfile=reports/html/%report_name%.html
+    set behave_cmd=!behave_cmd! --format=json --outfile=reports/json/%report_name%.json
+)
 
 REM Execute tests
 call :print_info "Executing: %behave_cmd%"
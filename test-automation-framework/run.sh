@@ -17,7 +17,7 @@ TEST_ENV=${TEST_ENV:-dev}
 BROWSER=${BROWSER:-chrome}
 HEADLESS=${HEADLESS:-false}
 PARALLEL=${PARALLEL:-false}
-WORKERS=${WORKERS:-4}
+WORKERS=${WORKERS:-}
 TAGS=""
 
 # Function to print colored output
@@ -59,7 +59,7 @@ show_help() {
     echo "  --browser=BR    Set browser (chrome|firefox|safari) [default: chrome]"
     echo "  --headless      Run in headless mode"
     echo "  --parallel      Run tests in parallel"
-    echo "  --workers=N     Number of parallel workers [default: 4]"
+    echo "  --workers=N     Number of parallel workers [default: parallel.max_workers]"
     echo "  --tags=TAGS     Run tests with specific tags"
     echo ""
     echo -e "${YELLOW}Examples:${NC}"
@@ -156,21 +156,28 @@ run_tests() {
     export BROWSER=$BROWSER
     export HEADLESS=$HEADLESS
     
-    # Build behave command
+    # Build behave command (the parallel runner takes the same paths and tags)
     local behave_cmd="behave $feature_path"
+    if [ "$PARALLEL" = "true" ]; then
+        behave_cmd="python3 -m utility.execution.parallel_runner $feature_path"
+    fi
     
     # Add tags if specified
     if [ -n "$TAGS" ]; then
         behave_cmd="$behave_cmd --tags=\"$TAGS\""
     fi
     
-    # Add output formats
-    behave_cmd="$behave_cmd --format=html --outfile=reports/html/${report_name}.html"
-    behave_cmd="$behave_cmd --format=json --outfile=reports/json/${report_name}.json"
-    
-    # Add parallel execution if enabled
+    # Add output formats; parallel runs merge worker results into JSON and JUnit reports
+    # and render the HTML report from the merged JSON
     if [ "$PARALLEL" = "true" ]; then
-        behave_cmd="$behave_cmd --processes=$WORKERS"
+        if [ -n "$WORKERS" ]; then
+            behave_cmd="$behave_cmd --workers=$WORKERS"
+        fi
+        behave_cmd="$behave_cmd --json-output=reports/json/${report_name}.json"
+        behave_cmd="$behave_cmd --html-output=reports/html/${report_name}.html"
+    else
+        behave_cmd="$behave_cmd --format=html --outfile=reports/html/${report_name}.html"
+        behave_cmd="$behave_cmd --format=json --outfile=reports/json/${report_name}.json"
     fi
     
     # Execute tests
@@ -180,6 +187,9 @@ run_tests() {
     if [ $? -eq 0 ]; then
         print_success "$test_type tests completed successfully!"
         print_info "Report generated: reports/html/${report_name}.html"
+        if [ "$PARALLEL" = "true" ]; then
+            print_info "Merged results: reports/json/${report_name}.json (screenshots are named per worker)"
+        fi
     else
         print_error "$test_type tests failed!"
         exit 1
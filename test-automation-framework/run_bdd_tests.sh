@@ -2,10 +2,16 @@
 
 echo "🧪 Running Odoo Inventory BDD Tests..."
 
+# Run against the bundled fake Odoo server with --offline
+if [ "$1" = "--offline" ]; then
+    export ODOO_FAKE_SERVER=1
+    echo "🔌 Offline mode: using local fake Odoo server"
+fi
+
 # Install dependencies
 pip install -r test/requirements.txt
 
 # Run BDD tests from project root
 behave test/ -v
 
-echo "✅ BDD Tests completed"
\ No newline at end of file
+echo "✅ BDD Tests completed"
@@ -3,6 +3,8 @@ Step definitions for User API functionality
 """
 from behave import given, when, then
 from api.user_api import UserAPI
+from api.async_user_api import AsyncUserAPI
+import asyncio
 import json
 
 @given('I have a User API client')
@@ -124,11 +126,14 @@ def step_verify_response_contains_user_data(context):
 @then('the response should contain field "{field_name}" with value "{expected_value}"')
 def step_verify_response_field_value(context, field_name, expected_value):
     """Verify specific field value in response"""
-    response_data = context.api_response['data']
-    assert response_data is not None, "Response data is None"
-    assert field_name in response_data, f"Field '{field_name}' not found in response"
+    assert context.api_response['data'] is not None, "Response data is None"
+    
+    # field_name may be a path into the body, e.g. "address.city" or "roles[0]"
+    missing = object()
+    actual_value = context.api_response.extract(field_name, missing)
+    assert actual_value is not missing, f"Field '{field_name}' not found in response"
     
-    actual_value = str(response_data[field_name])
+    actual_value = str(actual_value)
     assert actual_value == expected_value, \
         f"Expected {field_name} to be '{expected_value}', but got '{actual_value}'"
 
@@ -166,8 +171,9 @@ def step_verify_user_created_successfully(context):
     assert response_data is not None, "Response data is None"
     assert 'id' in response_data, "Created user does not have ID"
     
-    # Store created user ID for cleanup
+    # Store created user ID and delete the user after the scenario
     context.created_user_id = response_data['id']
+    context.resource_registry.add(context.user_api.delete_users, context.created_user_id)
 
 @then('the user should be deleted successfully')
 def step_verify_user_deleted_successfully(context):
@@ -184,4 +190,65 @@ def step_verify_validation_errors(context):
     response_data = context.api_response['data']
     if response_data:
         assert 'errors' in response_data or 'message' in response_data, \
-            "Response does not contain validation errors"
\ No newline at end of file
+            "Response does not contain validation errors"
+
+@when('I create {count:d} users concurrently')
+def step_create_users_concurrently(context, count):
+    """Create many users at once with the async client"""
+    users = [{
+        "name": f"Concurrent User {index}",
+        "email": f"concurrent.user{index}@example.com",
+        "password": "securePassword123",
+        "role": "user"
+    } for index in range(count)]
+    
+    async def create_all():
+        async with AsyncUserAPI() as api:
+            return await api.create_users(users)
+    
+    context.api_responses = asyncio.run(create_all())
+    context.resource_registry.add(context.user_api.delete_users,
+                                  *[result.data['id'] for result in context.api_responses if result.data])
+
+@then('every response status code should be {status_code:d}')
+def step_verify_all_status_codes(context, status_code):
+    """Verify the status code of every concurrent response"""
+    failed = [result for result in context.api_responses if result['status_code'] != status_code]
+    assert not failed, \
+        f"{len(failed)} of {len(context.api_responses)} responses were not {status_code}: " \
+        f"{sorted({result['status_code'] for result in failed})}"
+
+@given('{count:d} users exist')
+def step_seed_users(context, count):
+    """Create users in bulk; they are deleted again after the scenario"""
+    context.seeded_users = [{
+        "name": f"Seeded User {index}",
+        "email": f"seeded.user{index}@example.com",
+        "password": "securePassword123",
+        "role": "user"
+    } for index in range(count)]
+    context.bulk_result = context.user_api.create_users(context.seeded_users,
+                                                        registry=context.resource_registry)
+
+@then('all seeded users should be created')
+def step_verify_seeded_users(context):
+    """Verify every seeded user was created"""
+    failed = context.bulk_result['failed']
+    assert not failed, f"{len(failed)} of {len(context.seeded_users)} users were not created"
+    assert len(context.bulk_result['created']) == len(context.seeded_users), \
+        f"Expected {len(context.seeded_users)} created users, got {len(context.bulk_result['created'])}"
+
+@when('I iterate over all users')
+def step_iterate_all_users(context):
+    """Walk every page of the user list"""
+    context.user_pages = context.user_api.iter_users()
+    context.all_users = list(context.user_pages)
+
+@then('every listed user should have an id and email')
+def step_verify_all_listed_users(context):
+    """Verify every user returned across all pages"""
+    assert context.all_users, "No users were returned"
+    incomplete = [user for user in context.all_users if not user.get('id') or not user.get('email')]
+    assert not incomplete, f"{len(incomplete)} of {len(context.all_users)} users lack an id or email"
+    ids = [user['id'] for user in context.all_users]
+    assert len(ids) == len(set(ids)), "Pages returned the same user more than once"
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Behave hooks for the Odoo inventory scenarios
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from odoo_fake_server import FakeOdooDataset, FakeOdooServer
+
+
+def before_all(context):
+    """Start a local fake Odoo server when ODOO_FAKE_SERVER is set"""
+    if os.getenv('ODOO_FAKE_SERVER', '').lower() not in ('1', 'true', 'yes'):
+        return
+    
+    dataset = FakeOdooDataset(
+        products=int(os.getenv('ODOO_FAKE_PRODUCTS', '1000')),
+        seed=int(os.getenv('ODOO_FAKE_SEED', '42'))
+    )
+    context.fake_odoo = FakeOdooServer(
+        dataset=dataset,
+        latency_ms=float(os.getenv('ODOO_FAKE_LATENCY_MS', '0'))
+    ).start()
+    
+    # Step definitions read their connection settings from the environment
+    os.environ['ODOO_URL'] = context.fake_odoo.url
+    os.environ['ODOO_DATABASE'] = context.fake_odoo.odoo.database
+    print(f"🧪 Using fake Odoo at {context.fake_odoo.url} with {dataset.size['product.product']} products")
+
+
+def after_all(context):
+    """Stop the fake Odoo server"""
+    if hasattr(context, 'fake_odoo'):
+        context.fake_odoo.stop()
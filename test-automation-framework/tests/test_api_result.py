@@ -0,0 +1,62 @@
+"""
+Tests for JSONPath-style value extraction from API results
+"""
+import json
+
+import pytest
+import requests
+
+from api.api_result import APIResult, compile_path
+
+
+def _result(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response.url = 'http://api.test/users'
+    response._content = json.dumps(body).encode('utf-8')
+    return APIResult(response)
+
+
+BODY = {
+    'users': [{'id': 1, 'email': 'a@test', 'roles': ['admin']}, {'id': 2, 'email': 'b@test', 'roles': []}],
+    'odd key': {'value': 3},
+    'meta': {'total': 2},
+}
+
+
+def test_keys_indexes_and_quoted_keys():
+    result = _result(BODY)
+
+    assert result.extract('$.users[0].email') == 'a@test'
+    assert result.extract('users[-1].id') == 2
+    assert result.extract("$['odd key'].value") == 3
+    assert result.extract('meta.total') == 2
+
+
+def test_wildcards_fan_out_over_lists_and_objects():
+    result = _result(BODY)
+
+    assert result.extract('users[*].id') == [1, 2]
+    assert result.extract('users[*].roles[0]', default='none') == ['admin', 'none']
+    assert result.extract('meta[*]') == [2]
+
+
+def test_missing_paths_return_the_default():
+    result = _result(BODY)
+
+    assert result.extract('users[5].id') is None
+    assert result.extract('meta.total.value', default=0) == 0
+    assert result.extract_all(['meta.total', 'missing']) == {'meta.total': 2, 'missing': None}
+
+
+def test_body_is_available_regardless_of_status():
+    result = _result({'error': 'not found'}, status=404)
+
+    assert result.extract('error') == 'not found'
+    assert result.data is None
+    assert result['status_code'] == 404
+
+
+def test_invalid_expression_raises():
+    with pytest.raises(ValueError):
+        compile_path('users[abc')
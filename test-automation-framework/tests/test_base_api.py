@@ -0,0 +1,29 @@
+"""
+Tests for endpoint templates and request listener notification
+"""
+import time
+
+from api import base_api
+from api.base_api import endpoint_template, notify_request_listeners
+
+
+def test_endpoint_template_replaces_ids_but_keeps_slugs():
+    assert endpoint_template('/api/v1/users/123?page=2') == '/api/v1/users/{id}'
+    assert endpoint_template('/api/v1/users/507f1f77bcf86cd799439011/posts') == '/api/v1/users/{id}/posts'
+    assert endpoint_template('/api/v1/users/3f2b8c1e-9d4a-4b6e-8f00-1a2b3c4d5e6f') == '/api/v1/users/{id}'
+    assert endpoint_template('/api/v1/files/dGhpcy1pcy1hLXRva2VuLTEyMw') == '/api/v1/files/{id}'
+    assert endpoint_template('/api/v1/articles/getting-started-with-the-api') == \
+        '/api/v1/articles/getting-started-with-the-api'
+    assert endpoint_template('/api/v1/reports/quarterly_inventory_summary') == '/api/v1/reports/quarterly_inventory_summary'
+
+
+def test_failing_listener_does_not_stop_the_others(monkeypatch):
+    events = []
+
+    def broken(event):
+        raise RuntimeError('listener bug')
+
+    monkeypatch.setattr(base_api, '_request_listeners', [broken, events.append])
+    notify_request_listeners('GET', '/api/v1/users/42', 200, time.perf_counter())
+
+    assert [event['template'] for event in events] == ['/api/v1/users/{id}']
@@ -0,0 +1,72 @@
+"""
+Tests for cassette request keys, occurrence counting and concurrent recording
+"""
+import multiprocessing
+
+import requests
+
+from api.cassette import CassetteStore, normalize_body, normalize_url, request_key
+
+
+def _response(url, body=b'{}', status=200):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = 'OK'
+    response.url = url
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    response.request = requests.Request('GET', url).prepare()
+    return response
+
+
+def test_equivalent_requests_share_a_key():
+    assert normalize_url('HTTP://API.Example.com/users?b=2&a=1') == 'http://api.example.com/users?a=1&b=2'
+    assert normalize_body('{"b": 1, "a": [1, 2]}') == b'{"a":[1,2],"b":1}'
+    assert normalize_body(b'not json') == b'not json'
+
+    headers = {'authorization': 'Bearer a', 'x-request-id': '1'}
+    key = request_key('get', 'http://api/users?b=2&a=1', '{"x": 1}', headers, ['Authorization'])
+    assert key == request_key('GET', 'http://api/users?a=1&b=2', b'{ "x" : 1 }',
+                              {'authorization': 'Bearer a', 'x-request-id': '2'}, ['Authorization'])
+    assert key != request_key('GET', 'http://api/users?a=1&b=2', '{"x": 1}',
+                              {'authorization': 'Bearer b'}, ['Authorization'])
+
+
+def test_occurrences_replay_in_order_and_restart_per_cassette(tmp_path):
+    store = CassetteStore(str(tmp_path / 'cassettes.db'))
+    store.use_cassette('update user')
+    assert store.next_occurrence('k') == ('update user', 0)
+    assert store.next_occurrence('k') == ('update user', 1)
+    assert store.next_occurrence('other') == ('update user', 0)
+
+    store.save('update user', 'k', 0, _response('http://api/users/1', b'{"v": 1}'))
+    store.save('update user', 'k', 1, _response('http://api/users/1', b'{"v": 2}'))
+    assert store.load('update user', 'k', 0)[3] == b'{"v": 1}'
+    assert store.load('update user', 'k', 1)[3] == b'{"v": 2}'
+    # Seen more often than recorded: the last recording is replayed again
+    assert store.load('update user', 'k', 5)[3] == b'{"v": 2}'
+    assert store.load('update user', 'missing', 0) is None
+
+    store.use_cassette('another scenario')
+    assert store.next_occurrence('k') == ('another scenario', 0)
+
+
+def _record(path, worker, count):
+    store = CassetteStore(path)
+    for occurrence in range(count):
+        store.save(f'worker{worker}', 'k', occurrence, _response(f'http://api/users/{occurrence}'))
+
+
+def test_parallel_workers_record_into_one_file(tmp_path):
+    path = str(tmp_path / 'cassettes.db')
+    CassetteStore(path)
+    workers = [multiprocessing.Process(target=_record, args=(path, worker, 50)) for worker in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    assert [process.exitcode for process in workers] == [0, 0, 0, 0]
+    store = CassetteStore(path)
+    assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert store.connection.execute("SELECT COUNT(*) FROM recordings").fetchone()[0] == 200
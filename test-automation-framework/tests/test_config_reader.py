@@ -0,0 +1,59 @@
+"""
+Tests for layered configuration resolution
+"""
+import json
+
+import pytest
+
+from utility.common.config_reader import ConfigReader
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setenv('TEST_ENV', 'qa')
+    for variable in ('BROWSER', 'HEADLESS', 'API_CASSETTE_MODE', 'TEST_CONFIG_SNAPSHOT'):
+        monkeypatch.delenv(variable, raising=False)
+    path = tmp_path / 'config.yaml'
+    path.write_text(
+        "browser:\n  name: chrome\n  headless: false\n"
+        "database:\n  host: localhost\n  port: 5432\n"
+        "http:\n  retries:\n    status_forcelist: [429, 503]\n"
+        "environments:\n  qa:\n    database:\n      host: qa-db\n"
+    )
+    ConfigReader.clear_cache()
+    ConfigReader.clear_overrides()
+    yield str(path)
+    ConfigReader.clear_overrides()
+    ConfigReader.clear_cache()
+
+
+def test_environment_section_is_merged_over_global_settings(config_file):
+    config = ConfigReader(config_file)
+
+    assert config.get_database_config() == {'host': 'qa-db', 'port': 5432}
+
+
+def test_overrides_convert_only_booleans_and_numbers(config_file):
+    ConfigReader.set_overrides({'headless': 'TRUE', 'timeouts.default': '60', 'ratio': '0.5',
+                                'feature.flag': 'no', 'feature.mode': 'off', 'feature.version': '1.2.3'})
+    config = ConfigReader(config_file)
+
+    assert config.get_headless_mode() is True
+    assert config.get_timeout() == 60
+    assert config.get_config_value('ratio') == 0.5
+    assert config.get_config_value('feature.flag') == 'no'
+    assert config.get_config_value('feature.mode') == 'off'
+    assert config.get_config_value('feature.version') == '1.2.3'
+
+
+def test_getters_return_mutable_json_serializable_copies(config_file):
+    config = ConfigReader(config_file)
+
+    database = config.get_database_config()
+    database['host'] = 'changed'
+    statuses = config.get_config_value('http.retries.status_forcelist')
+    statuses.append(500)
+
+    assert config.get_database_config()['host'] == 'qa-db'
+    assert config.get_config_value('http.retries.status_forcelist') == [429, 503]
+    assert json.loads(json.dumps(config.get_config_value('http'))) == {'retries': {'status_forcelist': [429, 503]}}
@@ -0,0 +1,37 @@
+"""
+Tests for the HTML report rendered from merged behave JSON results
+"""
+from utility.execution.html_report import write_html_report
+
+
+def _feature(status, screenshots=()):
+    scenario = {
+        'type': 'scenario', 'keyword': 'Scenario', 'name': 'Login <admin>', 'status': status,
+        'location': 'features/login.feature:3',
+        'steps': [{'keyword': 'Given', 'name': 'the login page',
+                   'result': {'status': status, 'duration': 0.5,
+                              'error_message': ['Assertion Failed', 'boom'] if status == 'failed' else None}}],
+    }
+    if screenshots:
+        scenario['screenshots'] = list(screenshots)
+    return {'keyword': 'Feature', 'name': 'Login', 'status': status,
+            'elements': [{'type': 'background', 'keyword': 'Background', 'name': '', 'steps': []}, scenario]}
+
+
+def test_report_counts_scenarios_and_escapes_text(tmp_path):
+    path = write_html_report([_feature('passed'), _feature('failed')], str(tmp_path / 'report.html'))
+    page = open(path, encoding='utf-8').read()
+
+    assert '<span>2 scenarios</span>' in page
+    assert '1 failed' in page and '1 passed' in page
+    assert 'Login &lt;admin&gt;' in page
+    assert 'Assertion Failed\nboom' in page
+    assert 'Background' not in page
+
+
+def test_screenshots_are_linked_relative_to_the_report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    feature = _feature('failed', ['reports/screenshots/failed_login_worker2.png'])
+    path = write_html_report([feature], str(tmp_path / 'reports' / 'html' / 'report.html'))
+
+    assert 'src="../screenshots/failed_login_worker2.png"' in open(path, encoding='utf-8').read()
@@ -0,0 +1,45 @@
+"""
+Tests for the log-linear latency histogram used by load and API timing reports
+"""
+import pytest
+
+from utility.execution.latency_histogram import LatencyHistogram
+
+
+def _histogram(values_ms):
+    histogram = LatencyHistogram()
+    for value in values_ms:
+        histogram.record(value)
+    return histogram
+
+
+def test_percentiles_are_within_bucket_precision():
+    histogram = _histogram(range(1, 1001))
+
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.01)
+    assert histogram.percentile(100) == 1000
+    assert histogram.percentile(0) == pytest.approx(1, rel=0.01)
+    assert histogram.summary()['count'] == 1000
+    assert histogram.mean == pytest.approx(500.5)
+
+
+def test_small_values_are_exact_and_empty_histogram_reports_zero():
+    assert _histogram([0.05, 0.1, 0.12]).percentiles((50, 100)) == {'p50': 0.1, 'p100': 0.12}
+    assert LatencyHistogram().percentile(95) == 0.0
+
+
+def test_merge_equals_recording_everything_in_one_histogram():
+    values = [3.2, 17.5, 250.0, 0.4, 1200.0, 42.0, 42.0, 9.9]
+    merged = _histogram(values[:3]).merge(_histogram(values[3:]))
+    single = _histogram(values)
+
+    assert merged.counts == single.counts
+    assert merged.summary() == single.summary()
+    assert _histogram(values).merge(LatencyHistogram()).summary() == single.summary()
+
+
+def test_cumulative_counts_per_bound():
+    histogram = _histogram([5, 5, 5, 50, 50, 500])
+
+    assert histogram.cumulative_counts([1, 10, 100, 1000]) == [0, 3, 5, 6]
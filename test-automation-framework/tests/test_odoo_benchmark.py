@@ -0,0 +1,31 @@
+"""
+Tests for benchmark result comparison
+"""
+import pytest
+
+from odoo_benchmark import HARNESS_VERSION, compare_results
+
+
+def _results(records_per_sec, peak_rss_mb=40.0, round_trips=6, version=HARNESS_VERSION):
+    return {'meta': {'harness_version': version}, 'results': [{
+        'products': 1000, 'batch_size': 500, 'workers': 4, 'executor': 'thread', 'latency_ms': 2,
+        'records_per_sec': records_per_sec, 'peak_rss_mb': peak_rss_mb, 'round_trips': round_trips,
+    }]}
+
+
+def test_regressions_beyond_tolerance_are_reported():
+    regressions = compare_results(_results(1000.0), _results(850.0, peak_rss_mb=50.0, round_trips=7), 0.1)
+
+    assert len(regressions) == 3
+    assert compare_results(_results(1000.0), _results(950.0, peak_rss_mb=43.0), 0.1) == []
+
+
+def test_missing_throughput_counts_as_a_regression():
+    assert compare_results(_results(1000.0), _results(None), 0.1) == \
+        ['1000 products, batch 500, 4 thread workers: 1000.0 -> None rec/s']
+    assert compare_results(_results(None), _results(1000.0), 0.1) == []
+
+
+def test_baselines_from_another_harness_version_are_refused():
+    with pytest.raises(ValueError):
+        compare_results(_results(1000.0, version=HARNESS_VERSION - 1), _results(1000.0), 0.1)
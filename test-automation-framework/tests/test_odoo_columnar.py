@@ -0,0 +1,76 @@
+"""
+Tests for the pandas-backed columnar representation of Odoo records
+"""
+import pandas as pd
+
+from odoo_columnar import pages_to_frame, records_to_frame, summarize_frames, find_low_stock
+
+
+def _product(product_id, categ_id, qty):
+    return {'id': product_id, 'name': f"Product {product_id}", 'categ_id': categ_id, 'qty_available': qty}
+
+
+def test_many2one_pairs_become_id_and_name_columns():
+    frame = records_to_frame([_product(1, [7, 'All / A'], 2.0), _product(2, [8, 'All / B'], 0.0)])
+
+    assert str(frame['categ_id'].dtype) == 'Int64'
+    assert isinstance(frame['categ_id_name'].dtype, pd.CategoricalDtype)
+    assert frame['categ_id'].tolist() == [7, 8]
+    assert frame['categ_id_name'].tolist() == ['All / A', 'All / B']
+
+
+def test_all_false_many2one_page_maps_to_na_when_recognized_on_a_later_page():
+    empty_page = [_product(1, False, 1.0), _product(2, False, 0.0)]
+    frame = pages_to_frame([empty_page, [_product(3, [7, 'All / A'], 5.0)]])
+
+    assert frame['categ_id'].isna().tolist() == [True, True, False]
+    assert (frame['categ_id'] == 0).sum() == 0
+    assert frame['categ_id_name'].isna().tolist() == [True, True, False]
+
+
+def test_all_false_many2one_frame_uses_field_metadata():
+    frame = pages_to_frame([[_product(1, False, 1.0)]], many2one_fields=['categ_id'])
+
+    assert str(frame['categ_id'].dtype) == 'Int64'
+    assert frame['categ_id'].isna().all()
+    assert 'categ_id_name' in frame
+
+
+def test_summarize_frames_with_all_false_many2one_page():
+    products = pages_to_frame([[_product(1, False, 0.0), _product(2, False, 3.0)]], many2one_fields=['categ_id'])
+    quants = pages_to_frame([[{'id': 1, 'location_id': False, 'quantity': 2.0}]], many2one_fields=['location_id'])
+
+    summary = summarize_frames(products, quants)
+
+    assert summary['products_by_category'] == [{'categ_id': [False, ''], 'product_count': 2}]
+    assert summary['stock_by_location'] == [{'location_id': [False, ''], 'quantity': 2.0, 'quant_count': 1}]
+    assert summary['products_with_stock'] == 1
+
+
+def test_summarize_frames_without_name_columns():
+    products = pd.DataFrame({'id': [1, 2], 'categ_id': pd.array([7, 7], dtype='Int64'), 'qty_available': [1.0, 0.0]})
+    quants = pd.DataFrame({'id': [1], 'location_id': pd.array([3], dtype='Int64'), 'quantity': [4.0]})
+
+    summary = summarize_frames(products, quants)
+
+    assert summary['products_by_category'] == [{'categ_id': [7, None], 'product_count': 2}]
+    assert summary['stock_by_location'] == [{'location_id': [3, None], 'quantity': 4.0, 'quant_count': 1}]
+
+
+def test_summarize_frames_totals_and_low_stock():
+    products = records_to_frame([_product(1, [7, 'All / A'], 0.0), _product(2, [7, 'All / A'], 3.0),
+                                 _product(3, [8, 'All / B'], 10.0)])
+    quants = records_to_frame([{'id': 1, 'location_id': [1, 'WH/Stock'], 'quantity': 3.0},
+                               {'id': 2, 'location_id': [1, 'WH/Stock'], 'quantity': 10.0},
+                               {'id': 3, 'location_id': [2, 'WH/Shelf'], 'quantity': 1.0}])
+
+    summary = summarize_frames(products, quants, low_stock_threshold=3)
+
+    assert summary['total_products'] == 3
+    assert summary['products_with_stock'] == 2
+    assert summary['low_stock_products'] == 2
+    assert summary['total_stock_locations'] == 2
+    assert summary['products_by_category'] == [{'categ_id': [7, 'All / A'], 'product_count': 2},
+                                               {'categ_id': [8, 'All / B'], 'product_count': 1}]
+    assert summary['stock_by_location'][0] == {'location_id': [1, 'WH/Stock'], 'quantity': 13.0, 'quant_count': 2}
+    assert find_low_stock(products, 3)['id'].tolist() == [1, 2]
@@ -0,0 +1,99 @@
+"""
+Tests for page size adaptation and prefetching in the Paginator
+"""
+import json
+import threading
+import types
+
+import requests
+
+from api import paginator
+from api.paginator import Paginator
+
+
+class _Config:
+    def get_config_value(self, key, default=None):
+        return default
+
+
+class _FakeListAPI:
+    """page/limit list endpoint over numbered items, taking delay seconds per page on a fake clock"""
+
+    base_url = 'http://api.test'
+
+    def __init__(self, total, delay=0.0):
+        self.config = _Config()
+        self.items = list(range(total))
+        self.delay = delay
+        self.clock = 0.0
+        self.requests = []
+        self.second_page_requested = threading.Event()
+        self.clients = [self]
+
+    def thread_client(self):
+        client = types.SimpleNamespace(get=self.get, base_url=self.base_url, config=self.config)
+        self.clients.append(client)
+        return client
+
+    def perf_counter(self):
+        return self.clock
+
+    def get(self, endpoint, params=None):
+        self.requests.append((params['page'], params['limit']))
+        if len(self.requests) == 2:
+            self.second_page_requested.set()
+        self.clock += self.delay
+        start = (params['page'] - 1) * params['limit']
+        response = requests.Response()
+        response.status_code = 200
+        response.url = f"{self.base_url}{endpoint}"
+        response._content = json.dumps({'items': self.items[start:start + params['limit']]}).encode('utf-8')
+        return response
+
+
+def _use_fake_clock(monkeypatch, api):
+    monkeypatch.setattr(paginator, 'time', types.SimpleNamespace(perf_counter=api.perf_counter))
+
+
+def test_fast_pages_grow_only_on_whole_page_offsets(monkeypatch):
+    api = _FakeListAPI(100, delay=0.0)
+    _use_fake_clock(monkeypatch, api)
+
+    items = list(Paginator(api, '/items', page_size=10, max_page_size=40, target_seconds=1.0, prefetch=False))
+
+    assert items == list(range(100))
+    assert api.requests == [(1, 10), (2, 10), (2, 20), (2, 40), (3, 40)]
+
+
+def test_slow_pages_shrink_down_to_the_minimum(monkeypatch):
+    api = _FakeListAPI(100, delay=5.0)
+    _use_fake_clock(monkeypatch, api)
+
+    items = list(Paginator(api, '/items', page_size=40, min_page_size=10, target_seconds=1.0, prefetch=False))
+
+    assert items == list(range(100))
+    assert api.requests[:4] == [(1, 40), (3, 20), (7, 10), (8, 10)]
+
+
+def test_next_page_is_prefetched_while_the_current_one_is_consumed(monkeypatch):
+    api = _FakeListAPI(30)
+    _use_fake_clock(monkeypatch, api)
+    pages = Paginator(api, '/items', page_size=10, max_page_size=10).pages()
+
+    next(pages)
+
+    assert api.second_page_requested.wait(timeout=5)
+    assert [len(page.body['items']) for page in pages] == [10, 10, 0]
+    # Prefetching ran on a client of its own, not on the caller's session
+    assert len(api.clients) == 2
+
+
+def test_without_prefetch_pages_are_requested_on_demand(monkeypatch):
+    api = _FakeListAPI(100)
+    _use_fake_clock(monkeypatch, api)
+    items = iter(Paginator(api, '/items', page_size=10, max_page_size=10, prefetch=False, max_items=15))
+
+    assert next(items) == 0
+    assert len(api.requests) == 1
+    assert list(items) == list(range(1, 15))
+    assert len(api.requests) == 2
@@ -0,0 +1,70 @@
+"""
+Tests for duration-balanced shard planning and the scenario timing database
+"""
+import json
+
+import pytest
+
+from utility.execution.parallel_runner import ScenarioItem
+from utility.execution.shard_planner import estimate_durations, plan_shards
+from utility.execution.timing_db import ScenarioTimingDB
+
+
+def _scenarios(*names):
+    return [ScenarioItem(f"features/a.feature:{line}", 'features/a.feature', name, [])
+            for line, name in enumerate(names, start=1)]
+
+
+def test_longest_scenarios_are_placed_first_on_the_least_loaded_shard():
+    scenarios = _scenarios('s1', 's2', 's3', 's4', 's5')
+    durations = dict(zip((scenario.location for scenario in scenarios), [7, 5, 4, 3, 3]))
+
+    shards = plan_shards(scenarios, 2, durations)
+
+    assert [[scenario.name for scenario in shard] for shard in shards] == [['s1', 's4'], ['s2', 's3', 's5']]
+    assert [sum(durations[scenario.location] for scenario in shard) for shard in shards] == [10, 12]
+
+
+def test_plan_is_identical_for_equal_durations():
+    scenarios = _scenarios('s1', 's2', 's3', 's4')
+    durations = {scenario.location: 1.0 for scenario in scenarios}
+
+    first = plan_shards(scenarios, 3, durations)
+    second = plan_shards(list(reversed(scenarios)), 3, durations)
+
+    assert [[s.location for s in shard] for shard in first] == \
+        [sorted(s.location for s in shard) for shard in second]
+
+
+def test_estimate_is_an_exponentially_weighted_moving_average(tmp_path):
+    db = ScenarioTimingDB(str(tmp_path / 'timings.db'), smoothing=0.5)
+    db.record('features/a.feature', 's1', 10.0)
+    db.record('features/a.feature', 's1', 2.0)
+    db.record('features/a.feature', 's1', 4.0)
+
+    assert db.estimate('features/a.feature', 's1') == pytest.approx(5.0)
+    assert db.estimate('features/a.feature', 'never ran') is None
+
+
+def test_unknown_scenarios_get_the_median_estimate(tmp_path):
+    db = ScenarioTimingDB(str(tmp_path / 'timings.db'))
+    for name, duration in (('s1', 1.0), ('s2', 3.0), ('s3', 8.0)):
+        db.record('features/a.feature', name, duration)
+
+    durations = estimate_durations(_scenarios('s1', 's2', 's3', 'new'), db)
+
+    assert list(durations.values()) == [1.0, 3.0, 8.0, 3.0]
+
+
+def test_record_report_skips_untested_scenarios_and_backgrounds(tmp_path):
+    report = tmp_path / 'report.json'
+    step = {'result': {'status': 'passed', 'duration': 1.5}}
+    report.write_text(json.dumps([{'location': 'features/a.feature:1', 'elements': [
+        {'type': 'background', 'name': '', 'steps': [step]},
+        {'type': 'scenario', 'name': 's1', 'status': 'passed', 'steps': [step, step]},
+        {'type': 'scenario', 'name': 's2', 'status': 'skipped', 'steps': []},
+    ]}]))
+    db = ScenarioTimingDB(str(tmp_path / 'timings.db'))
+
+    assert db.record_report(str(report)) == 1
+    assert db.estimates() == {('features/a.feature', 's1'): 3.0}
@@ -0,0 +1,60 @@
+"""
+Tests for bulk user operations against servers with and without a batch endpoint
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api.user_api import UserAPI
+from utility.common.config_reader import ConfigReader
+
+
+class _NoBatchRouteHandler(BaseHTTPRequestHandler):
+    """Has only /users/{id} routes, so /users/batch is rejected as an invalid id"""
+
+    protocol_version = 'HTTP/1.1'
+    deleted = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_DELETE(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        user_id = self.path.rsplit('/', 1)[-1]
+        if not user_id.isdigit():
+            payload = json.dumps({'message': 'Invalid user id'}).encode('utf-8')
+            self.send_response(422)
+        else:
+            self.deleted.append(user_id)
+            payload = b''
+            self.send_response(204)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _NoBatchRouteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _NoBatchRouteHandler.deleted = []
+    ConfigReader.set_overrides({'api_base_url': f"http://127.0.0.1:{server.server_address[1]}"})
+    UserAPI.reset_batch_support()
+    yield server
+    UserAPI.reset_batch_support()
+    ConfigReader.clear_overrides()
+    server.shutdown()
+    server.server_close()
+
+
+def test_unconfirmed_batch_route_answering_422_falls_back_to_single_deletes(server):
+    api = UserAPI()
+
+    outcome = api.delete_users(['1', '2', '3'])
+
+    assert sorted(outcome['deleted']) == ['1', '2', '3']
+    assert outcome['failed'] == []
+    assert sorted(_NoBatchRouteHandler.deleted) == ['1', '2', '3']
+    assert UserAPI._batch_support[api.base_url] is False
@@ -0,0 +1,49 @@
+"""
+Tests for the users API stub over keep-alive connections
+"""
+import http.client
+import json
+import random
+import time
+
+import pytest
+
+from users_api_stub import UsersStubServer
+
+
+@pytest.fixture
+def stub():
+    server = UsersStubServer(seed_users=123, error_rate=0.5).start()
+    yield server
+    server.stop()
+
+
+def _post_user(connection, index):
+    body = json.dumps({'name': f"Load User {index}", 'email': f"load{index}@example.com", 'password': 'password123'})
+    connection.request('POST', '/api/v1/users', body=body, headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    response.read()
+    return response.status
+
+
+def test_injected_errors_leave_keep_alive_connections_in_sync(stub):
+    random.seed(7)
+    connection = http.client.HTTPConnection('127.0.0.1', stub.server_address[1])
+    statuses = [_post_user(connection, index) for index in range(40)]
+    connection.close()
+
+    assert set(statuses) == {201, 503}
+    assert stub.call_count == 40
+
+
+def test_keep_alive_requests_are_not_delayed_by_nagle(stub):
+    stub.error_rate = 0
+    connection = http.client.HTTPConnection('127.0.0.1', stub.server_address[1])
+    _post_user(connection, 0)
+    started = time.perf_counter()
+    for index in range(1, 21):
+        _post_user(connection, index)
+    connection.close()
+
+    # With Nagle and delayed ACKs each request took about 40 ms
+    assert (time.perf_counter() - started) / 20 < 0.02
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Users API Stub Server
+Local stand-in for the users/auth REST API, for offline runs of the API features and load mode
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+FIRST_NAMES = ['John', 'Jane', 'Alex', 'Maria', 'Sam', 'Priya', 'Chen', 'Fatima', 'Lucas', 'Emma']
+LAST_NAMES = ['Doe', 'Smith', 'Garcia', 'Khan', 'Nguyen', 'Muller', 'Rossi', 'Silva', 'Kim', 'Brown']
+
+ACCOUNTS = {
+    'user@example.com': ('password123', 'user'),
+    'admin@example.com': ('admin123', 'admin'),
+}
+
+
+class UserStore:
+    """
+    Thread-safe in-memory users table
+
+    Seeded users (IDs 1..seed_users) are fixtures that every scenario relies
+    on, so deleting one is acknowledged but not applied; users created
+    through the API are removed for real. Once more than max_users exist,
+    the oldest created users are evicted, so long load runs keep a bounded
+    footprint.
+    """
+
+    def __init__(self, seed_users: int = 1000, max_users: int = 20000):
+        """
+        Initialize store
+
+        Args:
+            seed_users: Number of fixture users (at least 123, which the features use)
+            max_users: Created users kept before the oldest are evicted
+        """
+        self.seed_users = max(seed_users, 123)
+        self.max_users = max_users
+        self.users: 'OrderedDict[int, Dict[str, Any]]' = OrderedDict()
+        self.next_id = self.seed_users + 1
+        self.lock = threading.Lock()
+        for user_id in range(1, self.seed_users + 1):
+            self.users[user_id] = {
+                'id': user_id,
+                'name': f"{FIRST_NAMES[user_id % len(FIRST_NAMES)]} {LAST_NAMES[user_id // len(FIRST_NAMES) % len(LAST_NAMES)]}",
+                'email': f"user{user_id}@example.com",
+                'role': 'user',
+            }
+
+    @staticmethod
+    def validate(data: Dict[str, Any]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Get the (status, body) of a validation failure, or None if the user data is valid"""
+        missing = [field for field in ('name', 'email', 'password') if field not in data]
+        if missing:
+            return 422, {'message': 'Missing required fields', 'errors': {field: 'required' for field in missing}}
+        errors = {}
+        if not str(data['name']).strip():
+            errors['name'] = 'must not be empty'
+        if '@' not in str(data['email']):
+            errors['email'] = 'must be a valid email address'
+        if len(str(data['password'])) < 8:
+            errors['password'] = 'must be at least 8 characters'
+        return (400, {'message': 'Validation failed', 'errors': errors}) if errors else None
+
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            user = {'id': self.next_id, 'name': data['name'], 'email': data['email'], 'role': data.get('role', 'user')}
+            self.users[self.next_id] = user
+            self.next_id += 1
+            while len(self.users) > self.seed_users + self.max_users:
+                oldest = next(user_id for user_id in self.users if user_id > self.seed_users)
+                del self.users[oldest]
+            return dict(user)
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            user = self.users.get(user_id)
+            return dict(user) if user else None
+
+    def update(self, user_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            user = self.users.get(user_id)
+            if user is None:
+                return None
+            user.update({key: value for key, value in data.items() if key in ('name', 'email', 'role')})
+            return dict(user)
+
+    def delete(self, user_id: int) -> bool:
+        with self.lock:
+            if user_id not in self.users:
+                return False
+            if user_id > self.seed_users:
+                del self.users[user_id]
+            return True
+
+    def page(self, page: int, limit: int) -> Dict[str, Any]:
+        with self.lock:
+            total = len(self.users)
+            start = (page - 1) * limit
+            users = [dict(user) for user in list(self.users.values())[start:start + limit]]
+        return {'users': users, 'page': page, 'limit': limit, 'total': total,
+                'total_pages': (total + limit - 1) // limit}
+
+    def search(self, term: str, limit: int = 50) -> Dict[str, Any]:
+        term = term.lower()
+        with self.lock:
+            matches = [dict(user) for user in self.users.values()
+                       if term in user['name'].lower() or term in user['email'].lower()]
+        return {'users': matches[:limit], 'total': len(matches)}
+
+
+class UsersStubRequestHandler(BaseHTTPRequestHandler):
+    """Routes /api/v1/users and /api/v1/auth requests to the store"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; with Nagle on, keep-alive clients wait out a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+
+    def _respond(self, status: int, body: Any = None) -> None:
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        if payload:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _authorized(self) -> bool:
+        token = self.headers.get('Authorization', '')
+        return token.startswith('Bearer ') and token[len('Bearer '):] in self.server.tokens
+
+    def _handle(self, method: str) -> None:
+        server = self.server
+        server.count_call()
+        server.simulate_latency()
+        # Read the body before any early response: on a keep-alive connection an unread
+        # body would be parsed as the start of the next request
+        body = self._read_json() if method in ('POST', 'PUT', 'PATCH', 'DELETE') else {}
+        if server.error_rate and random.random() < server.error_rate:
+            return self._respond(503, {'message': 'Service temporarily unavailable'})
+
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        if parts[:2] != ['api', 'v1'] or len(parts) < 3:
+            return self._respond(404, {'message': 'Not found'})
+        if body is None:
+            return self._respond(400, {'message': 'Request body is not valid JSON'})
+
+        resource, rest = parts[2], parts[3:]
+        if resource == 'auth':
+            return self._handle_auth(method, rest, body)
+        if resource == 'users':
+            return self._handle_users(method, rest, body, query)
+        self._respond(404, {'message': 'Not found'})
+
+    def _handle_auth(self, method: str, rest: list, body: Dict[str, Any]) -> None:
+        if method == 'POST' and rest == ['login']:
+            account = ACCOUNTS.get(body.get('email'))
+            if not account or account[0] != body.get('password'):
+                return self._respond(401, {'message': 'Invalid email or password'})
+            token = f"stub-{uuid.uuid4().hex}"
+            self.server.tokens.add(token)
+            return self._respond(200, {'token': token, 'user': {'email': body['email'], 'role': account[1]}})
+        if method == 'POST' and rest == ['logout']:
+            return self._respond(200, {'message': 'Logged out'})
+        self._respond(404, {'message': 'Not found'})
+
+    def _handle_users(self, method: str, rest: list, body: Dict[str, Any], query: Dict[str, str]) -> None:
+        store = self.server.store
+        if not rest:
+            if method == 'GET':
+                return self._respond(200, store.page(max(int(query.get('page', 1)), 1),
+                                                     min(max(int(query.get('limit', 10)), 1), 1000)))
+            if method == 'POST':
+                failure = store.validate(body)
+                return self._respond(*failure) if failure else self._respond(201, store.create(body))
+        elif rest == ['search'] and method == 'GET':
+            return self._respond(200, store.search(query.get('search', '')))
+        elif rest == ['batch'] and method == 'POST':
+            # Batch endpoints are for test data setup and teardown and need no token in the stub
+            return self._respond(201, {'users': [store.create(user) for user in body.get('users', [])]})
+        elif rest == ['batch'] and method == 'DELETE':
+            for user_id in body.get('ids', []):
+                store.delete(int(user_id))
+            return self._respond(204)
+        elif rest[0].isdigit():
+            return self._handle_user(method, int(rest[0]), rest[1:], body)
+        self._respond(404 if method == 'GET' else 405, {'message': 'Not found'})
+
+    def _handle_user(self, method: str, user_id: int, rest: list, body: Dict[str, Any]) -> None:
+        store = self.server.store
+        if rest == ['password'] and method == 'PATCH':
+            if not self._authorized():
+                return self._respond(401, {'message': 'Authentication required'})
+            if store.get(user_id) is None:
+                return self._respond(404, {'message': 'User not found'})
+            if len(str(body.get('new_password', ''))) < 8:
+                return self._respond(400, {'message': 'Validation failed', 'errors': {'new_password': 'too short'}})
+            return self._respond(200, {'message': 'Password updated'})
+        if rest:
+            return self._respond(404, {'message': 'Not found'})
+        if method == 'GET':
+            user = store.get(user_id)
+            return self._respond(200, user) if user else self._respond(404, {'message': 'User not found'})
+        if method == 'PUT':
+            user = store.update(user_id, body)
+            return self._respond(200, user) if user else self._respond(404, {'message': 'User not found'})
+        if method == 'DELETE':
+            if not self._authorized():
+                return self._respond(401, {'message': 'Authentication required'})
+            return self._respond(204) if store.delete(user_id) else self._respond(404, {'message': 'User not found'})
+        self._respond(405, {'message': 'Method not allowed'})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class UsersStubServer(ThreadingHTTPServer):
+    """
+    Threaded users API stub with injectable latency and error rate
+
+    Usage:
+        server = UsersStubServer(latency_ms=20).start()
+        ConfigReader.set_overrides({'api_base_url': server.url})
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, seed_users: int = 1000,
+                 latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0):
+        """
+        Initialize server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            seed_users: Number of fixture users
+            latency_ms: Latency added to every request
+            jitter_ms: Random extra latency of up to this many milliseconds
+            error_rate: Share of requests answered with 503 (0-1)
+        """
+        super().__init__((host, port), UsersStubRequestHandler)
+        self.store = UserStore(seed_users)
+        self.tokens = set()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.call_count = 0
+        self._count_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def simulate_latency(self) -> None:
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+    def count_call(self) -> None:
+        with self._count_lock:
+            self.call_count += 1
+
+    def start(self) -> 'UsersStubServer':
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    """Run the users API stub in the foreground"""
+    parser = argparse.ArgumentParser(description="Local users API stub for offline API and load testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--seed-users', type=int, default=1000, help="Number of fixture users")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Latency added to every request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra latency per request")
+    parser.add_argument('--error-rate', type=float, default=0, help="Share of requests answered with 503")
+    args = parser.parse_args()
+
+    server = UsersStubServer(args.host, args.port, args.seed_users, args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f"🧪 Users API stub serving {server.store.seed_users} users on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Authenticated session cache for starting scenarios already logged in
+"""
+import hashlib
+import os
+import time
+from typing import Callable, Dict, Optional
+from playwright.sync_api import Browser, Page
+from utility.common.config_reader import ConfigReader
+from utility.common.logger import Logger
+
+class AuthSessionCache:
+    """
+    Cache of Playwright storage state (cookies and local storage) per credential set
+    
+    The first scenario that needs a logged-in user runs the UI login once and
+    the resulting storage state is saved to disk. Later scenarios, and later
+    runs until the state expires, create their browser context from that file
+    instead of logging in again.
+    """
+    
+    def __init__(self, browser: Browser, login: Callable[[Page, Dict[str, str]], None],
+                 cache_dir: str = None, ttl_seconds: int = 1800, context_options: Dict = None):
+        """
+        Initialize session cache
+        
+        Args:
+            browser: Launched Playwright browser used for logging in
+            login: Function performing the UI login on a page with a credentials dict
+            cache_dir: Directory for storage state files (reports/auth if None)
+            ttl_seconds: Age after which a saved session is considered expired
+            context_options: Options for the browser context used to log in
+        """
+        self.browser = browser
+        self.login = login
+        self.cache_dir = cache_dir or os.path.join(os.getcwd(), 'reports', 'auth')
+        self.ttl_seconds = ttl_seconds
+        self.context_options = context_options or {}
+        self.config = ConfigReader()
+        self.logger = Logger().get_logger()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _state_path(self, credential_type: str, credentials: Dict[str, str]) -> str:
+        """Storage state file for a credential set; changes when the username changes"""
+        user_hash = hashlib.sha1(credentials.get('username', '').encode('utf-8')).hexdigest()[:10]
+        return os.path.join(self.cache_dir, f"{self.config.get_environment()}_{credential_type}_{user_hash}.json")
+    
+    def _is_fresh(self, path: str) -> bool:
+        """Check whether a saved session exists and has not expired"""
+        return os.path.exists(path) and time.time() - os.path.getmtime(path) < self.ttl_seconds
+    
+    def get_storage_state(self, credential_type: str = 'standard_user') -> str:
+        """
+        Get a storage state file for a credential set, logging in if needed
+        
+        Args:
+            credential_type: Key under 'credentials' in config.yaml
+        
+        Returns:
+            Path of the storage state file, usable as new_context(storage_state=...)
+        """
+        credentials = self.config.get_credentials(credential_type)
+        if not credentials:
+            raise ValueError(f"No credentials configured for: {credential_type}")
+        
+        path = self._state_path(credential_type, credentials)
+        if self._is_fresh(path):
+            return path
+        
+        self.logger.info(f"Logging in once to cache session for: {credential_type}")
+        browser_context = self.browser.new_context(**self.context_options)
+        try:
+            page = browser_context.new_page()
+            self.login(page, credentials)
+            browser_context.storage_state(path=path)
+        finally:
+            browser_context.close()
+        return path
+    
+    def invalidate(self, credential_type: Optional[str] = None) -> None:
+        """
+        Delete saved sessions, e.g. after the server rejected one
+        
+        Args:
+            credential_type: Credential set to drop (all sets if None)
+        
+        Raises:
+            ValueError: If no credentials are configured for credential_type
+        """
+        if credential_type is not None:
+            credentials = self.config.get_credentials(credential_type)
+            if not credentials:
+                raise ValueError(f"No credentials configured for: {credential_type}")
+            path = self._state_path(credential_type, credentials)
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        
+        for filename in os.listdir(self.cache_dir):
+            os.remove(os.path.join(self.cache_dir, filename))
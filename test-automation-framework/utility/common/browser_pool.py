@@ -0,0 +1,120 @@
+"""
+Browser context pool for reusing warm, isolated browser contexts across scenarios
+"""
+from collections import deque
+from typing import Dict, Any, Tuple
+from playwright.sync_api import Browser, BrowserContext, Page
+from utility.common.logger import Logger
+
+# Clears web storage of the origin a page is on
+CLEAR_STORAGE_SCRIPT = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+class BrowserContextPool:
+    """
+    Pool of pre-warmed browser contexts, each with one open page
+    
+    A scenario checks out a context and its page with acquire() and hands it
+    back with release(). On release, extra pages are closed, cookies,
+    permissions and web storage are cleared and the page goes back to
+    about:blank, so the next scenario starts clean without paying for a new
+    context. A context is closed and replaced after max_uses checkouts so state
+    the reset cannot reach (IndexedDB, service workers, caches) does not build up.
+    """
+    
+    def __init__(self, browser: Browser, size: int = 2, max_uses: int = 20,
+                 context_options: Dict[str, Any] = None):
+        """
+        Initialize pool and pre-warm its contexts
+        
+        Args:
+            browser: Launched Playwright browser
+            size: Number of idle contexts kept warm
+            max_uses: Checkouts after which a context is replaced
+            context_options: Options passed to browser.new_context (viewport, locale, ...)
+        """
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.logger = Logger().get_logger()
+        self._idle = deque()
+        self._uses: Dict[BrowserContext, int] = {}
+        self._pages: Dict[BrowserContext, Page] = {}
+        
+        for _ in range(size):
+            self._idle.append(self._create_context())
+        self.logger.info(f"Browser context pool ready with {size} contexts")
+    
+    def _create_context(self, **options) -> BrowserContext:
+        """Create a context with its page already open"""
+        context = self.browser.new_context(**{**self.context_options, **options})
+        self._uses[context] = 0
+        self._pages[context] = context.new_page()
+        return context
+    
+    def acquire(self, **options) -> Tuple[BrowserContext, Page]:
+        """
+        Check out a clean context and its page
+        
+        Args:
+            **options: Extra browser.new_context options; a context created with
+                them is not pooled and is closed on release
+        
+        Returns:
+            The context and its open page
+        """
+        if options:
+            context = self._create_context(**options)
+            self._uses[context] = self.max_uses
+        else:
+            context = self._idle.popleft() if self._idle else self._create_context()
+        self._uses[context] += 1
+        return context, self._pages[context]
+    
+    def release(self, context: BrowserContext, discard: bool = False) -> None:
+        """
+        Return a context to the pool, resetting its state
+        
+        Args:
+            context: Context from acquire()
+            discard: Close the context instead of reusing it (e.g. after a failure)
+        """
+        if discard or self._uses[context] >= self.max_uses or len(self._idle) >= self.size:
+            self._close(context)
+            if len(self._idle) < self.size:
+                self._idle.append(self._create_context())
+            return
+        
+        try:
+            self._reset(context)
+        except Exception as e:
+            self.logger.warning(f"Could not reset browser context, replacing it: {e}")
+            self._close(context)
+            context = self._create_context()
+        self._idle.append(context)
+    
+    def _reset(self, context: BrowserContext) -> None:
+        """Clear cookies, permissions and storage and leave the page on about:blank"""
+        page = self._pages[context]
+        for other in context.pages:
+            if other is not page:
+                other.close()
+        
+        page.evaluate(CLEAR_STORAGE_SCRIPT)
+        context.clear_cookies()
+        context.clear_permissions()
+        page.goto("about:blank")
+    
+    def _close(self, context: BrowserContext) -> None:
+        """Close a context and forget it"""
+        self._uses.pop(context, None)
+        self._pages.pop(context, None)
+        try:
+            context.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing browser context: {e}")
+    
+    def close(self) -> None:
+        """Close all idle contexts"""
+        while self._idle:
+            self._close(self._idle.popleft())
@@ -1,20 +1,262 @@
 """
 Configuration reader utility for managing environment-specific settings
 """
+import copy
 import os
+import re
+import threading
 import yaml
 import json
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+# libyaml's C loader parses several times faster; fall back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Environment variable carrying a resolved config snapshot to worker processes
+SNAPSHOT_ENV_VAR = 'TEST_CONFIG_SNAPSHOT'
+
+# Environment variables exported by the Makefile and the config keys they override
+ENV_OVERRIDES = {
+    'BROWSER': 'browser.name',
+    'HEADLESS': 'browser.headless',
+    'API_CASSETTE_MODE': 'http.cassette.mode',
+}
+
+# Short override names accepted from behave userdata (-D browser=firefox)
+OVERRIDE_ALIASES = {
+    'browser': 'browser.name',
+    'headless': 'browser.headless',
+    'cassette': 'http.cassette.mode',
+}
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-merge override into a copy of base"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _set_path(data: Dict[str, Any], key_path: str, value: Any) -> None:
+    """Set a dotted key path in nested dictionaries, creating levels as needed"""
+    *parents, leaf = key_path.split('.')
+    for key in parents:
+        if not isinstance(data.get(key), dict):
+            data[key] = {}
+        data = data[key]
+    data[leaf] = value
+
+
+_INT_PATTERN = re.compile(r'^[-+]?[0-9]+$')
+_FLOAT_PATTERN = re.compile(r'^[-+]?([0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)([eE][-+]?[0-9]+)?$')
+
+
+def _parse_scalar(value: Any) -> Any:
+    """
+    Turn override strings like 'true' or '30' into the boolean or number they spell
+
+    Only true/false (any case) and decimal numbers are converted, as in YAML 1.2.
+    Everything else stays a string, so 'no', 'on' or 'off' are not read as booleans.
+    """
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text.lower() in ('true', 'false'):
+        return text.lower() == 'true'
+    if _INT_PATTERN.match(text):
+        return int(text)
+    if _FLOAT_PATTERN.match(text):
+        return float(text)
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Make nested dictionaries read-only and lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Copy a frozen value back into plain dictionaries and lists"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _flatten(value: Mapping[str, Any], prefix: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Index every section and leaf of a frozen mapping by its dotted path"""
+    for key, item in value.items():
+        path = f"{prefix}{key}"
+        values[path] = item
+        if isinstance(item, Mapping):
+            _flatten(item, f"{path}.", values)
+    return values
+
 
 class ConfigReader:
-    """Configuration reader for YAML and JSON config files"""
+    """
+    Configuration reader for YAML and JSON config files
+    
+    Readers are shared process-wide per (config file, TEST_ENV), so constructing
+    one in every page object or step is cheap. The file is parsed once and only
+    re-parsed when its modification time changes.
+    
+    Settings are resolved once into a flat, read-only view, layered from lowest
+    to highest precedence:
+        1. Global sections of the config file
+        2. The TEST_ENV section under 'environments', merged over them
+        3. Environment variables in ENV_OVERRIDES (BROWSER, HEADLESS, ...)
+        4. Overrides from set_overrides() (behave userdata, load runners, ...)
+    
+    Worker processes started with the SNAPSHOT_ENV_VAR variable set to
+    snapshot() use that resolved view instead of parsing the file.
+    
+    The getters return plain dictionaries and lists. Those are copies, so
+    changing them does not change the configuration. The values property
+    is the read-only view itself.
+    """
+    
+    _instances: Dict[Tuple[str, str], 'ConfigReader'] = {}
+    _overrides: Dict[str, Any] = {}
+    _lock = threading.Lock()
+    
+    def __new__(cls, config_file: str = None):
+        path = os.path.abspath(config_file or cls._get_default_config_file())
+        key = (path, os.getenv('TEST_ENV', 'dev').lower())
+        with cls._lock:
+            if key not in cls._instances:
+                instance = super(ConfigReader, cls).__new__(cls)
+                instance.config_file = path
+                instance.environment = key[1]
+                instance.config_data = None
+                instance.resolved_data = None
+                instance._base_data = None
+                instance._values = MappingProxyType({})
+                instance._mtime = None
+                instance._from_snapshot = False
+                cls._instances[key] = instance
+            return cls._instances[key]
     
     def __init__(self, config_file: str = None):
-        self.config_file = config_file or self._get_default_config_file()
-        self.config_data = self._load_config()
-        self.environment = os.getenv('TEST_ENV', 'dev').lower()
+        self.reload_if_changed()
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all shared readers so the next construction parses the file again"""
+        with cls._lock:
+            cls._instances.clear()
+    
+    @classmethod
+    def set_overrides(cls, overrides: Mapping[str, Any]):
+        """
+        Override config values for the whole process
+        
+        Keys are dotted paths ('timeouts.default') or the short names 'browser'
+        and 'headless'. The strings 'true'/'false' become booleans and numbers
+        become integers or floats; any other string (including 'no' or 'off')
+        is kept as it is.
+        
+        Args:
+            overrides: Key paths and values to override
+        """
+        with cls._lock:
+            for key, value in overrides.items():
+                cls._overrides[OVERRIDE_ALIASES.get(key, key)] = _parse_scalar(value)
+            for instance in cls._instances.values():
+                if instance._base_data is not None:
+                    instance._resolve()
+    
+    @classmethod
+    def clear_overrides(cls):
+        """Remove all overrides set with set_overrides()"""
+        with cls._lock:
+            cls._overrides.clear()
+            for instance in cls._instances.values():
+                if instance._base_data is not None:
+                    instance._resolve()
+    
+    def reload_if_changed(self) -> bool:
+        """Re-parse the config file if it changed since it was last loaded"""
+        if self._from_snapshot or self._load_snapshot():
+            return False
+        
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
+        with self._lock:
+            if mtime == self._mtime:
+                return False
+            self.config_data = self._load_config()
+            self._mtime = mtime
+            environments = self.config_data.get('environments') or {}
+            self._base_data = _merge(self.config_data, environments.get(self.environment) or {})
+            self._resolve()
+            return True
+    
+    def _load_snapshot(self) -> bool:
+        """Adopt a snapshot passed down by a parent process, if it matches this reader"""
+        snapshot = os.getenv(SNAPSHOT_ENV_VAR)
+        if not snapshot:
+            return False
+        
+        snapshot = json.loads(snapshot)
+        if snapshot['config_file'] != self.config_file or snapshot['environment'] != self.environment:
+            return False
+        with self._lock:
+            self.config_data = snapshot['config_data']
+            self._base_data = snapshot['resolved_data']
+            self._from_snapshot = True
+            self._resolve()
+        return True
+    
+    def _resolve(self):
+        """Apply overrides to the merged file settings and rebuild the flat view (caller holds the lock)"""
+        data = copy.deepcopy(self._base_data)
+        
+        for variable, key_path in ENV_OVERRIDES.items():
+            if os.getenv(variable):
+                _set_path(data, key_path, _parse_scalar(os.getenv(variable)))
+        for key_path, value in self._overrides.items():
+            _set_path(data, key_path, value)
+        
+        self.resolved_data = data
+        self._values = MappingProxyType(_flatten(_freeze(data), '', {}))
     
-    def _get_default_config_file(self) -> str:
+    def snapshot(self) -> str:
+        """
+        Serialize the resolved config for worker processes
+        
+        Returns:
+            JSON to put in the SNAPSHOT_ENV_VAR environment variable of workers
+        """
+        return json.dumps({
+            'config_file': self.config_file,
+            'environment': self.environment,
+            'config_data': self.config_data,
+            'resolved_data': self.resolved_data,
+        })
+    
+    @property
+    def values(self) -> Mapping[str, Any]:
+        """Read-only view of every resolved setting keyed by dotted path"""
+        return self._values
+    
+    @staticmethod
+    def _get_default_config_file() -> str:
         """Get default configuration file path"""
         config_dir = os.path.join(os.getcwd(), 'configs', 'environments')
         return os.path.join(config_dir, 'config.yaml')
@@ -26,7 +268,7 @@ class ConfigReader:
         
         with open(self.config_file, 'r', encoding='utf-8') as file:
             if self.config_file.endswith('.yaml') or self.config_file.endswith('.yml'):
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=SafeLoader) or {}
             elif self.config_file.endswith('.json'):
                 return json.load(file)
             else:
@@ -38,44 +280,38 @@ class ConfigReader:
     
     def get_base_url(self) -> str:
         """Get base URL for current environment"""
-        return self.config_data.get('environments', {}).get(self.environment, {}).get('base_url', '')
+        return self._values.get('base_url', '')
     
     def get_api_base_url(self) -> str:
         """Get API base URL for current environment"""
-        return self.config_data.get('environments', {}).get(self.environment, {}).get('api_base_url', '')
+        return self._values.get('api_base_url', '')
     
     def get_browser(self) -> str:
         """Get browser configuration"""
-        return self.config_data.get('browser', {}).get('name', 'chrome')
+        return self._values.get('browser.name', 'chrome')
     
     def get_headless_mode(self) -> bool:
         """Get headless mode configuration"""
-        return self.config_data.get('browser', {}).get('headless', False)
+        return self._values.get('browser.headless', False)
     
     def get_timeout(self) -> int:
         """Get default timeout configuration"""
-        return self.config_data.get('timeouts', {}).get('default', 30)
+        return self._values.get('timeouts.default', 30)
     
     def get_explicit_wait(self) -> int:
         """Get explicit wait timeout"""
-        return self.config_data.get('timeouts', {}).get('explicit_wait', 10)
+        return self._values.get('timeouts.explicit_wait', 10)
     
     def get_database_config(self) -> Dict[str, Any]:
         """Get database configuration for current environment"""
-        return self.config_data.get('environments', {}).get(self.environment, {}).get('database', {})
+        return _thaw(self._values.get('database', {}))
     
     def get_credentials(self, credential_type: str) -> Dict[str, str]:
         """Get credentials for specific type"""
-        return self.config_data.get('credentials', {}).get(credential_type, {})
+        return _thaw(self._values.get(f'credentials.{credential_type}', {}))
     
     def get_config_value(self, key_path: str, default_value: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'browser.name')"""
-        keys = key_path.split('.')
-        value = self.config_data
-        
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default_value
\ No newline at end of file
+        value = self._values.get(key_path, default_value)
+        # Sections and lists are copied; scalars are returned as they are
+        return _thaw(value) if isinstance(value, (Mapping, tuple)) else value
@@ -28,17 +28,24 @@ class Logger:
         os.makedirs(log_dir, exist_ok=True)
         
         # Create logger
+        # LOG_LEVEL=INFO skips debug records (e.g. API response bodies) before they are built
+        level = getattr(logging, os.getenv('LOG_LEVEL', 'DEBUG').upper(), logging.DEBUG)
         self._logger = logging.getLogger('TestFramework')
-        self._logger.setLevel(logging.DEBUG)
+        self._logger.setLevel(level)
         
         # Prevent duplicate handlers
         if self._logger.handlers:
             return
         
+        # Parallel runner workers write their own log file and tag their lines
+        worker_id = os.getenv('TEST_WORKER_ID')
+        worker_suffix = f'_worker{worker_id}' if worker_id else ''
+        worker_tag = f'[worker {worker_id}] ' if worker_id else ''
+        
         # File handler
-        log_file = os.path.join(log_dir, f'test_execution_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+        log_file = os.path.join(log_dir, f'test_execution_{datetime.now().strftime("%Y%m%d_%H%M%S")}{worker_suffix}.log')
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(level)
         
         # Console handler with colors
         console_handler = colorlog.StreamHandler()
@@ -46,10 +53,10 @@ class Logger:
         
         # Formatters
         file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+            f'%(asctime)s - %(name)s - {worker_tag}%(levelname)s - %(filename)s:%(lineno)d - %(message)s'
         )
         console_formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
+            f'%(log_color)s%(asctime)s - {worker_tag}%(levelname)s - %(message)s',
             datefmt='%H:%M:%S',
             log_colors={
                 'DEBUG': 'cyan',
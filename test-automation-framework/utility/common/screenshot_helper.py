@@ -1,27 +1,39 @@
 """
 Screenshot utility for capturing screenshots during test execution
 """
+import base64
 import os
 from datetime import datetime
+from typing import Any, Iterable
+from behave.formatter.json import JSONFormatter
 from playwright.sync_api import Page
 
 class ScreenshotHelper:
-    """Helper class for taking and managing screenshots"""
+    """
+    Helper class for taking and managing screenshots
+    
+    Parallel workers (TEST_WORKER_ID set) share reports/screenshots, so their
+    files get a _worker<id> suffix and never overwrite each other.
+    """
     
     def __init__(self):
         self.screenshot_dir = os.path.join(os.getcwd(), 'reports', 'screenshots')
         os.makedirs(self.screenshot_dir, exist_ok=True)
+        worker_id = os.getenv('TEST_WORKER_ID')
+        self.suffix = f"_worker{worker_id}" if worker_id else ''
+    
+    def _screenshot_path(self, filename: str) -> str:
+        """Path of a screenshot file with the worker suffix and .png extension"""
+        if filename.endswith('.png'):
+            filename = filename[:-len('.png')]
+        return os.path.join(self.screenshot_dir, f"{filename}{self.suffix}.png")
     
     def take_screenshot(self, page: Page, filename: str = None) -> str:
         """Take screenshot and save to reports/screenshots directory"""
         if filename is None:
             filename = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Ensure filename has .png extension
-        if not filename.endswith('.png'):
-            filename += '.png'
-        
-        screenshot_path = os.path.join(self.screenshot_dir, filename)
+        screenshot_path = self._screenshot_path(filename)
         page.screenshot(path=screenshot_path, full_page=True)
         
         return screenshot_path
@@ -31,11 +43,31 @@ class ScreenshotHelper:
         if filename is None:
             filename = f"element_screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        if not filename.endswith('.png'):
-            filename += '.png'
-        
-        screenshot_path = os.path.join(self.screenshot_dir, filename)
+        screenshot_path = self._screenshot_path(filename)
         element = page.locator(selector)
         element.screenshot(path=screenshot_path)
         
-        return screenshot_path
\ No newline at end of file
+        return screenshot_path
+    
+    @staticmethod
+    def attach_to_report(formatters: Iterable[Any], screenshot_path: str) -> None:
+        """
+        Add a scenario's screenshot to the behave reports being written (call from after_scenario)
+        
+        The JSON report lists the path, relative to the working directory, under
+        'screenshots' on the scenario element (the parallel runner's merged HTML
+        report links them from there), and formatters supporting embeddings show
+        the image on the scenario's last step.
+        
+        Args:
+            formatters: Active behave formatters (context._runner.formatters)
+            screenshot_path: File written by take_screenshot
+        """
+        for formatter in formatters:
+            if isinstance(formatter, JSONFormatter):
+                if formatter.current_feature_data and formatter.current_feature_data.get('elements'):
+                    relative_path = os.path.relpath(screenshot_path)
+                    formatter.current_feature_element.setdefault('screenshots', []).append(relative_path)
+            elif hasattr(formatter, 'embedding') and getattr(formatter, 'last_step_embed_span', None) is not None:
+                with open(screenshot_path, 'rb') as file:
+                    formatter.embedding('image/png', base64.b64encode(file.read()).decode('ascii'), 'Screenshot')
@@ -0,0 +1 @@
+# Test execution package
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+API timing report: request timings per scenario and per endpoint for behave runs
+"""
+import os
+import threading
+from typing import Dict, Any, Iterable, List, Optional
+from behave.formatter.json import JSONFormatter
+from utility.execution.latency_histogram import LatencyHistogram
+
+# Timing phases of a request event: total duration, time to first byte, connect and TLS handshake
+PHASES = ('total', 'ttfb', 'connect', 'tls')
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class EndpointTimings:
+    """Phase histograms, status counts and transferred bytes of one endpoint template"""
+    
+    def __init__(self):
+        self.phases = {phase: LatencyHistogram() for phase in PHASES}
+        self.statuses: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+    
+    @property
+    def requests(self) -> int:
+        return self.phases['total'].count
+    
+    def record(self, event: Dict[str, Any]) -> None:
+        """Add one request event (caller holds the report lock)"""
+        status = str(event['status_code']) if event['status_code'] is not None else 'error'
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_sent += event.get('bytes_sent') or 0
+        self.bytes_received += event.get('bytes_received') or 0
+        self.phases['total'].record(event['elapsed_ms'])
+        for phase in PHASES[1:]:
+            if event.get(f'{phase}_ms') is not None:
+                self.phases[phase].record(event[f'{phase}_ms'])
+    
+    def summary(self) -> Dict[str, Any]:
+        """Request count, statuses, bytes and latency summary of every measured phase"""
+        return {
+            'requests': self.requests,
+            'statuses': dict(self.statuses),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            **{phase: histogram.summary() for phase, histogram in self.phases.items() if histogram.count},
+        }
+
+class APITimingReport:
+    """
+    Collects BaseAPI request events into per-endpoint and per-scenario timings
+    
+    Register on_request with BaseAPI.add_request_listener, call start_scenario
+    and finish_scenario around each scenario, and write_prometheus at the end
+    of the run. Endpoints are keyed by method and template
+    (GET /api/v1/users/{id}), so the numbers stay comparable between runs.
+    """
+    
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointTimings] = {}
+        self.scenarios: Dict[str, Dict[str, Any]] = {}
+        self._scenario_endpoints: Dict[str, EndpointTimings] = {}
+        self._lock = threading.Lock()
+    
+    def on_request(self, event: Dict[str, Any]) -> None:
+        """Request listener registered with BaseAPI"""
+        key = f"{event['method']} {event['template']}"
+        with self._lock:
+            for endpoints in (self.endpoints, self._scenario_endpoints):
+                timings = endpoints.get(key)
+                if timings is None:
+                    timings = endpoints[key] = EndpointTimings()
+                timings.record(event)
+    
+    def start_scenario(self) -> None:
+        """Start collecting the requests of a new scenario"""
+        with self._lock:
+            self._scenario_endpoints = {}
+    
+    def finish_scenario(self, name: str) -> Dict[str, Any]:
+        """
+        Summarize the requests made since start_scenario
+        
+        Args:
+            name: Scenario name the totals are kept under for the Prometheus file
+        
+        Returns:
+            Dictionary with the request count, time spent in requests and per-endpoint timings
+        """
+        with self._lock:
+            endpoints = self._scenario_endpoints
+            self._scenario_endpoints = {}
+            requests = sum(timings.requests for timings in endpoints.values())
+            request_ms = sum(timings.phases['total'].total_us for timings in endpoints.values()) / 1000
+            totals = self.scenarios.setdefault(name, {'requests': 0, 'request_ms': 0.0})
+            totals['requests'] += requests
+            totals['request_ms'] += request_ms
+        return {
+            'requests': requests,
+            'request_ms': round(request_ms, 3),
+            'endpoints': {key: endpoints[key].summary() for key in sorted(endpoints)},
+        }
+    
+    @staticmethod
+    def format_summary(summary: Dict[str, Any]) -> str:
+        """Render a scenario summary as a plain text table"""
+        lines = [f"{summary['requests']} API requests, {summary['request_ms']:.1f} ms in total",
+                 f"{'endpoint':<45} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} "
+                 f"{'ttfb p50':>9} {'connect':>9} {'tls':>9} {'bytes in':>10}"]
+        for key, timings in summary['endpoints'].items():
+            total = timings['total']
+            ttfb = timings.get('ttfb', {}).get('p50_ms', '-')
+            connect = timings.get('connect', {}).get('mean_ms', '-')
+            tls = timings.get('tls', {}).get('mean_ms', '-')
+            lines.append(f"{key:<45} {total['count']:>6} {total['p50_ms']:>9} {total['p95_ms']:>9} "
+                         f"{total['max_ms']:>9} {ttfb:>9} {connect:>9} {tls:>9} {timings['bytes_received']:>10}")
+        return '\n'.join(lines)
+    
+    def write_prometheus(self, path: str, buckets_ms: Iterable[float] = DEFAULT_BUCKETS_MS) -> str:
+        """
+        Write the run's timings in the Prometheus text exposition format
+        
+        The file is replaced atomically, so a node exporter textfile collector
+        never reads half of it.
+        
+        Args:
+            path: Output file (e.g. reports/metrics/api_timings.prom)
+            buckets_ms: Histogram bucket bounds in milliseconds
+        
+        Returns:
+            Path of the written file
+        """
+        bounds = sorted(buckets_ms)
+        lines = [
+            '# HELP api_request_duration_seconds API request time by phase (total, ttfb, connect, tls)',
+            '# TYPE api_request_duration_seconds histogram',
+        ]
+        with self._lock:
+            endpoints = dict(self.endpoints)
+            scenarios = {name: dict(totals) for name, totals in self.scenarios.items()}
+        for key in sorted(endpoints):
+            for phase, histogram in endpoints[key].phases.items():
+                if not histogram.count:
+                    continue
+                labels = f'{_endpoint_labels(key)},phase="{phase}"'
+                for bound, count in zip(bounds, histogram.cumulative_counts(bounds)):
+                    lines.append(f'api_request_duration_seconds_bucket{{{labels},le="{bound / 1000:g}"}} {count}')
+                lines.append(f'api_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f'api_request_duration_seconds_sum{{{labels}}} {histogram.total_us / 1e6:.6f}')
+                lines.append(f'api_request_duration_seconds_count{{{labels}}} {histogram.count}')
+        
+        lines += _counter('api_requests_total', 'API requests by response status',
+                          [(f'{_endpoint_labels(key)},status="{status}"', count)
+                           for key in sorted(endpoints) for status, count in sorted(endpoints[key].statuses.items())])
+        lines += _counter('api_request_bytes_sent_total', 'Request body bytes sent',
+                          [(_endpoint_labels(key), endpoints[key].bytes_sent) for key in sorted(endpoints)])
+        lines += _counter('api_response_bytes_received_total', 'Response body bytes received',
+                          [(_endpoint_labels(key), endpoints[key].bytes_received) for key in sorted(endpoints)])
+        lines += _counter('api_scenario_requests_total', 'API requests made by each scenario',
+                          [(f'scenario="{_escape(name)}"', totals['requests']) for name, totals in sorted(scenarios.items())])
+        lines += _counter('api_scenario_request_seconds_total', 'Time each scenario spent waiting for API requests',
+                          [(f'scenario="{_escape(name)}"', f"{totals['request_ms'] / 1000:.6f}")
+                           for name, totals in sorted(scenarios.items())])
+        
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        os.replace(temporary_path, path)
+        return path
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _endpoint_labels(key: str) -> str:
+    """Method and endpoint labels of an endpoint key"""
+    method, template = key.split(' ', 1)
+    return f'method="{_escape(method)}",endpoint="{_escape(template)}"'
+
+def _counter(name: str, help_text: str, samples: List[tuple]) -> List[str]:
+    """Lines of a counter metric with one sample per label set"""
+    return [f'# HELP {name} {help_text}', f'# TYPE {name} counter',
+            *(f'{name}{{{labels}}} {value}' for labels, value in samples)]
+
+def attach_to_report(formatters: Iterable[Any], summary: Dict[str, Any]) -> None:
+    """
+    Add a scenario's timings to the behave reports being written (call from after_scenario)
+    
+    The JSON report gets an 'api_timings' entry on the scenario element, and
+    formatters supporting embeddings (the HTML report) show the timings as
+    text on the scenario's last step.
+    
+    Args:
+        formatters: Active behave formatters (context._runner.formatters)
+        summary: Scenario summary from APITimingReport.finish_scenario
+    """
+    text: Optional[str] = None
+    for formatter in formatters:
+        if isinstance(formatter, JSONFormatter):
+            if formatter.current_feature_data and formatter.current_feature_data.get('elements'):
+                formatter.current_feature_element['api_timings'] = summary
+        # behave-html-formatter embeds into the last step it rendered, so there must be one
+        elif hasattr(formatter, 'embedding') and getattr(formatter, 'last_step_embed_span', None) is not None:
+            text = text or APITimingReport.format_summary(summary)
+            formatter.embedding('text/plain', text, 'API timings')
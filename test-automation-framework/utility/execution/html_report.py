@@ -0,0 +1,97 @@
+"""
+Self-contained HTML report rendered from behave JSON results
+"""
+import html
+import os
+from typing import List, Dict, Any
+
+_STYLE = """
+body { font-family: Arial, sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 22px; }
+.totals span { margin-right: 16px; font-weight: bold; }
+.feature { border: 1px solid #ccc; border-radius: 4px; margin: 16px 0; padding: 8px 16px; }
+.scenario { margin: 8px 0 8px 16px; }
+.step { margin-left: 32px; font-family: monospace; }
+.passed { color: #2e7d32; } .failed, .error { color: #c62828; } .skipped, .untested { color: #757575; }
+.undefined { color: #ef6c00; }
+pre { background: #f5f5f5; padding: 8px; overflow-x: auto; }
+img.screenshot { max-width: 480px; border: 1px solid #ccc; display: block; margin: 4px 0 4px 32px; }
+"""
+
+def _status(item: Dict[str, Any]) -> str:
+    return item.get('status') or item.get('result', {}).get('status') or 'untested'
+
+def _scenario_duration(element: Dict[str, Any]) -> float:
+    return sum(step.get('result', {}).get('duration', 0) or 0 for step in element.get('steps', []))
+
+def _render_scenario(element: Dict[str, Any], report_dir: str) -> List[str]:
+    status = _status(element)
+    parts = [f'<div class="scenario"><span class="{status}">[{status}]</span> '
+             f'<b>{html.escape(element.get("keyword", "Scenario"))}: {html.escape(element.get("name", ""))}</b> '
+             f'({_scenario_duration(element):.2f}s) <small>{html.escape(element.get("location", ""))}</small>']
+    for step in element.get('steps', []):
+        result = step.get('result', {})
+        step_status = result.get('status', 'skipped')
+        parts.append(f'<div class="step {step_status}">{html.escape(step.get("keyword", ""))} '
+                     f'{html.escape(step.get("name", ""))} ({result.get("duration", 0) or 0:.2f}s)</div>')
+        if result.get('error_message'):
+            error = result['error_message']
+            error = '\n'.join(error) if isinstance(error, list) else error
+            parts.append(f'<pre>{html.escape(error)}</pre>')
+    for screenshot in element.get('screenshots', []):
+        source = html.escape(os.path.relpath(os.path.abspath(screenshot), report_dir))
+        parts.append(f'<a href="{source}"><img class="screenshot" src="{source}" alt="screenshot"></a>')
+    parts.append('</div>')
+    return parts
+
+def render_html_report(features: List[Dict[str, Any]], title: str, report_dir: str) -> str:
+    """
+    Render behave JSON results as an HTML page
+    
+    Args:
+        features: Features as written by behave's JSON formatter (or merge_json_reports)
+        title: Page title
+        report_dir: Directory the page is written to (screenshot links are relative to it)
+    
+    Returns:
+        HTML document
+    """
+    scenarios = [element for feature in features for element in feature.get('elements', [])
+                 if element.get('type') != 'background']
+    counts: Dict[str, int] = {}
+    for element in scenarios:
+        counts[_status(element)] = counts.get(_status(element), 0) + 1
+    
+    parts = [f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(title)}</title>',
+             f'<style>{_STYLE}</style></head><body><h1>{html.escape(title)}</h1>',
+             '<div class="totals">', f'<span>{len(scenarios)} scenarios</span>',
+             *(f'<span class="{status}">{count} {status}</span>' for status, count in sorted(counts.items())),
+             '</div>']
+    for feature in features:
+        status = _status(feature)
+        parts.append(f'<div class="feature"><h2 class="{status}">{html.escape(feature.get("keyword", "Feature"))}: '
+                     f'{html.escape(feature.get("name", ""))}</h2>')
+        for element in feature.get('elements', []):
+            if element.get('type') != 'background':
+                parts.extend(_render_scenario(element, report_dir))
+        parts.append('</div>')
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+def write_html_report(features: List[Dict[str, Any]], path: str, title: str = 'Test Report') -> str:
+    """
+    Write behave JSON results as a self-contained HTML report
+    
+    Args:
+        features: Features as written by behave's JSON formatter (or merge_json_reports)
+        path: Output file
+        title: Page title
+    
+    Returns:
+        Path of the written file
+    """
+    report_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(report_dir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(render_html_report(features, title, report_dir))
+    return path
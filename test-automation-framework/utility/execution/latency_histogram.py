@@ -0,0 +1,135 @@
+"""
+Constant-memory latency histogram with HDR-style log-linear buckets
+"""
+import threading
+from typing import Dict, Any, Iterable, List, Tuple
+
+class LatencyHistogram:
+    """
+    Records latencies into log-linear buckets, like an HDR histogram
+    
+    Values are kept in microseconds. Each power-of-two range is split into
+    sub_buckets equal buckets, so every recorded value is known to within
+    1 / sub_buckets of itself (under 1% with the default 128) whatever its
+    magnitude, and memory stays bounded no matter how many values are
+    recorded. Histograms merge exactly, so per-worker or per-scenario
+    histograms can be combined into totals.
+    """
+    
+    def __init__(self, sub_buckets: int = 128):
+        """
+        Initialize an empty histogram
+        
+        Args:
+            sub_buckets: Buckets per power of two (a power of two itself)
+        """
+        self.sub_buckets = sub_buckets
+        self._sub_bits = sub_buckets.bit_length() - 1
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = None
+        self._lock = threading.Lock()
+    
+    def _bucket(self, value_us: int) -> Tuple[int, int]:
+        shift = max(value_us.bit_length() - self._sub_bits, 0)
+        return shift, value_us >> shift
+    
+    @staticmethod
+    def _bucket_value(bucket: Tuple[int, int]) -> float:
+        """Midpoint of a bucket in microseconds"""
+        shift, mantissa = bucket
+        return ((mantissa << shift) + ((1 << shift) - 1) / 2) if shift else float(mantissa)
+    
+    def record(self, value_ms: float) -> None:
+        """Record one latency in milliseconds"""
+        value_us = max(int(value_ms * 1000), 0)
+        bucket = self._bucket(value_us)
+        with self._lock:
+            self.counts[bucket] = self.counts.get(bucket, 0) + 1
+            self.count += 1
+            self.total_us += value_us
+            self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+            self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+    
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add the values of another histogram (with the same sub_buckets) to this one"""
+        with self._lock:
+            for bucket, count in other.counts.items():
+                self.counts[bucket] = self.counts.get(bucket, 0) + count
+            self.count += other.count
+            self.total_us += other.total_us
+            if other.count:
+                self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+                self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+        return self
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Get the latency below which percent of the values fall
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Latency in milliseconds (0 if nothing was recorded)
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, round(percent / 100 * self.count))
+            seen = 0
+            for bucket in sorted(self.counts):
+                seen += self.counts[bucket]
+                if seen >= rank:
+                    value = min(max(self._bucket_value(bucket), self.min_us), self.max_us)
+                    return value / 1000
+            return self.max_us / 1000
+    
+    def percentiles(self, percents: Iterable[float] = (50, 90, 95, 99)) -> Dict[str, float]:
+        """Get several percentiles keyed like 'p95'"""
+        return {f"p{percent:g}": round(self.percentile(percent), 3) for percent in percents}
+    
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds"""
+        return self.total_us / self.count / 1000 if self.count else 0.0
+    
+    def summary(self) -> Dict[str, Any]:
+        """Count, min/mean/max and the usual percentiles in milliseconds"""
+        return {
+            'count': self.count,
+            'min_ms': round((self.min_us or 0) / 1000, 3),
+            'mean_ms': round(self.mean, 3),
+            'max_ms': round((self.max_us or 0) / 1000, 3),
+            **{f"{name}_ms": value for name, value in self.percentiles().items()},
+        }
+    
+    def buckets(self) -> Iterable[Tuple[float, int]]:
+        """Yield (bucket upper bound in ms, count) in increasing order"""
+        for bucket in sorted(self.counts):
+            shift, mantissa = bucket
+            yield ((mantissa + 1) << shift) / 1000, self.counts[bucket]
+    
+    def cumulative_counts(self, bounds_ms: Iterable[float]) -> List[int]:
+        """
+        Count the values at or below each bound, like Prometheus histogram buckets
+        
+        Args:
+            bounds_ms: Increasing bucket bounds in milliseconds
+        
+        Returns:
+            Cumulative count per bound (within the histogram's precision)
+        """
+        with self._lock:
+            values = sorted((self._bucket_value(bucket) / 1000, count) for bucket, count in self.counts.items())
+        counts = []
+        seen = 0
+        index = 0
+        for bound in bounds_ms:
+            while index < len(values) and values[index][0] <= bound:
+                seen += values[index][1]
+                index += 1
+            counts.append(seen)
+        return counts
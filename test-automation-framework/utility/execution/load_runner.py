@@ -0,0 +1,352 @@
+"""
+Load mode: runs behave API scenarios as virtual users and reports latency per endpoint
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional
+from behave.parser import parse_file
+from behave.runner_util import load_step_modules
+from behave.step_registry import registry
+from behave.tag_expression import TagExpression
+from utility.execution.latency_histogram import LatencyHistogram
+from utility.execution.parallel_runner import find_feature_files
+
+class VirtualUserContext:
+    """
+    Stand-in for behave's Context for one scenario iteration of a virtual user
+    
+    Steps store their state on it as usual (context.user_api, context.api_response, ...).
+    Like after_scenario, resources registered in context.resource_registry are
+    removed when the iteration ends.
+    """
+    
+    def __init__(self):
+        from api.resource_registry import ResourceRegistry
+        self.table = None
+        self.text = None
+        self.resource_registry = ResourceRegistry()
+    
+    @contextmanager
+    def use_with_user_mode(self):
+        yield
+
+class LoadScenario:
+    """A scenario whose steps are resolved to their step implementations once, up front"""
+    
+    def __init__(self, name: str, location: str, steps: List[tuple]):
+        self.name = name
+        self.location = location
+        self.steps = steps
+    
+    def run(self, context: VirtualUserContext) -> None:
+        """Run every step (background first); raises on the first failing step"""
+        for step, match in self.steps:
+            context.table = step.table
+            context.text = step.text
+            match.run(context)
+    
+    def __repr__(self):
+        return f"LoadScenario({self.location})"
+
+def load_scenarios(paths: List[str], tags: List[str] = None, step_paths: List[str] = None) -> List[LoadScenario]:
+    """
+    Parse scenarios and bind their steps to the step definitions
+    
+    Args:
+        paths: Feature files or directories
+        tags: behave --tags expressions (ANDed)
+        step_paths: Directories with step definitions (steps/api if None)
+    
+    Returns:
+        Runnable scenarios in file order, with scenario outlines expanded to their rows
+    
+    Raises:
+        ValueError: If a scenario uses a step without a definition
+    """
+    load_step_modules([os.path.abspath(path) for path in step_paths or ['steps/api']])
+    tag_expression = TagExpression([part for tag in tags or [] for part in tag.split()])
+    scenarios = []
+    for feature_file in find_feature_files(paths):
+        feature = parse_file(feature_file)
+        if feature is None:
+            continue
+        for scenario in feature.walk_scenarios():
+            if not tag_expression.check(scenario.effective_tags):
+                continue
+            steps = []
+            for step in scenario.all_steps:
+                match = registry.find_match(step)
+                if match is None:
+                    raise ValueError(f"Undefined step in {feature_file}:{step.line}: {step.keyword} {step.name}")
+                steps.append((step, match))
+            scenarios.append(LoadScenario(scenario.name, f"{feature_file}:{scenario.line}", steps))
+    return scenarios
+
+class LoadStats:
+    """
+    Thread-safe request and iteration statistics of a load run
+    
+    Requests are grouped by method and endpoint template (GET /api/v1/users/{id}).
+    An endpoint error is a transport failure or a 5xx response; 4xx responses
+    are counted per status, since negative scenarios expect them.
+    """
+    
+    def __init__(self):
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.scenarios: Dict[str, Dict[str, Any]] = {}
+        self.max_start_lag_ms = 0.0
+        self._lock = threading.Lock()
+    
+    def on_request(self, event: Dict[str, Any]) -> None:
+        """Request listener registered with BaseAPI"""
+        key = f"{event['method']} {event['template']}"
+        status = event['status_code']
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = {'histogram': LatencyHistogram(), 'errors': 0, 'statuses': {}}
+            status_key = str(status) if status is not None else 'error'
+            stats['statuses'][status_key] = stats['statuses'].get(status_key, 0) + 1
+            if status is None or status >= 500:
+                stats['errors'] += 1
+        stats['histogram'].record(event['elapsed_ms'])
+    
+    def on_iteration(self, scenario: LoadScenario, elapsed_ms: float, error: Optional[str]) -> None:
+        """Record one scenario iteration"""
+        with self._lock:
+            stats = self.scenarios.get(scenario.location)
+            if stats is None:
+                stats = self.scenarios[scenario.location] = {'name': scenario.name, 'histogram': LatencyHistogram(),
+                                                             'failures': 0, 'last_error': None}
+            if error:
+                stats['failures'] += 1
+                stats['last_error'] = error
+        stats['histogram'].record(elapsed_ms)
+    
+    def on_late_start(self, lag_ms: float) -> None:
+        """Record how far behind schedule an iteration started (rate mode)"""
+        with self._lock:
+            self.max_start_lag_ms = max(self.max_start_lag_ms, lag_ms)
+    
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Summarize the run
+        
+        Args:
+            elapsed: Wall-clock duration of the run in seconds
+        
+        Returns:
+            Dictionary with totals, per-endpoint and per-scenario statistics
+        """
+        endpoints = {}
+        for key, stats in sorted(self.endpoints.items()):
+            count = stats['histogram'].count
+            endpoints[key] = {
+                'requests': count,
+                'throughput_rps': round(count / elapsed, 2) if elapsed else 0,
+                'error_rate': round(stats['errors'] / count, 4) if count else 0,
+                'statuses': stats['statuses'],
+                'latency': stats['histogram'].summary(),
+            }
+        scenarios = {}
+        for location, stats in self.scenarios.items():
+            count = stats['histogram'].count
+            scenarios[location] = {
+                'name': stats['name'],
+                'iterations': count,
+                'failure_rate': round(stats['failures'] / count, 4) if count else 0,
+                'last_error': stats['last_error'],
+                'duration': stats['histogram'].summary(),
+            }
+        total = LatencyHistogram()
+        for stats in self.endpoints.values():
+            total.merge(stats['histogram'])
+        requests = total.count
+        errors = sum(stats['errors'] for stats in self.endpoints.values())
+        iterations = sum(stats['histogram'].count for stats in self.scenarios.values())
+        failures = sum(stats['failures'] for stats in self.scenarios.values())
+        return {
+            'duration_seconds': round(elapsed, 3),
+            'requests': requests,
+            'throughput_rps': round(requests / elapsed, 2) if elapsed else 0,
+            'error_rate': round(errors / requests, 4) if requests else 0,
+            'iterations': iterations,
+            'iterations_per_second': round(iterations / elapsed, 2) if elapsed else 0,
+            'iteration_failure_rate': round(failures / iterations, 4) if iterations else 0,
+            'max_start_lag_ms': round(self.max_start_lag_ms, 3),
+            'latency': total.summary(),
+            'endpoints': endpoints,
+            'scenarios': scenarios,
+        }
+
+class LoadRunner:
+    """
+    Runs scenarios as virtual users for a fixed duration
+    
+    Each virtual user is a thread that runs the scenarios round-robin, each
+    iteration with a fresh context. Without a rate the users run back to back
+    (closed model, load set by users); with rps, iterations start on a fixed
+    schedule shared by all users (open model), and users only bound how many
+    run at once. If every user is busy when an iteration is due it starts
+    late, which is reported as max_start_lag_ms.
+    """
+    
+    def __init__(self, scenarios: List[LoadScenario], users: int = 10, rps: float = None,
+                 duration: float = 30, ramp_up: float = 0):
+        """
+        Initialize runner
+        
+        Args:
+            scenarios: Scenarios to run
+            users: Number of virtual users (concurrent iterations)
+            rps: Scenario iterations started per second (None to run users back to back)
+            duration: Run length in seconds
+            ramp_up: Seconds over which the virtual users are started
+        """
+        if not scenarios:
+            raise ValueError("No scenarios to run")
+        self.scenarios = scenarios
+        self.users = users
+        self.rps = rps
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.stats = LoadStats()
+        self._next_start = 0.0
+        self._schedule_lock = threading.Lock()
+    
+    def _wait_for_slot(self, deadline: float) -> bool:
+        """In rate mode, wait until the next iteration is due; False once the run is over"""
+        with self._schedule_lock:
+            due = self._next_start
+            self._next_start += 1 / self.rps
+        if due >= deadline:
+            return False
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            self.stats.on_late_start(-delay * 1000)
+        return True
+    
+    def _virtual_user(self, index: int, start: float, deadline: float) -> None:
+        delay = start + self.ramp_up * index / self.users - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        iteration = index
+        while time.perf_counter() < deadline:
+            if self.rps and not self._wait_for_slot(deadline):
+                return
+            scenario = self.scenarios[iteration % len(self.scenarios)]
+            iteration += 1
+            context = VirtualUserContext()
+            started = time.perf_counter()
+            error = None
+            try:
+                scenario.run(context)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            context.resource_registry.teardown()
+            self.stats.on_iteration(scenario, elapsed_ms, error)
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the load test
+        
+        Returns:
+            Report dictionary (see LoadStats.report)
+        """
+        from api.base_api import BaseAPI
+        BaseAPI.add_request_listener(self.stats.on_request)
+        start = time.perf_counter()
+        deadline = start + self.duration
+        self._next_start = start
+        threads = [threading.Thread(target=self._virtual_user, args=(index, start, deadline), daemon=True)
+                   for index in range(self.users)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            BaseAPI.remove_request_listener(self.stats.on_request)
+        report = self.stats.report(time.perf_counter() - start)
+        report.update({'users': self.users, 'target_rps': self.rps, 'scenario_count': len(self.scenarios)})
+        return report
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the per-endpoint table and totals"""
+    print(f"\n📈 Load test: {report['scenario_count']} scenarios, {report['users']} users, "
+          f"{report['duration_seconds']}s")
+    print(f"{'Endpoint':<44} {'Requests':>9} {'RPS':>8} {'Err%':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for key, stats in report['endpoints'].items():
+        latency = stats['latency']
+        print(f"{key:<44} {stats['requests']:>9} {stats['throughput_rps']:>8} {stats['error_rate'] * 100:>6.2f} "
+              f"{latency['p50_ms']:>8} {latency['p95_ms']:>8} {latency['p99_ms']:>8}")
+    latency = report['latency']
+    print(f"{'TOTAL':<44} {report['requests']:>9} {report['throughput_rps']:>8} {report['error_rate'] * 100:>6.2f} "
+          f"{latency['p50_ms']:>8} {latency['p95_ms']:>8} {latency['p99_ms']:>8}")
+    print(f"Iterations: {report['iterations']} ({report['iterations_per_second']}/s), "
+          f"failed: {report['iteration_failure_rate'] * 100:.2f}%")
+    for location, stats in report['scenarios'].items():
+        if stats['last_error']:
+            print(f"  ❌ {location} {stats['name']}: {stats['last_error']}")
+    if report['target_rps'] and report['max_start_lag_ms'] > 1000 / report['target_rps']:
+        print(f"⚠️  Iterations started up to {report['max_start_lag_ms']:.0f} ms late; add --users to hold the rate")
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run behave API scenarios as virtual users")
+    parser.add_argument('paths', nargs='*', default=['features/api'], help="Feature files or directories")
+    parser.add_argument('-t', '--tags', action='append', help="behave tag expression (repeatable, ANDed)")
+    parser.add_argument('--steps', action='append', help="Step definition directory [default: steps/api]")
+    parser.add_argument('--users', type=int, default=10, help="Virtual users")
+    parser.add_argument('--rps', type=float, help="Scenario iterations started per second (default: as fast as possible)")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds to run")
+    parser.add_argument('--ramp-up', type=float, default=0, help="Seconds over which users start")
+    parser.add_argument('--base-url', help="API base URL (overrides api_base_url)")
+    parser.add_argument('--stub', action='store_true', help="Run against a local users API stub")
+    parser.add_argument('--stub-latency-ms', type=float, default=0, help="Latency added by the stub")
+    parser.add_argument('--stub-error-rate', type=float, default=0, help="Share of stub requests answered with 503")
+    parser.add_argument('--log-level', default='WARNING', help="Framework log level during the run")
+    parser.add_argument('--output', default='reports/load/load_report.json', help="JSON report file")
+    args = parser.parse_args()
+    
+    # Request logging at INFO would dominate the run; the logger reads LOG_LEVEL when it is created
+    os.environ.setdefault('LOG_LEVEL', args.log_level)
+    from utility.common.config_reader import ConfigReader
+    
+    server = None
+    if args.stub:
+        from users_api_stub import UsersStubServer
+        server = UsersStubServer(latency_ms=args.stub_latency_ms, error_rate=args.stub_error_rate).start()
+        ConfigReader.set_overrides({'api_base_url': server.url})
+        print(f"🧪 Users API stub on {server.url}")
+    elif args.base_url:
+        ConfigReader.set_overrides({'api_base_url': args.base_url})
+    
+    try:
+        scenarios = load_scenarios(args.paths, args.tags, args.steps)
+        if not scenarios:
+            parser.error("No scenarios match the given paths and tags")
+        print(f"🚀 Running {len(scenarios)} scenarios with {args.users} users for {args.duration}s"
+              f"{f' at {args.rps} iterations/s' if args.rps else ''} against {ConfigReader().get_api_base_url()}")
+        report = LoadRunner(scenarios, args.users, args.rps, args.duration, args.ramp_up).run()
+    finally:
+        if server:
+            server.stop()
+    
+    print_report(report)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"📄 Report: {args.output}")
+    sys.exit(1 if report['error_rate'] or report['iteration_failure_rate'] else 0)
+
+if __name__ == '__main__':
+    main()
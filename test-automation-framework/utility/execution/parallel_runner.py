@@ -0,0 +1,348 @@
+"""
+Parallel scenario runner that shards behave scenarios across worker processes
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
+from behave.parser import parse_file
+from behave.tag_expression import TagExpression
+from utility.common.config_reader import ConfigReader, SNAPSHOT_ENV_VAR
+from utility.execution.timing_db import ScenarioTimingDB
+from utility.execution.html_report import write_html_report
+
+# Scheduling priority by tag: lower starts earlier
+TAG_PRIORITY = {'slow': 0, 'fast': 2}
+DEFAULT_PRIORITY = 1
+
+class ScenarioItem:
+    """A single runnable scenario (or scenario outline row) and its location"""
+    
+    def __init__(self, location: str, feature: str, name: str, tags: List[str]):
+        self.location = location
+        self.feature = feature
+        self.name = name
+        self.tags = tags
+    
+    @property
+    def priority(self) -> int:
+        """Start order class from @slow / @fast tags"""
+        return min((TAG_PRIORITY[tag] for tag in self.tags if tag in TAG_PRIORITY), default=DEFAULT_PRIORITY)
+    
+    def __repr__(self):
+        return f"ScenarioItem({self.location})"
+
+def find_feature_files(paths: List[str]) -> List[str]:
+    """Expand feature files and directories into normalized feature file paths"""
+    feature_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            feature_files.extend(sorted(glob.glob(os.path.join(path, '**', '*.feature'), recursive=True)))
+        else:
+            feature_files.append(path)
+    return [os.path.normpath(feature_file) for feature_file in feature_files]
+
+def discover_scenarios(paths: List[str], tags: List[str] = None) -> List[ScenarioItem]:
+    """
+    Find the scenarios behave would run for some paths and tag expressions
+    
+    Args:
+        paths: Feature files or directories
+        tags: behave --tags expressions (ANDed, e.g. ['@ui', '~@slow'])
+    
+    Returns:
+        Scenarios in file order, with scenario outlines expanded to their rows
+    """
+    # run.sh passes several tags in one space-separated --tags value
+    tag_expression = TagExpression([part for tag in tags or [] for part in tag.split()])
+    scenarios = []
+    for feature_file in find_feature_files(paths):
+        feature = parse_file(feature_file)
+        if feature is None:
+            continue
+        for scenario in feature.walk_scenarios():
+            if tag_expression.check(scenario.effective_tags):
+                scenarios.append(ScenarioItem(
+                    f"{feature_file}:{scenario.line}", feature_file, scenario.name, list(scenario.effective_tags)
+                ))
+    return scenarios
+
+def schedule(scenarios: List[ScenarioItem], chunk_size: int,
+             durations: Dict[str, float] = None) -> List[List[ScenarioItem]]:
+    """
+    Split scenarios into chunks in the order they should start
+    
+    @slow scenarios start first, one per chunk, and @fast ones last, so long
+    scenarios do not end up as the tail of the run. Within each group,
+    scenarios with longer recorded durations start first. Other scenarios are
+    grouped by feature into chunks of up to chunk_size, so a worker starts
+    its browser once per chunk rather than once per scenario.
+    """
+    durations = durations or {}
+    chunks = []
+    for scenario in sorted(scenarios, key=lambda item: (item.priority, -durations.get(item.location, 0))):
+        if scenario.priority == TAG_PRIORITY['slow']:
+            chunks.append([scenario])
+        elif chunks and len(chunks[-1]) < chunk_size and chunks[-1][-1].feature == scenario.feature \
+                and chunks[-1][-1].priority == scenario.priority:
+            chunks[-1].append(scenario)
+        else:
+            chunks.append([scenario])
+    return chunks
+
+def merge_json_reports(paths: List[str]) -> List[Dict[str, Any]]:
+    """Merge behave JSON reports of several chunks into one, keeping file order"""
+    features: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            continue
+        with open(path, 'r', encoding='utf-8') as file:
+            for feature in json.load(file):
+                merged = features.setdefault(feature['location'], {**feature, 'elements': []})
+                merged['elements'].extend(feature.get('elements', []))
+                if feature.get('status') == 'failed':
+                    merged['status'] = 'failed'
+    
+    def line(element):
+        return int(element.get('location', ':0').rsplit(':', 1)[1])
+    
+    for feature in features.values():
+        feature['elements'].sort(key=line)
+    return [features[location] for location in sorted(features)]
+
+def merge_junit_reports(chunk_dirs: List[str], output_dir: str) -> List[str]:
+    """Merge the per-feature JUnit files of several chunks into one file per feature"""
+    suites: Dict[str, ET.Element] = {}
+    for chunk_dir in chunk_dirs:
+        for path in sorted(glob.glob(os.path.join(chunk_dir, '*.xml'))):
+            suite = ET.parse(path).getroot()
+            name = os.path.basename(path)
+            if name not in suites:
+                suites[name] = suite
+                continue
+            merged = suites[name]
+            for counter in ('tests', 'errors', 'failures', 'skipped'):
+                merged.set(counter, str(int(merged.get(counter, 0)) + int(suite.get(counter, 0))))
+            merged.set('time', f"{float(merged.get('time', 0)) + float(suite.get('time', 0)):.6f}")
+            merged.extend(suite.findall('testcase'))
+    
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name, suite in suites.items():
+        path = os.path.join(output_dir, name)
+        ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+        paths.append(path)
+    return paths
+
+class ParallelRunner:
+    """
+    Runs behave scenarios in parallel worker processes and merges their reports
+    
+    Each worker is a separate behave process, so it runs environment.py hooks
+    and owns its own Playwright instance and browser. Workers pull chunks of
+    scenarios from a shared queue until it is empty.
+    """
+    
+    def __init__(self, workers: int = None, output_dir: str = None, chunk_size: int = None,
+                 behave_args: List[str] = None, timing_db: ScenarioTimingDB = None):
+        """
+        Initialize runner
+        
+        Args:
+            workers: Worker processes (config parallel.max_workers if None)
+            output_dir: Directory for per-chunk reports (reports/parallel if None)
+            chunk_size: Scenarios per behave process (sized from the suite if None)
+            behave_args: Extra arguments passed to every behave process (e.g. -D browser=firefox)
+            timing_db: Scenario durations used for scheduling and updated after the run (none if None)
+        """
+        self.config = self._load_config()
+        self.workers = workers or (self.config.get_config_value('parallel.max_workers') if self.config else None) \
+            or os.cpu_count() or 1
+        self.output_dir = output_dir or os.path.join(os.getcwd(), 'reports', 'parallel')
+        self.chunk_size = chunk_size
+        self.behave_args = behave_args or []
+        self.timing_db = timing_db
+        self.results: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _load_config() -> Optional[ConfigReader]:
+        try:
+            return ConfigReader()
+        except FileNotFoundError:
+            return None
+    
+    def _worker_env(self, worker_id: int) -> Dict[str, str]:
+        """Environment of a worker: its id and the config already resolved by this process"""
+        env = dict(os.environ, TEST_WORKER_ID=str(worker_id))
+        if self.config:
+            env[SNAPSHOT_ENV_VAR] = self.config.snapshot()
+        return env
+    
+    def _run_chunk(self, worker_id: int, index: int, chunk: List[ScenarioItem]) -> Dict[str, Any]:
+        """Run one chunk of scenarios in a behave process"""
+        chunk_dir = os.path.join(self.output_dir, f"chunk-{index:04d}")
+        os.makedirs(chunk_dir, exist_ok=True)
+        json_path = os.path.join(chunk_dir, 'results.json')
+        command = [
+            sys.executable, '-m', 'behave', *[scenario.location for scenario in chunk],
+            '--format=json', f'--outfile={json_path}', '--format=progress',
+            '--junit', f'--junit-directory={chunk_dir}',
+            # Keep scenarios of other chunks, which behave reports as skipped, out of the reports
+            '--no-skipped', *self.behave_args
+        ]
+        
+        started = time.time()
+        process = subprocess.Popen(command, env=self._worker_env(worker_id), stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True)
+        for line in process.stdout:
+            print(f"[worker {worker_id}] {line}", end='')
+        process.wait()
+        
+        return {
+            'chunk': index,
+            'worker': worker_id,
+            'locations': [scenario.location for scenario in chunk],
+            'returncode': process.returncode,
+            'duration': round(time.time() - started, 3),
+            'json': json_path,
+            'junit_dir': chunk_dir,
+        }
+    
+    def _worker(self, worker_id: int, chunks: deque) -> None:
+        """Pull chunks from the queue until it is empty"""
+        while True:
+            with self._lock:
+                if not chunks:
+                    return
+                index, chunk = chunks.popleft()
+            result = self._run_chunk(worker_id, index, chunk)
+            with self._lock:
+                self.results.append(result)
+    
+    def run_chunks(self, chunks: List[List[ScenarioItem]], json_output: str = None,
+                   junit_dir: str = None, html_output: str = None) -> int:
+        """
+        Run scheduled chunks on the workers and merge their reports
+        
+        Args:
+            chunks: Chunks in start order (see schedule())
+            json_output: Merged behave JSON report path
+            junit_dir: Directory for merged JUnit reports
+            html_output: HTML report rendered from the merged JSON (none if None)
+        
+        Returns:
+            Process exit code: 0 if every chunk passed, 1 otherwise
+        """
+        # Drop chunk reports of earlier runs so they are not merged into this one
+        for chunk_dir in glob.glob(os.path.join(self.output_dir, 'chunk-*')):
+            shutil.rmtree(chunk_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+        queue = deque(enumerate(chunks))
+        threads = [threading.Thread(target=self._worker, args=(worker_id, queue))
+                   for worker_id in range(1, min(self.workers, len(chunks)) + 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.results.sort(key=lambda result: result['chunk'])
+        json_output = json_output or os.path.join(os.getcwd(), 'reports', 'json', 'parallel_results.json')
+        os.makedirs(os.path.dirname(json_output), exist_ok=True)
+        features = merge_json_reports([result['json'] for result in self.results])
+        with open(json_output, 'w', encoding='utf-8') as file:
+            json.dump(features, file, indent=2)
+        junit_dir = junit_dir or os.path.join(os.getcwd(), 'reports', 'junit')
+        merge_junit_reports([result['junit_dir'] for result in self.results], junit_dir)
+        with open(os.path.join(self.output_dir, 'summary.json'), 'w', encoding='utf-8') as file:
+            json.dump(self.results, file, indent=2)
+        
+        failed = [result for result in self.results if result['returncode'] != 0]
+        print(f"\nParallel run finished: {len(self.results)} chunks on {len(threads)} workers, {len(failed)} failed")
+        print(f"JSON report: {json_output}")
+        print(f"JUnit reports: {junit_dir}")
+        if html_output:
+            print(f"HTML report: {write_html_report(features, html_output, 'Parallel Test Report')}")
+        screenshots = [path for feature in features for element in feature.get('elements', [])
+                       for path in element.get('screenshots', [])]
+        if screenshots:
+            print(f"Screenshots ({len(screenshots)}, linked from the reports):")
+            for path in screenshots:
+                print(f"  {path}")
+        return 1 if failed else 0
+    
+    def run(self, paths: List[str], tags: List[str] = None, json_output: str = None,
+            junit_dir: str = None, shard: Tuple[int, int] = None, html_output: str = None) -> int:
+        """
+        Discover, schedule and run scenarios in parallel
+        
+        Args:
+            paths: Feature files or directories
+            tags: behave --tags expressions
+            json_output: Merged behave JSON report path
+            junit_dir: Directory for merged JUnit reports
+            shard: Run only shard (i, N) of a duration-balanced N-way split
+            html_output: HTML report rendered from the merged JSON (none if None)
+        
+        Returns:
+            Process exit code: 0 if every scenario passed, 1 otherwise
+        """
+        from utility.execution.shard_planner import estimate_durations, plan_shards
+        
+        scenarios = discover_scenarios(paths, tags)
+        durations = estimate_durations(scenarios, self.timing_db) if self.timing_db else {}
+        if shard:
+            scenarios = plan_shards(scenarios, shard[1], durations)[shard[0] - 1]
+            print(f"Shard {shard[0]}/{shard[1]}: {len(scenarios)} scenarios, "
+                  f"~{sum(durations.get(item.location, 0) for item in scenarios):.0f}s expected")
+        if not scenarios:
+            print("No scenarios matched")
+            return 0
+        
+        chunk_size = self.chunk_size or max(1, math.ceil(len(scenarios) / (self.workers * 3)))
+        chunks = schedule(scenarios, chunk_size, durations)
+        print(f"Running {len(scenarios)} scenarios in {len(chunks)} chunks on up to {self.workers} workers")
+        json_output = json_output or os.path.join(os.getcwd(), 'reports', 'json', 'parallel_results.json')
+        exit_code = self.run_chunks(chunks, json_output, junit_dir, html_output)
+        
+        if self.timing_db:
+            recorded = self.timing_db.record_report(json_output)
+            print(f"Recorded durations of {recorded} scenarios in {self.timing_db.path}")
+        return exit_code
+
+def main():
+    """Command line entry point; unknown arguments are passed on to behave"""
+    parser = argparse.ArgumentParser(description="Run behave scenarios in parallel worker processes")
+    parser.add_argument('paths', nargs='*', default=['features'], help="Feature files or directories")
+    parser.add_argument('-t', '--tags', action='append', help="behave tag expression (repeatable, ANDed)")
+    parser.add_argument('-w', '--workers', type=int, help="Worker processes [default: parallel.max_workers]")
+    parser.add_argument('--chunk-size', type=int, help="Scenarios per behave process")
+    parser.add_argument('--json-output', help="Merged JSON report [default: reports/json/parallel_results.json]")
+    parser.add_argument('--junit-directory', help="Merged JUnit reports [default: reports/junit]")
+    parser.add_argument('--html-output', help="HTML report rendered from the merged JSON report")
+    parser.add_argument('--shard', help="Run only shard i/N of a duration-balanced split (e.g. 2/4)")
+    parser.add_argument('--timing-db', help="Scenario timing database [default: reports/scenario_timings.db]")
+    parser.add_argument('--no-timings', action='store_true', help="Neither use nor record scenario durations")
+    args, behave_args = parser.parse_known_args()
+    
+    from utility.execution.shard_planner import parse_shard
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    timing_db = None if args.no_timings else ScenarioTimingDB(args.timing_db)
+    
+    runner = ParallelRunner(args.workers, chunk_size=args.chunk_size, behave_args=behave_args, timing_db=timing_db)
+    sys.exit(runner.run(args.paths, args.tags, args.json_output, args.junit_directory, shard, args.html_output))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Duration-aware shard planner that balances scenarios across CI nodes or workers
+"""
+import argparse
+import heapq
+import json
+import sys
+from typing import List, Dict, Tuple
+from utility.execution.parallel_runner import ScenarioItem, discover_scenarios
+from utility.execution.timing_db import ScenarioTimingDB
+
+def estimate_durations(scenarios: List[ScenarioItem], timing_db: ScenarioTimingDB) -> Dict[str, float]:
+    """
+    Get an expected duration for every scenario, keyed by location
+    
+    Scenarios that never ran get the median of the known durations.
+    """
+    estimates = timing_db.estimates()
+    default = timing_db.default_estimate()
+    return {scenario.location: estimates.get((scenario.feature, scenario.name), default)
+            for scenario in scenarios}
+
+def plan_shards(scenarios: List[ScenarioItem], shard_count: int,
+                durations: Dict[str, float]) -> List[List[ScenarioItem]]:
+    """
+    Bin-pack scenarios into balanced shards (longest processing time first)
+    
+    Scenarios are placed longest first, each on the shard with the least total
+    time so far. Ties are broken by location, so every machine computes the
+    same plan from the same timing database.
+    
+    Args:
+        scenarios: Scenarios to distribute
+        shard_count: Number of shards
+        durations: Expected duration per scenario location
+    
+    Returns:
+        One list of scenarios per shard, each in file order
+    """
+    shards: List[List[ScenarioItem]] = [[] for _ in range(shard_count)]
+    loads: List[Tuple[float, int]] = [(0.0, index) for index in range(shard_count)]
+    heapq.heapify(loads)
+    
+    for scenario in sorted(scenarios, key=lambda item: (-durations.get(item.location, 0), item.location)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(scenario)
+        heapq.heappush(loads, (load + durations.get(scenario.location, 0), index))
+    
+    order = {scenario.location: position for position, scenario in enumerate(scenarios)}
+    return [sorted(shard, key=lambda item: order[item.location]) for shard in shards]
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an 'i/N' shard selector (1-based) into (i, N)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard must look like i/N, got: {value}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Shard index must be between 1 and {count}, got: {index}")
+    return index, count
+
+def select_shard(scenarios: List[ScenarioItem], shard: Tuple[int, int],
+                 timing_db: ScenarioTimingDB) -> List[ScenarioItem]:
+    """Get the scenarios of shard i of N"""
+    index, count = shard
+    return plan_shards(scenarios, count, estimate_durations(scenarios, timing_db))[index - 1]
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Record scenario durations and plan balanced shards")
+    parser.add_argument('--timing-db', help="Timing database [default: reports/scenario_timings.db]")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    record = commands.add_parser('record', help="Record scenario durations from behave JSON reports")
+    record.add_argument('reports', nargs='+', help="behave JSON report files")
+    
+    plan = commands.add_parser('plan', help="Split scenarios into balanced shards")
+    plan.add_argument('paths', nargs='*', default=['features'], help="Feature files or directories")
+    plan.add_argument('-t', '--tags', action='append', help="behave tag expression (repeatable, ANDed)")
+    plan.add_argument('--shards', type=int, help="Print every shard of an N-way split")
+    plan.add_argument('--shard', type=parse_shard, help="Print only shard i of N as behave locations")
+    args = parser.parse_args()
+    
+    timing_db = ScenarioTimingDB(args.timing_db)
+    if args.command == 'record':
+        for report in args.reports:
+            print(f"Recorded {timing_db.record_report(report)} scenarios from {report}")
+        return
+    
+    scenarios = discover_scenarios(args.paths, args.tags)
+    if args.shard:
+        print(' '.join(scenario.location for scenario in select_shard(scenarios, args.shard, timing_db)))
+        return
+    
+    if not args.shards:
+        parser.error("plan needs --shards N or --shard i/N")
+    durations = estimate_durations(scenarios, timing_db)
+    shards = plan_shards(scenarios, args.shards, durations)
+    json.dump([{
+        'shard': f"{index}/{args.shards}",
+        'expected_seconds': round(sum(durations[scenario.location] for scenario in shard), 3),
+        'locations': [scenario.location for scenario in shard],
+    } for index, shard in enumerate(shards, start=1)], sys.stdout, indent=2)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Scenario timing database built from behave JSON reports
+"""
+import json
+import os
+import sqlite3
+import statistics
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional
+
+class ScenarioTimingDB:
+    """
+    SQLite store of historical scenario durations
+    
+    Scenarios are keyed by feature file and scenario name (outline rows have
+    distinct names), so timings survive lines moving within a feature file.
+    The estimate is an exponentially weighted moving average, so it follows
+    a scenario getting faster or slower without being thrown off by one
+    unusual run.
+    """
+    
+    def __init__(self, path: str = None, smoothing: float = 0.3):
+        """
+        Open (or create) a timing database
+        
+        Args:
+            path: SQLite database file path (reports/scenario_timings.db if None)
+            smoothing: Weight of the newest run in the moving average (0-1)
+        """
+        self.path = path or os.path.join(os.getcwd(), 'reports', 'scenario_timings.db')
+        self.smoothing = smoothing
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS scenario_timings (
+                feature TEXT NOT NULL,
+                name TEXT NOT NULL,
+                estimate REAL NOT NULL,
+                last_duration REAL NOT NULL,
+                runs INTEGER NOT NULL,
+                last_status TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (feature, name)
+            )
+        """)
+    
+    @staticmethod
+    def scenario_durations(report: List[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+        """Get the duration of every executed scenario in a behave JSON report"""
+        for feature in report:
+            feature_file = os.path.normpath(feature['location'].rsplit(':', 1)[0])
+            for element in feature.get('elements', []):
+                if element.get('type') != 'scenario' or element.get('status') in ('skipped', 'untested'):
+                    continue
+                duration = sum(step.get('result', {}).get('duration', 0) for step in element.get('steps', []))
+                yield {'feature': feature_file, 'name': element['name'], 'duration': duration,
+                       'status': element.get('status')}
+    
+    def record(self, feature: str, name: str, duration: float, status: str = None) -> None:
+        """Fold one run of a scenario into its estimate"""
+        row = self.connection.execute(
+            "SELECT estimate, runs FROM scenario_timings WHERE feature = ? AND name = ?", (feature, name)
+        ).fetchone()
+        estimate = duration if row is None else self.smoothing * duration + (1 - self.smoothing) * row[0]
+        runs = 1 if row is None else row[1] + 1
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO scenario_timings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (feature, name, estimate, duration, runs, status, datetime.now().isoformat(timespec='seconds'))
+            )
+    
+    def record_report(self, path: str) -> int:
+        """
+        Record every executed scenario of a behave JSON report
+        
+        Args:
+            path: behave JSON report (--format=json)
+        
+        Returns:
+            Number of scenarios recorded
+        """
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return 0
+        with open(path, 'r', encoding='utf-8') as file:
+            report = json.load(file)
+        
+        count = 0
+        for scenario in self.scenario_durations(report):
+            self.record(scenario['feature'], scenario['name'], scenario['duration'], scenario['status'])
+            count += 1
+        return count
+    
+    def estimates(self) -> Dict[tuple, float]:
+        """Get the duration estimate of every known scenario keyed by (feature, name)"""
+        rows = self.connection.execute("SELECT feature, name, estimate FROM scenario_timings")
+        return {(feature, name): estimate for feature, name, estimate in rows}
+    
+    def default_estimate(self, fallback: float = 1.0) -> float:
+        """Estimate for scenarios without history: the median known duration"""
+        known = list(self.estimates().values())
+        return statistics.median(known) if known else fallback
+    
+    def estimate(self, feature: str, name: str) -> Optional[float]:
+        """Get the duration estimate of one scenario (None if it never ran)"""
+        row = self.connection.execute(
+            "SELECT estimate FROM scenario_timings WHERE feature = ? AND name = ?", (feature, name)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()